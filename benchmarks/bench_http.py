@@ -0,0 +1,160 @@
+"""HTTP 부하 테스트
+
+가중치를 둔 요청 시나리오를 동시 연결 수(--concurrency)만큼의 작업자가 정해진
+시간 동안 반복 실행하여 시나리오별 p50/p99 지연 시간과 전체 처리량을 측정한다.
+
+- 기본: 앱을 프로세스 내에서 ASGI로 직접 호출 (네트워크/서버 오버헤드 제외)
+- --url: 이미 실행 중인 서버(예: SERVER_MODE=production uvicorn)에 HTTP로 요청
+
+사용법:
+    uv run python benchmarks/bench_http.py --movies 100k --concurrency 32 --duration 20
+    uv run python benchmarks/bench_http.py --url http://127.0.0.1:8000 --movies 100k
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import quote
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import (  # noqa: E402
+    DEFAULT_SEED,
+    DEFAULT_SKEW,
+    ensure_catalog,
+    environment_info,
+    parse_sizes,
+    summarize,
+    use_catalog,
+    write_report,
+)
+
+
+def build_scenarios(catalog: Dict[str, Any]) -> List[tuple]:
+    """(이름, 가중치, 메서드, 경로) 목록 - 조회 위주의 일반적인 트래픽 비율"""
+    theater_id = catalog["hot_theater_id"]
+    movie_id = catalog["movie_id"]
+    return [
+        ("GET /movies?limit=100", 30, "GET", "/movies?limit=100"),
+        ("GET /movies/{id}", 25, "GET", f"/movies/{movie_id}"),
+        ("GET /movies/search", 15, "GET", f"/movies/search?q={quote(catalog['search_term'])}&limit=50"),
+        ("GET /theaters?limit=100", 10, "GET", "/theaters?limit=100"),
+        ("GET /theaters/{id}/movies", 10, "GET", f"/theaters/{theater_id}/movies"),
+        ("GET /movies?expand=theater", 5, "GET", "/movies?limit=100&expand=theater"),
+        ("GET /stats/genres", 5, "GET", "/stats/genres"),
+    ]
+
+
+@asynccontextmanager
+async def open_client(url: Optional[str], concurrency: int) -> AsyncIterator[Any]:
+    """대상 서버 또는 프로세스 내 앱에 연결된 httpx 클라이언트"""
+    import httpx
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    if url:
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30.0) as client:
+            yield client
+        return
+
+    from movie_catalog_backend.app import create_app
+
+    app = create_app()
+    # 시작/종료 이벤트(DB 초기화, 엔진 정리)를 실제 서버와 동일하게 실행
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=30.0) as client:
+            yield client
+
+
+async def run(
+    catalog: Dict[str, Any],
+    url: Optional[str],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    seed: int
+) -> Dict[str, Any]:
+    """작업자 concurrency개로 duration초 동안 부하를 건 뒤 결과 요약"""
+    scenarios = build_scenarios(catalog)
+    weights = [weight for _, weight, _, _ in scenarios]
+    latencies: Dict[str, List[float]] = {name: [] for name, _, _, _ in scenarios}
+    errors: Dict[str, int] = {name: 0 for name, _, _, _ in scenarios}
+
+    async with open_client(url, concurrency) as client:
+        async def worker(index: int, until: float, record: bool) -> None:
+            # 작업자별 시드를 고정하여 실행마다 같은 요청 순서를 재현
+            rng = random.Random(seed + index)
+            while time.perf_counter() < until:
+                name, _, method, path = rng.choices(scenarios, weights)[0]
+                started = time.perf_counter()
+                response = await client.request(method, path)
+                elapsed = time.perf_counter() - started
+                if not record:
+                    continue
+                if response.status_code >= 400:
+                    errors[name] += 1
+                else:
+                    latencies[name].append(elapsed)
+
+        if warmup > 0:
+            until = time.perf_counter() + warmup
+            await asyncio.gather(*(worker(i, until, False) for i in range(concurrency)))
+
+        started = time.perf_counter()
+        until = started + duration
+        await asyncio.gather(*(worker(i, until, True) for i in range(concurrency)))
+        wall = time.perf_counter() - started
+
+    results = [
+        summarize(name, values, wall, errors=errors[name])
+        for name, values in latencies.items()
+        if values
+    ]
+    all_latencies = [value for values in latencies.values() for value in values]
+    if all_latencies:
+        results.append(summarize("total", all_latencies, wall, errors=sum(errors.values())))
+    return {"results": results, "wall_seconds": round(wall, 3)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="HTTP 부하 테스트")
+    parser.add_argument("--movies", default="1k", help="카탈로그 영화 수 (예: 1k, 100k, 1m, 기본값: 1k)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="카탈로그/요청 순서 시드")
+    parser.add_argument("--skew", type=float, default=DEFAULT_SKEW, help="극장별 영화 수 Zipf 지수")
+    parser.add_argument("--url", help="대상 서버 주소 (미지정 시 프로세스 내 ASGI 호출)")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 작업자 수 (기본값: 16)")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 초 (기본값: 10)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="워밍업 시간 초 (기본값: 2)")
+    parser.add_argument("--cache", action="store_true", help="서비스 조회 캐시 활성화 (프로세스 내 실행 시)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (미지정 시 표준 출력)")
+    args = parser.parse_args()
+
+    movies = parse_sizes(args.movies)[0]
+    use_catalog(movies, args.seed, args.skew, cache=args.cache)
+    # --url 대상 서버는 같은 카탈로그 DB(DATABASE_URL)로 실행되어 있어야 한다
+    catalog = ensure_catalog(movies, args.seed, args.skew)
+
+    outcome = asyncio.run(run(catalog, args.url, args.concurrency, args.duration, args.warmup, args.seed))
+    write_report({
+        "suite": "http",
+        "environment": environment_info(),
+        "catalog": catalog,
+        "options": {
+            "target": args.url or "in-process",
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "cache": args.cache,
+        },
+        "wall_seconds": outcome["wall_seconds"],
+        "results": outcome["results"],
+    }, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
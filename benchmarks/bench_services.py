@@ -0,0 +1,127 @@
+"""서비스 계층 마이크로벤치마크
+
+합성 카탈로그(영화 N편) 위에서 서비스 함수를 직접 호출하여 p50/p99 지연 시간과
+처리량을 측정한다. 기본적으로 조회 캐시를 끄고 DB 경로를 측정한다 (--cache로 활성화).
+
+사용법:
+    uv run python benchmarks/bench_services.py --movies 100k --iterations 200 --output result.json
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import (  # noqa: E402
+    DEFAULT_SEED,
+    DEFAULT_SKEW,
+    ensure_catalog,
+    environment_info,
+    parse_sizes,
+    summarize,
+    use_catalog,
+    write_report,
+)
+
+
+async def measure(name: str, fn: Callable[[], Awaitable[Any]], iterations: int, warmup: int) -> Dict[str, Any]:
+    """비동기 함수를 워밍업 후 iterations회 순차 실행하여 요약"""
+    for _ in range(warmup):
+        await fn()
+
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        await fn()
+        latencies.append(time.perf_counter() - call_started)
+    return summarize(name, latencies, time.perf_counter() - started)
+
+
+async def run(catalog: Dict[str, Any], iterations: int, warmup: int) -> List[Dict[str, Any]]:
+    """시나리오별 측정 실행"""
+    from movie_catalog_backend.db.session import dispose_async_engines
+    from movie_catalog_backend.scheme.movie import MovieCreate
+    from movie_catalog_backend.service import movie_service, stats_service, theater_service
+    from movie_catalog_backend.service.theater_movies_view import theater_movies_view
+
+    movies = catalog["movies"]
+    theater_id = catalog["hot_theater_id"]
+    cold_theater_id = catalog["cold_theater_id"]
+    movie_id = catalog["movie_id"]
+    deep_cursor = catalog["deep_cursor"]
+
+    async def create_and_delete() -> None:
+        created = await movie_service.create_movie(MovieCreate(
+            title="벤치마크", distributor="벤치마크", ticket_price=10000,
+            runtime_minutes=120, genre="드라마", theater_id=theater_id
+        ))
+        await movie_service.delete_movie(created.id)
+
+    scenarios: List[tuple] = [
+        ("movies.list limit=100", lambda: movie_service.get_all_movies(limit=100)),
+        ("movies.list limit=100 deep cursor", lambda: movie_service.get_all_movies(limit=100, after=deep_cursor)),
+        ("movies.list limit=100 expand=theater", lambda: movie_service.get_all_movies(limit=100, expand_theater=True)),
+        ("movies.list theater_id (hot)", lambda: movie_service.get_all_movies(theater_id=theater_id, limit=100)),
+        ("movies.list theater_id (cold)", lambda: movie_service.get_all_movies(theater_id=cold_theater_id, limit=100)),
+        ("movies.get", lambda: movie_service.get_movie(movie_id)),
+        ("movies.search q (fts)", lambda: movie_service.search_movies(q=catalog["search_term"], limit=50)),
+        ("movies.search filters", lambda: movie_service.search_movies(
+            genre="드라마", price_range=(12000, 15000), sort="-ticket_price", limit=50
+        )),
+        ("theaters.list limit=100", lambda: theater_service.get_all_theaters(limit=100)),
+        ("theaters.movies (hot)", lambda: theater_service.get_theater_movies_json(theater_id)),
+        ("theaters.movies (cold)", lambda: theater_service.get_theater_movies_json(cold_theater_id)),
+        ("theaters.movies db (hot)", lambda: theater_service.get_theater_movies(theater_id)),
+        ("theaters.movies db (cold)", lambda: theater_service.get_theater_movies(cold_theater_id)),
+        ("stats.theaters", stats_service.get_theater_stats),
+        ("stats.genres", stats_service.get_genre_stats),
+        ("stats.runtime", lambda: stats_service.get_runtime_histogram(30)),
+        ("movies.create+delete", create_and_delete),
+    ]
+
+    # 앱 시작 시와 같이 극장별 영화 목록 뷰 구축 (THEATER_MOVIES_VIEW_ENABLED=false면 생략)
+    await theater_movies_view.build()
+
+    results = []
+    for name, fn in scenarios:
+        # 전체 테이블 집계는 큰 카탈로그에서 오래 걸리므로 반복 수를 줄인다
+        count = max(5, iterations // 10) if name.startswith("stats.") and movies >= 100_000 else iterations
+        results.append(await measure(name, fn, count, warmup))
+        print(f"  {name} 완료", file=sys.stderr)
+
+    await dispose_async_engines()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="서비스 계층 마이크로벤치마크")
+    parser.add_argument("--movies", default="1k", help="카탈로그 영화 수 (예: 1k, 100k, 1m, 기본값: 1k)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="카탈로그 생성 시드")
+    parser.add_argument("--skew", type=float, default=DEFAULT_SKEW, help="극장별 영화 수 Zipf 지수")
+    parser.add_argument("--iterations", type=int, default=200, help="시나리오별 반복 횟수 (기본값: 200)")
+    parser.add_argument("--warmup", type=int, default=10, help="시나리오별 워밍업 횟수 (기본값: 10)")
+    parser.add_argument("--cache", action="store_true", help="서비스 조회 캐시 활성화")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (미지정 시 표준 출력)")
+    args = parser.parse_args()
+
+    movies = parse_sizes(args.movies)[0]
+    use_catalog(movies, args.seed, args.skew, cache=args.cache)
+    catalog = ensure_catalog(movies, args.seed, args.skew)
+
+    results = asyncio.run(run(catalog, args.iterations, args.warmup))
+    write_report({
+        "suite": "services",
+        "environment": environment_info(),
+        "catalog": catalog,
+        "options": {"iterations": args.iterations, "warmup": args.warmup, "cache": args.cache},
+        "results": results,
+    }, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
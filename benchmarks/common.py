@@ -0,0 +1,181 @@
+"""벤치마크 공통 유틸리티 (합성 카탈로그 생성, 지연 시간 통계, 결과 기록)
+
+`movie_catalog_backend`는 임포트 시점에 DATABASE_URL로 엔진을 만들기 때문에,
+벤치마크 스크립트는 패키지를 임포트하기 전에 `use_catalog()`로 DB를 지정해야 한다.
+"""
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BENCHMARK_DIR.parent
+DATA_DIR = BENCHMARK_DIR / ".data"
+
+# 카탈로그 크기별 극장 수 비율 (영화 100편당 극장 1곳, 최소 10곳)
+MOVIES_PER_THEATER = 100
+
+# 같은 크기의 카탈로그는 커밋과 무관하게 같은 내용이 되도록 고정 시드 사용
+DEFAULT_SEED = 20240101
+
+# 극장별 영화 수 Zipf 지수 (생성기 기본값과 동일)
+DEFAULT_SKEW = 1.0
+
+# 검색 시나리오 질의 (생성기 제목 어휘 중 FTS 최소 길이 이상인 단어)
+SEARCH_TERM = "그림자"
+
+
+def catalog_path(movies: int, seed: int = DEFAULT_SEED, skew: float = DEFAULT_SKEW) -> Path:
+    """크기/시드/skew별 카탈로그 DB 파일 경로"""
+    return DATA_DIR / f"catalog-{movies}-{seed}-s{skew:g}.db"
+
+
+def use_catalog(movies: int, seed: int = DEFAULT_SEED, skew: float = DEFAULT_SKEW, cache: bool = False) -> Path:
+    """카탈로그 DB를 사용하도록 환경 설정 (패키지 임포트 전에 호출)
+
+    조회 캐시는 기본적으로 끄고 DB 경로를 측정한다. 느린 쿼리 로그/메트릭 수집이
+    측정값에 섞이지 않도록 함께 끈다.
+    """
+    path = catalog_path(movies, seed, skew)
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    os.environ["CACHE_ENABLED"] = "true" if cache else "false"
+    os.environ.setdefault("SLOW_QUERY_THRESHOLD_MS", "0")
+    os.environ.setdefault("METRICS_ENABLED", "false")
+    return path
+
+
+def ensure_catalog(movies: int, seed: int = DEFAULT_SEED, skew: float = DEFAULT_SKEW) -> Dict[str, Any]:
+    """카탈로그 DB가 없으면 생성기로 생성 (use_catalog 호출 후 사용), 카탈로그 정보 반환
+
+    시나리오에서 사용할 ID도 함께 반환한다.
+    - hot_theater_id / cold_theater_id: 영화가 가장 많은/적은 순위의 극장
+    - movie_id: id 순서상 가운데 영화
+    - deep_cursor: 마지막 페이지 근처의 keyset 커서
+    """
+    from sqlalchemy import text
+
+    from movie_catalog_backend.db.generator import GeneratorOptions, insert_into_database, theater_ids
+    from movie_catalog_backend.db.session import engine, init_db
+
+    path = catalog_path(movies, seed, skew)
+    options = GeneratorOptions(theaters=max(10, movies // MOVIES_PER_THEATER), movies=movies, seed=seed, skew=skew)
+
+    if not path.exists():
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        try:
+            init_db()
+            insert_into_database(options)
+        except BaseException:
+            # 중간에 실패한 카탈로그가 재사용되지 않도록 삭제
+            engine.dispose()
+            path.unlink(missing_ok=True)
+            raise
+        print(f"카탈로그 생성: 영화 {movies}편, 극장 {options.theaters}곳 ({time.perf_counter() - started:.1f}s) -> {path}", file=sys.stderr)
+    else:
+        # 이전에 생성한 카탈로그에도 이후 추가된 스키마 마이그레이션 적용
+        init_db()
+
+    ids = theater_ids(options)
+    with engine.connect() as conn:
+        def movie_id_at(offset: int) -> str:
+            return conn.execute(
+                text("SELECT id FROM movie ORDER BY id LIMIT 1 OFFSET :offset"), {"offset": max(0, offset)}
+            ).scalar_one()
+
+        movie_id = movie_id_at(movies // 2)
+        deep_cursor = movie_id_at(movies - 200)
+    engine.dispose()
+
+    return {
+        "movies": movies,
+        "theaters": options.theaters,
+        "seed": seed,
+        "skew": skew,
+        "path": str(path),
+        "hot_theater_id": ids[0],
+        "cold_theater_id": ids[-1],
+        "movie_id": movie_id,
+        "deep_cursor": deep_cursor,
+        "search_term": SEARCH_TERM,
+    }
+
+
+def summarize(name: str, latencies: List[float], wall_seconds: Optional[float] = None, **extra: Any) -> Dict[str, Any]:
+    """지연 시간 목록(초)을 p50/p99/평균(ms)과 처리량(ops/s)으로 요약"""
+    ordered = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+        return ordered[index] * 1000
+
+    wall = wall_seconds if wall_seconds is not None else sum(latencies)
+    return {
+        "name": name,
+        "iterations": len(latencies),
+        "p50_ms": round(percentile(50), 3),
+        "p99_ms": round(percentile(99), 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "throughput_ops": round(len(latencies) / wall, 1) if wall > 0 else None,
+        **extra,
+    }
+
+
+def environment_info() -> Dict[str, Any]:
+    """커밋 간 비교를 위한 실행 환경 정보 (git 커밋, 변경 여부, 파이썬/플랫폼)"""
+    def git(*args: str) -> str:
+        try:
+            return subprocess.run(
+                ["git", *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+
+    return {
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def write_report(report: Dict[str, Any], output: Optional[str]) -> None:
+    """결과를 JSON 파일 또는 표준 출력으로 기록하고 표 형태 요약을 표준 에러로 출력"""
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if output:
+        Path(output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    for result in report["results"]:
+        print(
+            f"{result['name']:<40} p50 {result['p50_ms']:>9.3f}ms  p99 {result['p99_ms']:>9.3f}ms  "
+            f"{result['throughput_ops'] or 0:>9.1f} ops/s",
+            file=sys.stderr
+        )
+
+
+def parse_sizes(value: str) -> List[int]:
+    """'1k,100k,1m' 형식의 크기 목록 파싱"""
+    units = {"k": 1_000, "m": 1_000_000}
+    sizes = []
+    for part in value.split(","):
+        part = part.strip().lower()
+        if part:
+            sizes.append(int(part[:-1]) * units[part[-1]] if part[-1] in units else int(part))
+    return sizes
+
+
+def time_call(fn: Callable[[], Any]) -> float:
+    """동기 함수 1회 실행 시간(초)"""
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
@@ -0,0 +1,49 @@
+"""두 벤치마크 결과(run.py 출력)를 비교하여 시나리오별 p50/p99 변화율 출력
+
+사용법:
+    uv run python benchmarks/compare.py results/base.json results/HEAD.json
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+
+def _index(report: Dict[str, Any]) -> Dict[Tuple[str, int, str], Dict[str, Any]]:
+    """(스위트, 영화 수, 시나리오) → 결과"""
+    return {
+        (run["suite"], run["catalog"]["movies"], result["name"]): result
+        for run in report["runs"]
+        for result in run["results"]
+    }
+
+
+def _change(before: float, after: float) -> str:
+    return f"{(after - before) / before * 100:+.1f}%" if before else "n/a"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("base", help="기준 결과 JSON")
+    parser.add_argument("head", help="비교 대상 결과 JSON")
+    args = parser.parse_args()
+
+    base_report = json.loads(Path(args.base).read_text(encoding="utf-8"))
+    head_report = json.loads(Path(args.head).read_text(encoding="utf-8"))
+    print(f"base: {base_report['environment']['commit'][:12]}  head: {head_report['environment']['commit'][:12]}")
+
+    base, head = _index(base_report), _index(head_report)
+    for key in sorted(base.keys() & head.keys()):
+        suite, movies, name = key
+        b, h = base[key], head[key]
+        print(
+            f"{suite:<9}{movies:>9}  {name:<40} "
+            f"p50 {b['p50_ms']:>9.3f} → {h['p50_ms']:>9.3f}ms ({_change(b['p50_ms'], h['p50_ms']):>7})  "
+            f"p99 {b['p99_ms']:>9.3f} → {h['p99_ms']:>9.3f}ms ({_change(b['p99_ms'], h['p99_ms']):>7})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
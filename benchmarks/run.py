@@ -0,0 +1,67 @@
+"""여러 카탈로그 크기에 대해 벤치마크 스위트를 실행하고 결과를 한 파일로 합침
+
+패키지의 엔진이 임포트 시점에 DB 경로로 고정되므로 크기마다 별도 프로세스로 실행한다.
+
+사용법:
+    uv run python benchmarks/run.py --sizes 1k,100k,1m --suite services,http --output results/HEAD.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import BENCHMARK_DIR, environment_info, parse_sizes  # noqa: E402
+
+SUITES = {
+    "services": BENCHMARK_DIR / "bench_services.py",
+    "http": BENCHMARK_DIR / "bench_http.py",
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="벤치마크 일괄 실행")
+    parser.add_argument("--sizes", default="1k,100k", help="카탈로그 크기 목록 (기본값: 1k,100k)")
+    parser.add_argument("--suite", default="services,http", help="실행할 스위트 (services, http)")
+    parser.add_argument("--skew", type=float, default=1.0, help="극장별 영화 수 Zipf 지수")
+    parser.add_argument("--iterations", type=int, default=200, help="services: 시나리오별 반복 횟수")
+    parser.add_argument("--concurrency", type=int, default=16, help="http: 동시 작업자 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="http: 측정 시간 초")
+    parser.add_argument("--cache", action="store_true", help="서비스 조회 캐시 활성화")
+    parser.add_argument("--output", required=True, help="합친 결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    # 스위트별 옵션
+    options = {
+        "services": ["--iterations", str(args.iterations)],
+        "http": ["--concurrency", str(args.concurrency), "--duration", str(args.duration)],
+    }
+    if args.cache:
+        for values in options.values():
+            values.append("--cache")
+
+    runs = []
+    for size in parse_sizes(args.sizes):
+        for suite in (name.strip() for name in args.suite.split(",")):
+            script = SUITES[suite]
+            with tempfile.NamedTemporaryFile(suffix=".json") as output:
+                print(f"[{suite} movies={size}]", file=sys.stderr)
+                subprocess.run(
+                    [sys.executable, str(script), "--movies", str(size), "--skew", str(args.skew), "--output", output.name, *options[suite]],
+                    check=True
+                )
+                runs.append(json.loads(Path(output.name).read_text(encoding="utf-8")))
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.output).write_text(
+        json.dumps({"environment": environment_info(), "runs": runs}, ensure_ascii=False, indent=2) + "\n",
+        encoding="utf-8"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
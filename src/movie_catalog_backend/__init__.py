@@ -1,28 +1,197 @@
 """Movie Catalog Backend 메인 진입점"""
+import argparse
 import os
+import sys
 
 
-def main():
-    """애플리케이션 메인 진입점"""
+def _invalidate_caches():
+    """서버 밖에서 DB를 바꾼 뒤 데이터 버전 증가 및 캐시 무효화 (공유 캐시 저장소를 쓰는 서버에 반영)"""
+    import asyncio
+
+    from movie_catalog_backend.service.versioning import invalidate_all
+
+    asyncio.run(invalidate_all())
+
+
+def _bootstrap_db():
+    """워커 시작 전 DB 초기화/시드를 1회 수행 (워커마다 동시에 마이그레이션/시드하지 않도록)"""
+    import logging
+
+    from movie_catalog_backend.config import DB_BOOTSTRAPPED_ENV
+    from movie_catalog_backend.db.seed import seed_database_if_empty
+    from movie_catalog_backend.db.session import engine, init_db
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    init_db()
+    seed_database_if_empty()
+    engine.dispose()
+    # 이전 실행의 캐시/버전이 남은 공유 저장소에서 ETag가 다른 내용에 재사용되지 않도록
+    _invalidate_caches()
+
+    # 워커 프로세스는 환경변수를 상속하므로 시작 이벤트에서 초기화를 건너뛴다
+    os.environ[DB_BOOTSTRAPPED_ENV] = "1"
+
+
+def _prepare_multiprocess_metrics():
+    """멀티 워커 메트릭 합산용 디렉터리 준비 (PROMETHEUS_MULTIPROC_DIR, 미설정 시 임시 디렉터리)
+
+    워커들이 메트릭을 파일로 기록하고 /metrics가 이를 합산한다. 이전 실행의 값이
+    섞이지 않도록 시작 시 메트릭 파일(*.db)만 지운다 (사용자가 지정한 디렉터리의 다른 파일은 유지).
+    워커가 prometheus_client를 임포트하기 전에 설정해야 한다.
+    """
+    import tempfile
+    from pathlib import Path
+
+    directory = os.getenv("PROMETHEUS_MULTIPROC_DIR") or tempfile.mkdtemp(prefix="movie-catalog-metrics-")
+    os.makedirs(directory, exist_ok=True)
+    for path in Path(directory).glob("*.db"):
+        path.unlink(missing_ok=True)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = directory
+
+
+def _serve():
+    """API 서버 실행 (SERVER_MODE=development: 단일 프로세스/리로드, production: 멀티 워커)"""
     import uvicorn
-    
-    # 환경변수 읽기
-    host = os.getenv("HOST", "0.0.0.0")
-    reload = os.getenv("RELOAD", "true").lower() == "true"
-    
-    # 포트는 8000 고정
-    port = 8000
-    
-    # uvicorn을 factory 모드로 실행
+
+    from movie_catalog_backend.config import get_server_settings, is_process_local_cache_safe, is_production_mode
+
+    settings = get_server_settings()
+    if settings["workers"] > 1:
+        _prepare_multiprocess_metrics()
+    if is_production_mode():
+        _bootstrap_db()
+    if not is_process_local_cache_safe():
+        import logging
+
+        logging.getLogger(__name__).warning(
+            "CACHE_BACKEND=memory로 워커 여러 개를 실행하므로 조회 캐시, ETag, 극장별 영화 목록 뷰를 "
+            "사용하지 않습니다 (CACHE_BACKEND=file 또는 redis 권장)"
+        )
+
+    # uvicorn을 factory 모드로 실행 (멀티 워커/리로드를 위해 import 문자열 사용)
     uvicorn.run(
         "movie_catalog_backend.app:create_app",
         factory=True,
-        host=host,
-        port=port,
-        reload=reload
+        **settings
     )
 
 
+def _import(args: argparse.Namespace) -> int:
+    """파일에서 극장/영화 가져오기 (NDJSON 또는 JSON 배열)"""
+    import logging
+
+    from movie_catalog_backend.db.importer import ImportFormatError, import_file
+    from movie_catalog_backend.db.session import init_db
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    init_db()
+
+    try:
+        report = import_file(args.kind, args.path, chunk_size=args.chunk_size)
+    except (ImportFormatError, OSError) as e:
+        print(f"가져오기 중단: {e}", file=sys.stderr)
+        return 1
+    finally:
+        # 중단되어도 이미 커밋된 청크가 있을 수 있음
+        _invalidate_caches()
+
+    # 거부 레코드는 NDJSON으로 표준 출력에 기록
+    for reject in report.rejects:
+        print(reject.model_dump_json())
+    return 0
+
+
+def _generate(args: argparse.Namespace) -> int:
+    """합성 카탈로그 생성 (파일/표준 출력 스트리밍 또는 DB 직접 삽입)"""
+    import logging
+    from pathlib import Path
+
+    from movie_catalog_backend.db.generator import (
+        GeneratorOptions,
+        generate_movies,
+        generate_theaters,
+        write_records,
+    )
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    try:
+        options = GeneratorOptions(theaters=args.theaters, movies=args.movies, seed=args.seed, skew=args.skew)
+    except ValueError as e:
+        print(f"생성 중단: {e}", file=sys.stderr)
+        return 1
+    kinds = [args.only] if args.only else ["theaters", "movies"]
+    generators = {"theaters": generate_theaters, "movies": generate_movies}
+
+    if args.database:
+        from sqlalchemy.exc import IntegrityError
+
+        from movie_catalog_backend.db.generator import insert_into_database
+        from movie_catalog_backend.db.session import init_db
+
+        init_db()
+        try:
+            insert_into_database(options, chunk_size=args.chunk_size)
+        except ValueError as e:
+            print(f"생성 중단: {e}", file=sys.stderr)
+            return 1
+        except IntegrityError:
+            print("생성 중단: DB에 같은 ID가 이미 있습니다 (같은 --seed로 생성한 데이터가 있는지 확인하세요)", file=sys.stderr)
+            return 1
+        _invalidate_caches()
+        return 0
+
+    if args.output == "-":
+        if len(kinds) != 1:
+            print("표준 출력으로 생성할 때는 --only로 종류를 지정해야 합니다", file=sys.stderr)
+            return 1
+        write_records(generators[kinds[0]](options), sys.stdout, args.format)
+        return 0
+
+    output_dir = Path(args.output)
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for kind in kinds:
+            path = output_dir / f"{kind}.{args.format}"
+            with path.open("w", encoding="utf-8") as out:
+                count = write_records(generators[kind](options), out, args.format)
+            logging.getLogger(__name__).info(f"{kind} {count}개 기록: {path}")
+    except OSError as e:
+        print(f"생성 중단: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main():
+    """애플리케이션 메인 진입점"""
+    parser = argparse.ArgumentParser(prog="movie-catalog-backend")
+    subparsers = parser.add_subparsers(dest="command")
+
+    subparsers.add_parser("serve", help="API 서버 실행 (기본값)")
+
+    import_parser = subparsers.add_parser("import", help="NDJSON/JSON 배열 파일에서 데이터 가져오기")
+    import_parser.add_argument("kind", choices=["theaters", "movies"], help="가져올 데이터 종류")
+    import_parser.add_argument("path", help="입력 파일 경로 ('-'이면 표준 입력)")
+    import_parser.add_argument("--chunk-size", type=int, default=1000, help="트랜잭션 당 레코드 수 (기본값: 1000)")
+
+    generate_parser = subparsers.add_parser("generate", help="규모 테스트용 합성 카탈로그 생성")
+    generate_parser.add_argument("--theaters", type=int, default=1000, help="극장 수 (기본값: 1000)")
+    generate_parser.add_argument("--movies", type=int, default=100000, help="영화 수 (기본값: 100000)")
+    generate_parser.add_argument("--seed", type=int, default=0, help="난수 시드, 같으면 같은 데이터 생성 (기본값: 0)")
+    generate_parser.add_argument("--skew", type=float, default=1.0, help="극장별 영화 수 Zipf 지수, 0이면 균등 (기본값: 1.0)")
+    generate_parser.add_argument("--only", choices=["theaters", "movies"], help="한 종류만 생성")
+    generate_parser.add_argument("--format", choices=["ndjson", "json"], default="ndjson", help="출력 형식 (기본값: ndjson)")
+    generate_parser.add_argument("--output", default=".", help="출력 디렉터리, '-'이면 표준 출력 (기본값: 현재 디렉터리)")
+    generate_parser.add_argument("--database", action="store_true", help="파일 대신 DATABASE_URL의 DB에 직접 삽입")
+    generate_parser.add_argument("--chunk-size", type=int, default=10000, help="DB 삽입 시 트랜잭션 당 레코드 수 (기본값: 10000)")
+
+    args = parser.parse_args()
+    if args.command == "import":
+        sys.exit(_import(args))
+    if args.command == "generate":
+        sys.exit(_generate(args))
+
+    _serve()
+
+
 if __name__ == "__main__":
     main()
-
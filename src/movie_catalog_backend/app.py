@@ -3,9 +3,37 @@ import logging
 
 from fastapi import FastAPI
 
+from movie_catalog_backend.config import (
+    get_admission_max_in_flight,
+    get_admission_max_pool_wait,
+    get_admission_retry_after,
+    get_compression_levels,
+    get_compression_min_size,
+    get_profile_dir,
+    get_profile_sample_rate,
+    get_profile_token,
+    get_rate_limit_backend,
+    get_rate_limit_default,
+    get_rate_limit_routes,
+    is_compression_enabled,
+    is_db_bootstrapped,
+    is_admission_control_enabled,
+    is_forwarded_for_trusted,
+    is_metrics_enabled,
+    is_rate_limit_enabled,
+)
 from movie_catalog_backend.db.seed import seed_database_if_empty
-from movie_catalog_backend.db.session import init_db
-from movie_catalog_backend.route import movies, theaters
+from movie_catalog_backend.db.session import dispose_async_engines, init_db
+from movie_catalog_backend.metrics import mark_process_dead
+from movie_catalog_backend.middleware.admission import AdmissionControlMiddleware
+from movie_catalog_backend.middleware.compression import CompressionMiddleware
+from movie_catalog_backend.middleware.metrics import MetricsMiddleware
+from movie_catalog_backend.middleware.profiling import ProfilingMiddleware
+from movie_catalog_backend.middleware.rate_limit import RateLimitMiddleware, create_rate_limit_store
+from movie_catalog_backend.route import metrics, movies, stats, theaters
+from movie_catalog_backend.service.movie_service import reset_fts_index_state
+from movie_catalog_backend.service.theater_movies_view import theater_movies_view
+from movie_catalog_backend.service.versioning import invalidate_all
 
 # 로깅 설정
 logging.basicConfig(
@@ -23,21 +51,87 @@ def create_app() -> FastAPI:
         version="0.1.0"
     )
     
+    # 요청 프로파일링 (샘플링 비율 또는 토큰 헤더로 선택된 요청만, 기본 비활성화)
+    if get_profile_sample_rate() > 0 or get_profile_token():
+        app.add_middleware(
+            ProfilingMiddleware,
+            sample_rate=get_profile_sample_rate(),
+            token=get_profile_token(),
+            profile_dir=get_profile_dir()
+        )
+    
+    # 응답 압축 (Accept-Encoding 협상, 최소 크기 미만은 압축하지 않음)
+    if is_compression_enabled():
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=get_compression_min_size(),
+            levels=get_compression_levels()
+        )
+    
+    # 과부하 시 요청 거절 (동시 처리 수/DB 풀 대기 기준 503, 압축/핸들러 실행 전)
+    if is_admission_control_enabled():
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            max_in_flight=get_admission_max_in_flight(),
+            max_pool_wait=get_admission_max_pool_wait(),
+            retry_after=get_admission_retry_after()
+        )
+    
+    # 등록할 라우터 (속도 제한 라우트 템플릿 대조에도 사용)
+    routers = [theaters.router, movies.router, stats.router]
+    if is_metrics_enabled():
+        routers.append(metrics.router)
+    
+    # 클라이언트/라우트별 속도 제한 (429, 과부하 판단 전에 먼저 적용)
+    if is_rate_limit_enabled():
+        app.add_middleware(
+            RateLimitMiddleware,
+            routes=[route for router in routers for route in router.routes],
+            store=create_rate_limit_store(get_rate_limit_backend()),
+            default_limit=get_rate_limit_default(),
+            route_limits=get_rate_limit_routes(),
+            trust_forwarded_for=is_forwarded_for_trusted()
+        )
+    
+    # 요청 메트릭 (가장 바깥에 두어 압축 후 응답 크기와 전체 처리 시간을 측정)
+    if is_metrics_enabled():
+        app.add_middleware(MetricsMiddleware)
+    
     # 라우터 등록
-    app.include_router(theaters.router)
-    app.include_router(movies.router)
+    for router in routers:
+        app.include_router(router)
     
     # 시작 이벤트
     @app.on_event("startup")
     async def startup_event():
-        """앱 시작 시 DB 초기화 및 시드"""
-        logger.info("앱 시작: DB 초기화 중...")
-        init_db()
-        logger.info("DB 테이블 생성 완료")
+        """앱 시작 시 DB 초기화 및 시드 (운영 모드에서는 부모 프로세스가 이미 수행) 후 극장별 영화 목록 뷰 구축"""
+        if is_db_bootstrapped():
+            logger.info("앱 시작: DB 초기화/시드는 부모 프로세스에서 완료됨")
+        else:
+            logger.info("앱 시작: DB 초기화 중...")
+            init_db()
+            logger.info("DB 테이블 생성 완료")
+            
+            logger.info("시드 데이터 확인 중...")
+            seed_database_if_empty()
+            logger.info("시드 데이터 확인 완료")
+            
+            # 공유 캐시 저장소에 남은 이전 실행의 캐시/버전 무효화
+            await invalidate_all()
         
-        logger.info("시드 데이터 확인 중...")
-        seed_database_if_empty()
-        logger.info("시드 데이터 확인 완료")
+        # 마이그레이션으로 생긴 FTS 색인을 다음 검색에서 다시 확인
+        reset_fts_index_state()
+        
+        # 워커마다 자신의 메모리에 구축
+        await theater_movies_view.build()
+    
+    # 종료 이벤트
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """앱 종료 시 비동기 엔진(쓰기/읽기) 커넥션 풀 정리 및 워커 메트릭 정리"""
+        await dispose_async_engines()
+        reset_fts_index_state()
+        mark_process_dead()
     
     return app
 
@@ -0,0 +1,316 @@
+"""애플리케이션 설정 (환경변수 기반)
+
+DB 관련 설정은 `db/config.py`에 있으며, 여기에는 그 외 계층의 설정을 둔다.
+"""
+import hashlib
+import os
+import tempfile
+from typing import Any, Dict, Tuple
+
+from movie_catalog_backend.db.config import get_database_url
+
+# 부모 프로세스가 DB 초기화/시드를 마쳤음을 워커에 알리는 환경변수 (내부용)
+DB_BOOTSTRAPPED_ENV = "MOVIE_CATALOG_DB_BOOTSTRAPPED"
+
+
+def _get_int_env(name: str, default: int) -> int:
+    """정수 환경변수 읽기 (미설정/형식 오류 시 기본값)"""
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _get_float_env(name: str, default: float) -> float:
+    """실수 환경변수 읽기 (미설정/형식 오류 시 기본값)"""
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _get_bool_env(name: str, default: bool) -> bool:
+    """불리언 환경변수 읽기 ("true"만 참)"""
+    return os.getenv(name, str(default)).lower() == "true"
+
+
+def is_cache_enabled() -> bool:
+    """서비스 조회 캐시 사용 여부 (CACHE_ENABLED, 기본값: true)"""
+    return _get_bool_env("CACHE_ENABLED", True)
+
+
+def get_cache_ttl_seconds() -> float:
+    """캐시 항목 유효 시간 초 (CACHE_TTL_SECONDS, 기본값: 60)"""
+    return _get_float_env("CACHE_TTL_SECONDS", 60.0)
+
+
+def get_cache_max_entries() -> int:
+    """캐시별 최대 항목 수 (CACHE_MAX_ENTRIES, 기본값: 10000)"""
+    return _get_int_env("CACHE_MAX_ENTRIES", 10000)
+
+
+def get_cache_backend() -> str:
+    """서비스 캐시 저장소 (CACHE_BACKEND: memory | file | redis, 기본값: 워커 1개면 memory, 여러 개면 file)
+
+    - memory: 프로세스 내 저장 (워커가 여러 개면 워커마다 별도로 캐시/무효화)
+    - file: 로컬 SQLite 파일 공유 (같은 노드의 워커 간 일관성)
+    - redis: Redis 프로토콜 서버 공유 (여러 노드/파드 간 일관성)
+    """
+    default = "file" if get_worker_count() > 1 else "memory"
+    backend = os.getenv("CACHE_BACKEND", default).lower()
+    return backend if backend in ("memory", "file", "redis") else default
+
+
+def is_process_local_cache_safe() -> bool:
+    """프로세스 내 캐시/데이터 버전이 워커 간에 일관적인지 여부
+
+    memory 저장소를 명시하고 워커를 여러 개 띄우면 한 워커의 쓰기가 다른 워커의 캐시,
+    ETag(데이터 버전), 극장별 영화 목록 뷰를 무효화하지 못한다. 이 경우 false이며
+    조회 캐시와 ETag/304, 뷰를 사용하지 않는다.
+    """
+    return get_cache_backend() != "memory" or get_worker_count() == 1
+
+
+def get_cache_key_prefix() -> str:
+    """공유 캐시 저장소 키 접두사 (CACHE_KEY_PREFIX, 기본값: movie-catalog)
+
+    같은 저장소를 여러 서비스/환경이 함께 쓸 때 키가 섞이지 않도록 구분한다.
+    """
+    return os.getenv("CACHE_KEY_PREFIX", "movie-catalog")
+
+
+def get_cache_file_path() -> str:
+    """file 캐시 저장소 경로 (CACHE_FILE_PATH, 기본값: 시스템 임시 디렉터리 아래 DB별 파일)
+
+    캐시 항목과 데이터 버전은 특정 DB의 내용이므로, 기본 경로에 DB URL의 해시를 넣어
+    다른 DB를 쓰는 서버끼리 같은 파일(같은 버전/ETag)을 공유하지 않게 한다.
+    """
+    if path := os.getenv("CACHE_FILE_PATH"):
+        return path
+    digest = hashlib.blake2b(get_database_url().encode("utf-8"), digest_size=6).hexdigest()
+    return os.path.join(tempfile.gettempdir(), f"movie-catalog-cache-{digest}.db")
+
+
+def get_cache_redis_url() -> str:
+    """redis 캐시 저장소 URL (CACHE_REDIS_URL, 기본값: redis://127.0.0.1:6379/0)"""
+    return os.getenv("CACHE_REDIS_URL", "redis://127.0.0.1:6379/0")
+
+
+def get_cache_redis_timeout() -> float:
+    """redis 캐시 저장소 연결/응답 타임아웃 초 (CACHE_REDIS_TIMEOUT_SECONDS, 기본값: 0.5)"""
+    return _get_float_env("CACHE_REDIS_TIMEOUT_SECONDS", 0.5)
+
+
+def is_theater_movies_view_enabled() -> bool:
+    """극장별 영화 목록 인메모리 뷰 사용 여부 (THEATER_MOVIES_VIEW_ENABLED, 기본값: true)"""
+    return _get_bool_env("THEATER_MOVIES_VIEW_ENABLED", True)
+
+
+def get_theater_movies_view_max_age() -> float:
+    """극장별 영화 목록 뷰 최대 유지 시간 초 (THEATER_MOVIES_VIEW_MAX_AGE_SECONDS, 기본값: 60, 0이면 제한 없음)
+
+    데이터 버전으로 감지할 수 없는 변경(서버 밖에서 DB를 직접 수정 등)도 이 시간 안에
+    반영되도록, 마지막 전체 구축 후 이 시간이 지나면 뷰를 쓰지 않고 재구축한다.
+    """
+    return max(0.0, _get_float_env("THEATER_MOVIES_VIEW_MAX_AGE_SECONDS", 60.0))
+
+
+def get_theater_movies_view_rebuild_interval() -> float:
+    """극장별 영화 목록 뷰 재구축 최소 간격 초 (THEATER_MOVIES_VIEW_REBUILD_INTERVAL_SECONDS, 기본값: 5)
+
+    다른 워커의 쓰기로 뷰가 오래되면 재구축하는데, 쓰기가 잦을 때 전체 재구축이
+    연달아 일어나지 않도록 간격을 둔다. 그동안 조회는 DB에서 처리한다.
+    """
+    return max(0.0, _get_float_env("THEATER_MOVIES_VIEW_REBUILD_INTERVAL_SECONDS", 5.0))
+
+
+def is_rate_limit_enabled() -> bool:
+    """클라이언트/라우트별 요청 속도 제한 사용 여부 (RATE_LIMIT_ENABLED, 기본값: false)"""
+    return _get_bool_env("RATE_LIMIT_ENABLED", False)
+
+
+def get_rate_limit_default() -> Tuple[float, float]:
+    """라우트별 기본 토큰 버킷 (초당 충전량, 최대 버스트)
+
+    - RATE_LIMIT_RATE: 클라이언트 1개가 라우트 1개에 초당 보낼 수 있는 요청 수 (기본값: 20)
+    - RATE_LIMIT_BURST: 순간적으로 허용하는 최대 요청 수 (기본값: 40)
+    """
+    return (
+        max(0.001, _get_float_env("RATE_LIMIT_RATE", 20.0)),
+        max(1.0, _get_float_env("RATE_LIMIT_BURST", 40.0)),
+    )
+
+
+def get_rate_limit_routes() -> Dict[str, Tuple[float, float]]:
+    """라우트별 토큰 버킷 재정의 (RATE_LIMIT_ROUTES)
+
+    `메서드 라우트템플릿=초당충전량/버스트`를 쉼표로 구분한다. 형식이 잘못된 항목은 무시한다.
+    목록 API는 페이지 단위로만 조회되므로, 기본값은 전체 테이블을 읽는 내보내기 라우트만 낮게 제한한다.
+    예) `GET /movies=5/10,GET /movies/export=0.1/1`
+    """
+    value = os.getenv(
+        "RATE_LIMIT_ROUTES",
+        "GET /movies/export=0.1/1,GET /theaters/export=0.1/1"
+    )
+    routes: Dict[str, Tuple[float, float]] = {}
+    for entry in value.split(","):
+        route, _, bucket = entry.strip().rpartition("=")
+        rate, _, burst = bucket.partition("/")
+        method, _, path = route.strip().partition(" ")
+        try:
+            rate_value, burst_value = float(rate), float(burst)
+        except ValueError:
+            continue
+        if method and path and rate_value > 0 and burst_value >= 1:
+            routes[f"{method.upper()} {path.strip()}"] = (rate_value, burst_value)
+    return routes
+
+
+def get_rate_limit_backend() -> str:
+    """속도 제한 상태 저장소 (RATE_LIMIT_BACKEND: memory | redis, 기본값: memory)
+
+    - memory: 워커마다 별도 버킷 (실제 허용량은 워커 수만큼 늘어남)
+    - redis: 모든 워커/노드가 버킷 공유 (CACHE_REDIS_URL의 서버 사용, RATE_LIMIT_REDIS_URL로 변경 가능)
+    """
+    backend = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+    return backend if backend in ("memory", "redis") else "memory"
+
+
+def get_rate_limit_redis_url() -> str:
+    """redis 속도 제한 저장소 URL (RATE_LIMIT_REDIS_URL, 기본값: CACHE_REDIS_URL)"""
+    return os.getenv("RATE_LIMIT_REDIS_URL") or get_cache_redis_url()
+
+
+def is_forwarded_for_trusted() -> bool:
+    """클라이언트 식별에 X-Forwarded-For 첫 주소 사용 여부 (RATE_LIMIT_TRUST_FORWARDED_FOR, 기본값: false)
+
+    신뢰할 수 있는 리버스 프록시 뒤에서만 켠다. 그렇지 않으면 클라이언트가 헤더를
+    바꿔 가며 제한을 우회할 수 있다.
+    """
+    return _get_bool_env("RATE_LIMIT_TRUST_FORWARDED_FOR", False)
+
+
+def is_admission_control_enabled() -> bool:
+    """과부하 시 요청 거절(load shedding) 사용 여부 (ADMISSION_CONTROL_ENABLED, 기본값: false)"""
+    return _get_bool_env("ADMISSION_CONTROL_ENABLED", False)
+
+
+def get_admission_max_in_flight() -> int:
+    """워커당 동시 처리 요청 수 상한 (ADMISSION_MAX_IN_FLIGHT, 기본값: 256, 0이면 제한 없음)
+
+    상한에 도달하면 대기열에 쌓지 않고 바로 503으로 응답한다.
+    """
+    return max(0, _get_int_env("ADMISSION_MAX_IN_FLIGHT", 256))
+
+
+def get_admission_max_pool_wait() -> float:
+    """요청 거절 기준 최근 DB 커넥션 풀 대기 시간 초 (ADMISSION_MAX_POOL_WAIT_MS, 기본값: 250, 0이면 사용 안 함)"""
+    return max(0.0, _get_float_env("ADMISSION_MAX_POOL_WAIT_MS", 250.0)) / 1000
+
+
+def get_admission_retry_after() -> int:
+    """과부하로 거절한 응답의 Retry-After 초 (ADMISSION_RETRY_AFTER_SECONDS, 기본값: 1)"""
+    return max(1, _get_int_env("ADMISSION_RETRY_AFTER_SECONDS", 1))
+
+
+def get_cache_control() -> str:
+    """GET 응답의 Cache-Control 헤더 (HTTP_CACHE_CONTROL, 기본값: no-cache)
+
+    기본값 no-cache는 저장은 허용하되 매번 ETag로 재검증하도록 한다.
+    """
+    return os.getenv("HTTP_CACHE_CONTROL", "no-cache")
+
+
+def is_compression_enabled() -> bool:
+    """응답 압축 사용 여부 (COMPRESSION_ENABLED, 기본값: true)"""
+    return _get_bool_env("COMPRESSION_ENABLED", True)
+
+
+def get_compression_min_size() -> int:
+    """압축 대상 최소 응답 크기 바이트 (COMPRESSION_MIN_SIZE, 기본값: 1024)
+
+    이보다 작은 응답은 압축 비용에 비해 이득이 적으므로 그대로 보낸다.
+    """
+    return _get_int_env("COMPRESSION_MIN_SIZE", 1024)
+
+
+def get_compression_levels() -> dict:
+    """인코딩별 압축 수준
+
+    - COMPRESSION_GZIP_LEVEL: gzip 수준 1-9 (기본값: 6)
+    - COMPRESSION_BROTLI_QUALITY: brotli 품질 0-11 (기본값: 4)
+    - COMPRESSION_ZSTD_LEVEL: zstd 수준 1-22 (기본값: 3)
+    """
+    return {
+        "gzip": _get_int_env("COMPRESSION_GZIP_LEVEL", 6),
+        "br": _get_int_env("COMPRESSION_BROTLI_QUALITY", 4),
+        "zstd": _get_int_env("COMPRESSION_ZSTD_LEVEL", 3),
+    }
+
+
+def is_metrics_enabled() -> bool:
+    """Prometheus 메트릭 수집 및 /metrics 노출 여부 (METRICS_ENABLED, 기본값: true)"""
+    return _get_bool_env("METRICS_ENABLED", True)
+
+
+def get_profile_sample_rate() -> float:
+    """요청 프로파일링 샘플링 비율 0.0-1.0 (PROFILE_SAMPLE_RATE, 기본값: 0 = 비활성화)"""
+    return min(1.0, max(0.0, _get_float_env("PROFILE_SAMPLE_RATE", 0.0)))
+
+
+def get_profile_token() -> str:
+    """헤더로 프로파일링을 요청할 때 필요한 토큰 (PROFILE_TOKEN, 기본값: 없음 = 헤더 트리거 비활성화)
+
+    요청 헤더 `X-Profile`의 값이 이 토큰과 같으면 해당 요청을 프로파일링한다.
+    """
+    return os.getenv("PROFILE_TOKEN", "")
+
+
+def get_profile_dir() -> str:
+    """프로파일 결과(.prof) 저장 디렉터리 (PROFILE_DIR, 기본값: 시스템 임시 디렉터리 아래)"""
+    return os.getenv("PROFILE_DIR") or os.path.join(tempfile.gettempdir(), "movie-catalog-profiles")
+
+
+def is_production_mode() -> bool:
+    """운영 서버 모드 여부 (SERVER_MODE: development | production, 기본값: development)"""
+    return os.getenv("SERVER_MODE", "development").lower() == "production"
+
+
+def get_worker_count() -> int:
+    """워커 프로세스 수 (운영 모드: WORKERS, 기본값: CPU 수 / 개발 모드: 1)"""
+    if not is_production_mode():
+        return 1
+    return max(1, _get_int_env("WORKERS", os.cpu_count() or 1))
+
+
+def get_server_settings() -> Dict[str, Any]:
+    """uvicorn 실행 인자
+
+    - HOST: 바인드 주소 (기본값: 0.0.0.0)
+    - PORT: 포트 (기본값: 8000)
+    - RELOAD: 개발 모드 자동 리로드 (기본값: true, 운영 모드에서는 항상 false)
+    - WORKERS: 운영 모드 워커 프로세스 수 (기본값: CPU 수, 개발 모드는 1)
+    - UVICORN_LOOP: 이벤트 루프 (auto | asyncio | uvloop, 기본값: auto)
+    - UVICORN_HTTP: HTTP 파서 (auto | h11 | httptools, 기본값: auto)
+    - UVICORN_TIMEOUT_KEEP_ALIVE: keep-alive 유지 시간 초 (기본값: 5)
+    - UVICORN_BACKLOG: 대기 연결 수 (기본값: 2048)
+    - UVICORN_TIMEOUT_GRACEFUL_SHUTDOWN: 종료 시 진행 중 요청 대기 시간 초 (기본값: 30)
+    - ACCESS_LOG: 접근 로그 출력 여부 (기본값: true)
+    """
+    return {
+        "host": os.getenv("HOST", "0.0.0.0"),
+        "port": _get_int_env("PORT", 8000),
+        "reload": False if is_production_mode() else _get_bool_env("RELOAD", True),
+        "workers": get_worker_count(),
+        "loop": os.getenv("UVICORN_LOOP", "auto"),
+        "http": os.getenv("UVICORN_HTTP", "auto"),
+        "timeout_keep_alive": _get_int_env("UVICORN_TIMEOUT_KEEP_ALIVE", 5),
+        "backlog": _get_int_env("UVICORN_BACKLOG", 2048),
+        "timeout_graceful_shutdown": _get_int_env("UVICORN_TIMEOUT_GRACEFUL_SHUTDOWN", 30),
+        "access_log": _get_bool_env("ACCESS_LOG", True),
+    }
+
+
+def is_db_bootstrapped() -> bool:
+    """부모 프로세스에서 DB 초기화/시드를 이미 수행했는지 여부 (멀티 워커 실행 시)"""
+    return os.getenv(DB_BOOTSTRAPPED_ENV) == "1"
@@ -1,6 +1,14 @@
 """데이터베이스 설정 및 프로젝트 루트 탐색"""
 import os
 from pathlib import Path
+from typing import Dict, Optional
+
+from sqlalchemy.engine import make_url
+
+# PRAGMA 값은 SQL 문자열로 조립되므로 허용된 값만 사용
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORE_MODES = {"DEFAULT", "FILE", "MEMORY"}
 
 
 def find_project_root() -> Path:
@@ -30,3 +38,148 @@ def get_database_url() -> str:
     db_path = data_dir / "movie_catalog.db"
     return f"sqlite:///{db_path}"
 
+
+
+# 동기 드라이버 → 비동기 드라이버 매핑 (백엔드 이름 기준)
+_ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+    "mariadb": "aiomysql",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """비동기 엔진용 데이터베이스 URL 결정
+
+    DATABASE_ASYNC_URL이 있으면 우선 사용하고, 없으면 DATABASE_URL의
+    드라이버를 비동기 드라이버로 치환한다 (예: sqlite → sqlite+aiosqlite).
+    """
+    if env_url := os.getenv("DATABASE_ASYNC_URL"):
+        return env_url
+
+    return to_async_url(database_url)
+
+
+def to_async_url(database_url: str) -> str:
+    """URL의 동기 드라이버를 비동기 드라이버로 치환 (이미 비동기이거나 매핑이 없으면 그대로)"""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    async_driver = _ASYNC_DRIVERS.get(backend)
+    if async_driver is None or url.get_driver_name() in _ASYNC_DRIVERS.values():
+        return database_url
+
+    return url.set(drivername=f"{backend}+{async_driver}").render_as_string(hide_password=False)
+
+
+def get_read_database_url(database_url: str) -> Optional[str]:
+    """읽기 전용 엔진 URL 결정 (None이면 읽기도 기본 엔진 사용)
+
+    - DATABASE_READ_URL: 읽기 복제본 등 별도 읽기 DB URL (우선 사용)
+    - SQLITE_READ_ONLY_ENGINE: SQLite 파일 DB일 때 같은 파일을 `mode=ro` URI로 여는
+      읽기 전용 엔진 사용 여부 (기본값: true, 인메모리 DB는 제외)
+    """
+    if env_url := os.getenv("DATABASE_READ_URL"):
+        return env_url
+
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite" or os.getenv("SQLITE_READ_ONLY_ENGINE", "true").lower() != "true":
+        return None
+
+    database = url.database
+    if not database or database == ":memory:" or database.startswith("file:") or "mode=memory" in database_url:
+        return None
+
+    return url.set(database=f"file:{database}", query={**url.query, "mode": "ro", "uri": "true"}).render_as_string(
+        hide_password=False
+    )
+
+
+def _get_int_env(name: str, default: int) -> int:
+    """정수 환경변수 읽기 (미설정/형식 오류 시 기본값)"""
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _get_choice_env(name: str, default: str, choices: set) -> str:
+    """허용 목록 기반 환경변수 읽기 (허용되지 않은 값이면 기본값)"""
+    value = os.getenv(name, default).upper()
+    return value if value in choices else default
+
+
+def is_sqlite_performance_profile_enabled() -> bool:
+    """SQLite 성능 프로파일 사용 여부 (기본값: 사용)"""
+    return os.getenv("SQLITE_PERFORMANCE_PROFILE", "true").lower() == "true"
+
+
+def get_sqlite_pragmas() -> Dict[str, str]:
+    """연결 시 적용할 SQLite 성능 PRAGMA (foreign_keys 제외)
+
+    - SQLITE_JOURNAL_MODE: 저널 모드 (기본값: WAL, 읽기가 쓰기에 막히지 않음)
+    - SQLITE_SYNCHRONOUS: 동기화 수준 (기본값: NORMAL, WAL에서 안전한 수준)
+    - SQLITE_BUSY_TIMEOUT_MS: 잠금 대기 시간 (기본값: 5000)
+    - SQLITE_CACHE_SIZE: 페이지 캐시 크기, 음수는 KiB 단위 (기본값: -64000, 약 64MB)
+    - SQLITE_MMAP_SIZE: 메모리 매핑 크기 바이트 (기본값: 268435456, 256MB)
+    - SQLITE_TEMP_STORE: 임시 저장소 (기본값: MEMORY)
+    """
+    if not is_sqlite_performance_profile_enabled():
+        return {}
+
+    return {
+        "journal_mode": _get_choice_env("SQLITE_JOURNAL_MODE", "WAL", _JOURNAL_MODES),
+        "synchronous": _get_choice_env("SQLITE_SYNCHRONOUS", "NORMAL", _SYNCHRONOUS_MODES),
+        "busy_timeout": str(_get_int_env("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+        "cache_size": str(_get_int_env("SQLITE_CACHE_SIZE", -64000)),
+        "mmap_size": str(_get_int_env("SQLITE_MMAP_SIZE", 268435456)),
+        "temp_store": _get_choice_env("SQLITE_TEMP_STORE", "MEMORY", _TEMP_STORE_MODES),
+    }
+
+
+def get_seed_mode() -> str:
+    """시드 삽입 방식 (SEED_MODE: bulk | orm, 기본값: bulk)
+
+    - bulk: 검증 선처리 후 Core INSERT executemany로 청크 단위 삽입
+    - orm: 레코드마다 ORM 객체를 session.add (기존 방식)
+    """
+    mode = os.getenv("SEED_MODE", "bulk").lower()
+    return mode if mode in ("bulk", "orm") else "bulk"
+
+
+def get_seed_chunk_size() -> int:
+    """bulk 시드의 INSERT 청크 크기 (SEED_CHUNK_SIZE, 기본값: 5000)"""
+    return max(1, _get_int_env("SEED_CHUNK_SIZE", 5000))
+
+
+def get_pool_settings() -> Dict[str, int]:
+    """커넥션 풀 크기 설정
+
+    - DB_POOL_SIZE: 유지할 커넥션 수 (기본값: 10)
+    - DB_MAX_OVERFLOW: 풀 초과 시 추가 허용 커넥션 수 (기본값: 20)
+    - DB_POOL_TIMEOUT: 커넥션 대기 최대 시간 초 (기본값: 30)
+    - DB_POOL_RECYCLE: 커넥션 재생성 주기 초, -1은 비활성 (기본값: 3600)
+    """
+    return {
+        "pool_size": _get_int_env("DB_POOL_SIZE", 10),
+        "max_overflow": _get_int_env("DB_MAX_OVERFLOW", 20),
+        "pool_timeout": _get_int_env("DB_POOL_TIMEOUT", 30),
+        "pool_recycle": _get_int_env("DB_POOL_RECYCLE", 3600),
+    }
+
+
+def get_read_pool_settings() -> Dict[str, int]:
+    """읽기 전용 엔진의 커넥션 풀 크기 설정 (미설정 항목은 기본 엔진 설정을 따름)
+
+    - DB_READ_POOL_SIZE: 유지할 커넥션 수
+    - DB_READ_MAX_OVERFLOW: 풀 초과 시 추가 허용 커넥션 수
+    """
+    settings = get_pool_settings()
+    settings["pool_size"] = _get_int_env("DB_READ_POOL_SIZE", settings["pool_size"])
+    settings["max_overflow"] = _get_int_env("DB_READ_MAX_OVERFLOW", settings["max_overflow"])
+    return settings
+
+
+def get_slow_query_threshold_ms() -> int:
+    """느린 쿼리 로그 기준 시간 ms (SLOW_QUERY_THRESHOLD_MS, 기본값: 500, 0이면 비활성화)"""
+    return max(0, _get_int_env("SLOW_QUERY_THRESHOLD_MS", 500))
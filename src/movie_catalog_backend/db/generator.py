@@ -0,0 +1,184 @@
+"""규모 테스트용 합성 카탈로그 생성기
+
+같은 시드와 옵션이면 항상 같은 극장/영화(ID 포함)를 만든다. 극장과 영화는 시드에서
+파생된 별도 난수열을 사용하므로, 영화만 생성할 때도 극장 ID가 전체 생성 때와 같다.
+
+영화의 극장 배정은 Zipf 분포(가중치 1 / 순위^skew)를 따른다. skew=0이면 균등하고,
+값이 클수록 앞쪽(먼저 생성된) 극장에 영화가 몰려 핫 키 상황을 재현한다.
+
+출력은 NDJSON/JSON 배열 스트림(`import` 명령과 호환) 또는 DB 직접 일괄 삽입이다.
+"""
+import itertools
+import json
+import logging
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Iterator, List, Literal, TextIO
+
+from sqlalchemy import insert
+
+from movie_catalog_backend.db.session import session_scope
+from movie_catalog_backend.entity.models import Movie, Theater
+
+logger = logging.getLogger(__name__)
+
+OutputFormat = Literal["ndjson", "json"]
+
+# 트랜잭션 당 삽입 레코드 수
+DEFAULT_CHUNK_SIZE = 10000
+
+# 생성 어휘 (극장 브랜드/지역, 영화 제목/배급사/장르)
+BRANDS = ["CGV", "롯데시네마", "메가박스", "씨네Q", "독립영화관"]
+BRAND_WEIGHTS = [45, 30, 20, 4, 1]
+REGIONS = [
+    ("서울", ["강남구", "송파구", "마포구", "용산구", "광진구", "영등포구", "종로구", "노원구"]),
+    ("부산", ["해운대구", "부산진구", "수영구", "사하구"]),
+    ("인천", ["연수구", "남동구", "부평구"]),
+    ("대구", ["수성구", "중구", "달서구"]),
+    ("대전", ["유성구", "서구"]),
+    ("광주", ["서구", "북구"]),
+    ("경기", ["성남시", "수원시", "고양시", "용인시", "부천시", "안양시"]),
+]
+BRANCH_SUFFIXES = ["", "스퀘어", "타워", "센트럴", "아이파크몰", "스타필드", "역"]
+OPENING_HOURS = ["07:00", "08:00", "08:30", "09:00", "09:30", "10:00"]
+CLOSING_HOURS = ["22:00", "23:00", "23:30", "24:00", "01:00", "02:00"]
+
+TITLE_PREFIXES = ["", "", "", "마지막", "푸른", "붉은", "조용한", "위대한", "잃어버린", "끝없는", "비밀의", "한여름의"]
+TITLE_NOUNS = [
+    "파묘", "항해", "기억", "도시", "전쟁", "여름", "바다", "별", "추격자", "정원",
+    "왕국", "그림자", "약속", "열차", "탈출", "유산", "섬", "계절", "연인", "밤",
+]
+TITLE_SUFFIXES = ["", "", "", "", "", " 2", " 3", ": 비기닝", ": 파트2", " 리턴즈"]
+DISTRIBUTORS = [
+    "CJ ENM", "롯데엔터테인먼트", "쇼박스", "NEW", "플러스엠", "워너브라더스",
+    "유니버설 픽처스", "월트디즈니 컴퍼니 코리아", "소니픽처스", "에이스메이커",
+]
+GENRES = ["드라마", "액션", "코미디", "스릴러", "SF", "애니메이션", "로맨스", "오컬트", "다큐멘터리", "판타지"]
+GENRE_WEIGHTS = [22, 18, 14, 12, 8, 8, 7, 5, 3, 3]
+TICKET_PRICES = [9000, 11000, 12000, 13000, 14000, 15000, 18000, 20000]
+TICKET_PRICE_WEIGHTS = [3, 5, 15, 25, 25, 15, 8, 4]
+
+
+@dataclass(frozen=True)
+class GeneratorOptions:
+    """생성 옵션 (잘못된 값이면 ValueError)"""
+    theaters: int
+    movies: int
+    seed: int = 0
+    skew: float = 1.0
+
+    def __post_init__(self):
+        if self.theaters < 0 or self.movies < 0:
+            raise ValueError("극장/영화 수는 0 이상이어야 합니다")
+        if self.movies and not self.theaters:
+            raise ValueError("영화를 생성하려면 극장이 1개 이상 필요합니다")
+        if self.skew < 0:
+            raise ValueError("skew는 0 이상이어야 합니다")
+
+
+def _rng(options: GeneratorOptions, stream: str) -> random.Random:
+    """시드와 용도별로 독립된 난수열 (문자열 시드는 실행 간 결정적)"""
+    return random.Random(f"{options.seed}:{stream}")
+
+
+def _uuid(rng: random.Random) -> str:
+    """난수열에서 결정적인 UUID4 문자열 생성"""
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def generate_theaters(options: GeneratorOptions) -> Iterator[dict]:
+    """극장 레코드 생성 (순서가 Zipf 순위, 앞쪽일수록 영화가 많이 배정됨)"""
+    rng = _rng(options, "theaters")
+    for index in range(options.theaters):
+        brand = rng.choices(BRANDS, BRAND_WEIGHTS)[0]
+        city, districts = rng.choice(REGIONS)
+        district = rng.choice(districts)
+        branch = f"{district[:-1]}{rng.choice(BRANCH_SUFFIXES)}"
+        yield {
+            "id": _uuid(rng),
+            "name": f"{brand} {branch} {index + 1}호점",
+            "brand": brand,
+            "location": f"{city} {district}",
+            "operating_hours": f"{rng.choice(OPENING_HOURS)}-{rng.choice(CLOSING_HOURS)}",
+        }
+
+
+def theater_ids(options: GeneratorOptions) -> List[str]:
+    """생성될 극장 ID 목록 (Zipf 순위 순)"""
+    return [theater["id"] for theater in generate_theaters(options)]
+
+
+def _theater_cum_weights(count: int, skew: float) -> List[float]:
+    """순위별 Zipf 누적 가중치"""
+    return list(itertools.accumulate(1.0 / (rank ** skew) for rank in range(1, count + 1)))
+
+
+def generate_movies(options: GeneratorOptions) -> Iterator[dict]:
+    """영화 레코드 생성 (극장 배정은 skew에 따른 Zipf 분포)"""
+    ids = theater_ids(options)
+    cum_weights = _theater_cum_weights(len(ids), options.skew)
+    rng = _rng(options, "movies")
+
+    for _ in range(options.movies):
+        genre = rng.choices(GENRES, GENRE_WEIGHTS)[0]
+        title = f"{rng.choice(TITLE_PREFIXES)} {rng.choice(TITLE_NOUNS)}{rng.choice(TITLE_SUFFIXES)}".strip()
+        # 애니메이션/다큐멘터리는 짧고, 그 외는 평균 2시간 전후
+        base_runtime = 95 if genre in ("애니메이션", "다큐멘터리") else 120
+        yield {
+            "id": _uuid(rng),
+            "title": title,
+            "distributor": rng.choice(DISTRIBUTORS),
+            "ticket_price": rng.choices(TICKET_PRICES, TICKET_PRICE_WEIGHTS)[0],
+            "runtime_minutes": min(240, max(60, round(rng.gauss(base_runtime, 20)))),
+            "genre": genre,
+            "theater_id": rng.choices(ids, cum_weights=cum_weights)[0],
+        }
+
+
+def write_records(records: Iterator[dict], out: TextIO, output_format: OutputFormat = "ndjson") -> int:
+    """레코드를 NDJSON 또는 JSON 배열로 스트리밍 기록 (기록한 개수 반환)"""
+    count = 0
+    if output_format == "json":
+        out.write("[")
+    for record in records:
+        line = json.dumps(record, ensure_ascii=False)
+        if output_format == "json":
+            out.write(f"\n  {line}" if count == 0 else f",\n  {line}")
+        else:
+            out.write(line + "\n")
+        count += 1
+    if output_format == "json":
+        out.write("\n]\n")
+    return count
+
+
+def _insert_chunked(model: type, records: Iterator[dict], chunk_size: int) -> int:
+    """청크마다 별도 트랜잭션으로 Core INSERT (삽입한 개수 반환)"""
+    total = 0
+    while chunk := list(itertools.islice(records, chunk_size)):
+        with session_scope() as session:
+            session.exec(insert(model.__table__), params=chunk)
+        total += len(chunk)
+    return total
+
+
+def insert_into_database(options: GeneratorOptions, chunk_size: int = DEFAULT_CHUNK_SIZE) -> tuple[int, int]:
+    """생성한 극장/영화를 DB에 직접 일괄 삽입 ((극장 수, 영화 수) 반환)
+
+    레코드 검증을 건너뛰므로 비어 있거나 생성기 데이터만 있는 DB에 사용한다.
+    같은 시드로 다시 실행하면 ID가 겹쳐 IntegrityError가 발생한다 (극장 첫 청크에서
+    실패하므로 아무것도 삽입되지 않음).
+    """
+    if chunk_size < 1:
+        raise ValueError("청크 크기는 1 이상이어야 합니다")
+
+    started = time.perf_counter()
+    theaters = _insert_chunked(Theater, generate_theaters(options), chunk_size)
+    logger.info(f"극장 {theaters}개 삽입 완료 ({time.perf_counter() - started:.3f}s)")
+
+    started = time.perf_counter()
+    movies = _insert_chunked(Movie, generate_movies(options), chunk_size)
+    logger.info(f"영화 {movies}개 삽입 완료 ({time.perf_counter() - started:.3f}s)")
+    return theaters, movies
@@ -0,0 +1,334 @@
+"""스트리밍 일괄 가져오기 (NDJSON / JSON 배열)
+
+입력을 조각 단위로 읽어 레코드를 점진적으로 파싱하고, 시드와 같은 검증
+함수(`validate_theater_record` / `validate_movie_record`)로 청크 단위 검증 후
+청크마다 별도 트랜잭션으로 일괄 삽입한다. 파일 전체를 메모리에 올리지 않는다.
+삽입 중 DB 오류가 난 청크는 롤백 후 해당 행 전체를 거부로 기록하고 다음 청크로 넘어간다.
+"""
+import codecs
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Literal, Set, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import select
+
+from movie_catalog_backend.db.seed import validate_movie_record, validate_theater_record
+from movie_catalog_backend.db.session import async_session_scope, session_scope
+from movie_catalog_backend.entity.models import Movie, Theater
+from movie_catalog_backend.scheme.importing import ImportReject, ImportReport
+
+logger = logging.getLogger(__name__)
+
+ImportKind = Literal["theaters", "movies"]
+
+# 청크(트랜잭션) 당 레코드 수
+DEFAULT_CHUNK_SIZE = 1000
+
+# 보고서에 담는 거부 레코드 최대 개수 (전체 개수는 rejected에 집계)
+MAX_REPORTED_REJECTS = 1000
+
+# 파일 읽기 단위 (바이트)
+_READ_SIZE = 64 * 1024
+
+
+class ImportFormatError(ValueError):
+    """입력 구조 오류 (JSON 배열 문법 오류 등, 가져오기 중단)
+
+    오류 이전 청크는 이미 커밋되어 있으며, 그때까지의 결과는 호출자가 넘긴 보고서에 남는다.
+    """
+
+
+class RecordParser:
+    """NDJSON / JSON 배열 점진적 파서
+
+    첫 번째 공백이 아닌 문자가 `[`이면 JSON 배열, 아니면 NDJSON으로 판단한다.
+    NDJSON에서 JSON 파싱에 실패한 줄은 해당 레코드만 거부하고, JSON 배열의
+    문법 오류는 구조적 오류로 ImportFormatError를 발생시킨다.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buffer = ""
+        self._mode: str | None = None
+        self._array_closed = False
+        self._expect_value = True
+        self.index = 0
+
+    def feed(self, data: bytes) -> List[Tuple[int, Any]]:
+        """입력 조각 추가 후 완성된 레코드 반환 ((순번, 값 또는 ValueError) 목록)"""
+        self._buffer += self._text_decoder.decode(data)
+        return self._drain(final=False)
+
+    def close(self) -> List[Tuple[int, Any]]:
+        """입력 종료 후 남은 레코드 반환"""
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        records = self._drain(final=True)
+        if self._mode == "array" and not self._array_closed:
+            raise ImportFormatError("JSON 배열이 닫히지 않음")
+        return records
+
+    def _next_index(self) -> int:
+        index = self.index
+        self.index += 1
+        return index
+
+    def _drain(self, final: bool) -> List[Tuple[int, Any]]:
+        if self._mode is None:
+            stripped = self._buffer.lstrip()
+            if not stripped:
+                self._buffer = ""
+                return []
+            self._mode = "array" if stripped[0] == "[" else "ndjson"
+            self._buffer = stripped[1:] if self._mode == "array" else stripped
+
+        if self._mode == "ndjson":
+            return self._drain_ndjson(final)
+        return self._drain_array(final)
+
+    def _drain_ndjson(self, final: bool) -> List[Tuple[int, Any]]:
+        lines = self._buffer.split("\n")
+        self._buffer = "" if final else lines.pop()
+
+        records = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            index = self._next_index()
+            try:
+                records.append((index, json.loads(line)))
+            except json.JSONDecodeError as e:
+                records.append((index, ValueError(f"JSON 파싱 실패: {e.msg}")))
+        return records
+
+    def _drain_array(self, final: bool) -> List[Tuple[int, Any]]:
+        records = []
+        buffer = self._buffer
+        pos = 0
+
+        while not self._array_closed:
+            # 공백/구분자 건너뛰기
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos >= len(buffer):
+                break
+
+            char = buffer[pos]
+            if char == "]":
+                self._array_closed = True
+                pos += 1
+                break
+            if char == ",":
+                if self._expect_value:
+                    raise ImportFormatError("JSON 배열 문법 오류: 예상치 못한 ','")
+                self._expect_value = True
+                pos += 1
+                continue
+            if not self._expect_value:
+                raise ImportFormatError("JSON 배열 문법 오류: ',' 누락")
+
+            try:
+                value, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if final:
+                    raise ImportFormatError(f"JSON 배열 파싱 실패: {e.msg}") from e
+                break  # 값이 아직 다 들어오지 않음
+
+            # 버퍼 끝에서 끝난 스칼라 값은 뒤에 이어질 수 있으므로 다음 조각까지 대기
+            if end == len(buffer) and not final and not isinstance(value, (dict, list)):
+                break
+
+            records.append((self._next_index(), value))
+            self._expect_value = False
+            pos = end
+
+        if self._array_closed and buffer[pos:].strip():
+            raise ImportFormatError("JSON 배열 뒤에 추가 데이터가 있음")
+
+        self._buffer = buffer[pos:]
+        return records
+
+
+def _chunked(records: Iterable[Tuple[int, Any]], chunk_size: int) -> Iterator[List[Tuple[int, Any]]]:
+    """레코드를 chunk_size 단위로 묶기"""
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _iter_records(chunks: Iterable[bytes]) -> Iterator[Tuple[int, Any]]:
+    """바이트 조각 스트림 → (순번, 레코드) 스트림"""
+    parser = RecordParser()
+    for data in chunks:
+        yield from parser.feed(data)
+    yield from parser.close()
+
+
+async def _aiter_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Any]]:
+    """비동기 바이트 조각 스트림 → (순번, 레코드) 스트림"""
+    parser = RecordParser()
+    async for data in chunks:
+        for record in parser.feed(data):
+            yield record
+    for record in parser.close():
+        yield record
+
+
+async def _achunked(records: AsyncIterator[Tuple[int, Any]], chunk_size: int) -> AsyncIterator[List[Tuple[int, Any]]]:
+    """비동기 레코드 스트림을 chunk_size 단위로 묶기"""
+    chunk = []
+    async for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _chunk_lookups(kind: ImportKind, chunk: List[Tuple[int, Any]]):
+    """청크 검증에 필요한 조회 쿼리 (기존 id, 참조 극장 id)"""
+    records = [record for _, record in chunk if isinstance(record, dict)]
+    ids = {record["id"] for record in records if isinstance(record.get("id"), str) and record["id"]}
+    model = Theater if kind == "theaters" else Movie
+    existing_query = select(model.id).where(model.id.in_(ids))
+
+    theater_query = None
+    if kind == "movies":
+        theater_ids = {record["theater_id"] for record in records if isinstance(record.get("theater_id"), str)}
+        theater_query = select(Theater.id).where(Theater.id.in_(theater_ids))
+    return existing_query, theater_query
+
+
+def _reject(report: ImportReport, index: int, reason: str) -> None:
+    """거부 레코드 기록 (보고서에는 최대 MAX_REPORTED_REJECTS개까지만 담음)"""
+    report.rejected += 1
+    if len(report.rejects) < MAX_REPORTED_REJECTS:
+        report.rejects.append(ImportReject(index=index, reason=reason))
+
+
+def _reject_rows(report: ImportReport, rows: List[Tuple[int, dict]], error: SQLAlchemyError) -> None:
+    """삽입에 실패한 청크의 행 전체를 거부로 기록"""
+    logger.warning(f"가져오기 청크 삽입 실패 ({len(rows)}건 거부): {error}")
+    reason = f"DB 오류: {type(error).__name__}"
+    for index, _ in rows:
+        _reject(report, index, reason)
+
+
+def _validate_chunk(
+    kind: ImportKind,
+    chunk: List[Tuple[int, Any]],
+    existing_ids: Set[str],
+    theater_ids: Set[str],
+    report: ImportReport
+) -> List[Tuple[int, dict]]:
+    """청크 검증 (통과한 (순번, 행) 반환, 거부 레코드는 보고서에 기록)"""
+    rows = []
+    seen_ids = set(existing_ids)
+
+    for index, record in chunk:
+        report.total += 1
+        try:
+            if isinstance(record, ValueError):
+                raise record
+            if kind == "theaters":
+                row = validate_theater_record(record)
+            else:
+                row = validate_movie_record(record, theater_ids)
+            if row["id"] in seen_ids:
+                raise ValueError("중복된 id")
+        except ValueError as e:
+            _reject(report, index, str(e))
+            continue
+
+        seen_ids.add(row["id"])
+        rows.append((index, row))
+
+    return rows
+
+
+def import_records(report: ImportReport, chunks: Iterable[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """바이트 스트림 가져오기 (동기, CLI용, 결과는 report에 누적)"""
+    kind = report.kind
+    model = Theater if kind == "theaters" else Movie
+
+    for chunk in _chunked(_iter_records(chunks), chunk_size):
+        with session_scope() as session:
+            existing_query, theater_query = _chunk_lookups(kind, chunk)
+            existing_ids = set(session.exec(existing_query).all())
+            theater_ids = set(session.exec(theater_query).all()) if theater_query is not None else set()
+
+            rows = _validate_chunk(kind, chunk, existing_ids, theater_ids, report)
+            if not rows:
+                continue
+            try:
+                session.exec(insert(model), params=[row for _, row in rows])
+                session.commit()
+            except SQLAlchemyError as e:
+                session.rollback()
+                _reject_rows(report, rows, e)
+                continue
+            report.inserted += len(rows)
+
+
+async def import_records_async(
+    report: ImportReport,
+    chunks: AsyncIterator[bytes],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> None:
+    """바이트 스트림 가져오기 (비동기, HTTP 요청 본문용, 결과는 report에 누적)"""
+    kind = report.kind
+    model = Theater if kind == "theaters" else Movie
+
+    async for chunk in _achunked(_aiter_records(chunks), chunk_size):
+        async with async_session_scope() as session:
+            existing_query, theater_query = _chunk_lookups(kind, chunk)
+            existing_ids = set((await session.exec(existing_query)).all())
+            theater_ids = set((await session.exec(theater_query)).all()) if theater_query is not None else set()
+
+            rows = _validate_chunk(kind, chunk, existing_ids, theater_ids, report)
+            if not rows:
+                continue
+            try:
+                await session.exec(insert(model), params=[row for _, row in rows])
+                await session.commit()
+            except SQLAlchemyError as e:
+                await session.rollback()
+                _reject_rows(report, rows, e)
+                continue
+            report.inserted += len(rows)
+
+
+def _read_file(path: str) -> Iterator[bytes]:
+    """파일(또는 '-'이면 표준 입력)을 조각 단위로 읽기"""
+    if path == "-":
+        stream = sys.stdin.buffer
+        while data := stream.read(_READ_SIZE):
+            yield data
+        return
+
+    with open(Path(path), "rb") as f:
+        while data := f.read(_READ_SIZE):
+            yield data
+
+
+def import_file(kind: ImportKind, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ImportReport:
+    """파일 가져오기 (CLI 진입점)"""
+    report = ImportReport(kind=kind)
+    try:
+        import_records(report, _read_file(path), chunk_size)
+    finally:
+        logger.info(
+            f"가져오기 종료({kind}): 전체 {report.total}건, 삽입 {report.inserted}건, 거부 {report.rejected}건"
+        )
+    return report
@@ -0,0 +1,154 @@
+"""버전 기반 스키마 마이그레이션
+
+`create_all`은 이미 존재하는 테이블을 변경하지 않으므로, 기존 DB에 필요한
+스키마 변경(인덱스 추가 등)은 여기의 마이그레이션 단계로 적용한다.
+적용된 버전은 `schema_version` 테이블에 기록되며 각 단계는 1회만 실행된다.
+"""
+import logging
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Callable, Iterator, List, Tuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql import text
+
+logger = logging.getLogger(__name__)
+
+# 엔티티 메타데이터와 분리된 버전 관리 테이블
+_version_metadata = MetaData()
+schema_version = Table(
+    "schema_version",
+    _version_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+def _add_movie_indexes(conn: Connection) -> None:
+    """movie 테이블 필터/정렬 컬럼 인덱스 추가"""
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_movie_theater_id ON movie (theater_id)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_movie_genre ON movie (genre)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_movie_title ON movie (title)"))
+
+
+def _fts5_trigram_supported(conn: Connection) -> bool:
+    """FTS5 trigram 토크나이저 사용 가능 여부 (SQLite 3.34 이상 + FTS5 컴파일 옵션)"""
+    version = conn.execute(text("SELECT sqlite_version()")).scalar()
+    if tuple(int(part) for part in version.split(".")[:2]) < (3, 34):
+        return False
+    options = conn.execute(text("PRAGMA compile_options")).scalars().all()
+    return "ENABLE_FTS5" in options
+
+
+def _add_movie_fts(conn: Connection) -> None:
+    """movie 제목/배급사 전문 검색용 FTS5 테이블 및 동기화 트리거 추가 (SQLite 전용)
+
+    movie는 TEXT 기본 키 테이블이라 VACUUM이 rowid를 다시 매길 수 있으므로 FTS 행을
+    movie rowid에 연결하지 않는다. 대신 INTEGER PRIMARY KEY인 `movie_fts_docid`
+    (movie id → docid)를 두고 FTS 행을 docid로 저장하며(VACUUM은 INTEGER PRIMARY KEY
+    값을 바꾸지 않음), 트리거가 INSERT/UPDATE/DELETE마다 색인을 갱신한다.
+    텍스트는 FTS 테이블에 복사된다.
+    """
+    if conn.dialect.name != "sqlite":
+        logger.info("SQLite가 아니므로 FTS 색인을 건너뜁니다 (LIKE 검색 사용)")
+        return
+    if not _fts5_trigram_supported(conn):
+        logger.warning("FTS5 trigram 미지원 SQLite이므로 FTS 색인을 건너뜁니다 (LIKE 검색 사용)")
+        return
+
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS movie_fts_docid ("
+        "docid INTEGER PRIMARY KEY, movie_id TEXT NOT NULL UNIQUE)"
+    ))
+    conn.execute(text(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS movie_fts USING fts5(title, distributor, tokenize='trigram')"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS movie_fts_ai AFTER INSERT ON movie BEGIN "
+        "INSERT INTO movie_fts_docid(movie_id) VALUES (new.id); "
+        "INSERT INTO movie_fts(rowid, title, distributor) "
+        "SELECT docid, new.title, new.distributor FROM movie_fts_docid WHERE movie_id = new.id; "
+        "END"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS movie_fts_ad AFTER DELETE ON movie BEGIN "
+        "DELETE FROM movie_fts WHERE rowid = (SELECT docid FROM movie_fts_docid WHERE movie_id = old.id); "
+        "DELETE FROM movie_fts_docid WHERE movie_id = old.id; "
+        "END"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS movie_fts_au AFTER UPDATE OF id, title, distributor ON movie BEGIN "
+        "UPDATE movie_fts_docid SET movie_id = new.id WHERE movie_id = old.id; "
+        "UPDATE movie_fts SET title = new.title, distributor = new.distributor "
+        "WHERE rowid = (SELECT docid FROM movie_fts_docid WHERE movie_id = new.id); "
+        "END"
+    ))
+    # 기존 행 색인
+    conn.execute(text("INSERT INTO movie_fts_docid(movie_id) SELECT id FROM movie ORDER BY id"))
+    conn.execute(text(
+        "INSERT INTO movie_fts(rowid, title, distributor) "
+        "SELECT d.docid, m.title, m.distributor FROM movie_fts_docid d JOIN movie m ON m.id = d.movie_id"
+    ))
+
+
+# (버전, 설명, 적용 함수) - 버전은 단조 증가해야 하며 기존 항목은 수정하지 않는다
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "movie theater_id/genre/title 인덱스 추가", _add_movie_indexes),
+    (2, "movie 제목/배급사 FTS5 전문 검색 색인 추가", _add_movie_fts),
+]
+
+
+def get_current_version(conn: Connection) -> int:
+    """현재 적용된 스키마 버전 조회 (미적용 시 0)"""
+    return conn.execute(select(func.max(schema_version.c.version))).scalar() or 0
+
+
+@contextmanager
+def _step_transaction(engine: Engine) -> Iterator[Connection]:
+    """마이그레이션 단계 트랜잭션 (예외 시 롤백)
+
+    pysqlite 드라이버는 DML 앞에서만 트랜잭션을 시작하고 DDL은 즉시 커밋하므로,
+    SQLite에서는 드라이버의 트랜잭션 관리를 끄고 직접 BEGIN하여 DDL도 함께 롤백되게 한다.
+    """
+    if engine.dialect.name != "sqlite":
+        with engine.begin() as conn:
+            yield conn
+        return
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+        conn.exec_driver_sql("COMMIT")
+
+
+def run_migrations(engine: Engine) -> int:
+    """미적용 마이그레이션을 순서대로 실행 (최종 버전 반환)"""
+    _version_metadata.create_all(engine)
+
+    with engine.connect() as conn:
+        current = get_current_version(conn)
+
+    for version, description, migrate in MIGRATIONS:
+        if version <= current:
+            continue
+
+        # 단계별 트랜잭션: 실패 시 해당 단계만 롤백되고 버전은 기록되지 않음
+        with _step_transaction(engine) as conn:
+            logger.info(f"스키마 마이그레이션 v{version} 적용: {description}")
+            migrate(conn)
+            conn.execute(
+                schema_version.insert().values(
+                    version=version,
+                    description=description,
+                    applied_at=datetime.now(timezone.utc)
+                )
+            )
+        current = version
+
+    return current
@@ -1,15 +1,20 @@
 """데이터베이스 초기 시드 및 마이그레이션"""
 import json
 import logging
+import time
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Callable, List, Set
 from uuid import uuid4
 
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert
 from sqlmodel import select
 
-from movie_catalog_backend.db.config import find_project_root
+from movie_catalog_backend.db.config import find_project_root, get_seed_chunk_size, get_seed_mode
 from movie_catalog_backend.db.session import session_scope
 from movie_catalog_backend.entity.models import Movie, Theater
+from movie_catalog_backend.scheme.movie import MovieCreate
+from movie_catalog_backend.scheme.theater import TheaterCreate
 
 logger = logging.getLogger(__name__)
 
@@ -104,33 +109,78 @@ def _load_json_file(file_path: Path) -> List[dict] | None:
         return None
 
 
+THEATER_FIELDS = ["id", "name", "brand", "location", "operating_hours"]
+MOVIE_FIELDS = ["id", "title", "distributor", "ticket_price", "runtime_minutes", "genre", "theater_id"]
+
+
+def _normalize_record(record: Any, schema: type[BaseModel]) -> dict:
+    """레코드를 생성 스키마로 엄격 검증 (id 자동 생성, 실패 시 ValueError(스킵 사유))
+
+    strict 모드이므로 null, 객체, 불리언, 숫자 문자열 등 DB에 그대로 넣을 수 없는 값은 거부한다.
+    기존 시드와 같이 필수 필드 누락을 필드 값 오류보다 먼저 보고한다.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("레코드가 객체가 아님")
+    
+    # id가 없으면 자동 생성
+    record_id = record.get("id")
+    if not record_id:
+        record_id = str(uuid4())
+    elif not isinstance(record_id, str):
+        raise ValueError("잘못된 id")
+    
+    try:
+        validated = schema.model_validate(record, strict=True)
+    except ValidationError as e:
+        errors = e.errors()
+        if any(error["type"] == "missing" for error in errors):
+            raise ValueError("필수 필드 누락") from None
+        raise ValueError(f"잘못된 {errors[0]['loc'][0]}") from None
+    
+    return {"id": record_id, **validated.model_dump()}
+
+
+def validate_theater_record(theater_dict: Any) -> dict:
+    """극장 레코드 검증 및 정규화 (id 자동 생성, 실패 시 ValueError(스킵 사유))"""
+    row = _normalize_record(theater_dict, TheaterCreate)
+    return {field: row[field] for field in THEATER_FIELDS}
+
+
+def validate_movie_record(movie_dict: Any, existing_theater_ids: Set[str]) -> dict:
+    """영화 레코드 검증 및 정규화 (id 자동 생성, 실패 시 ValueError(스킵 사유))"""
+    if not isinstance(movie_dict, dict):
+        raise ValueError("레코드가 객체가 아님")
+    
+    # theater_id 참조 무결성 검증 (기존 시드와 같이 다른 필드보다 먼저 확인)
+    theater_id = movie_dict.get("theater_id")
+    if not isinstance(theater_id, str) or theater_id not in existing_theater_ids:
+        raise ValueError("유효하지 않은 theater_id")
+    
+    row = _normalize_record(movie_dict, MovieCreate)
+    return {field: row[field] for field in MOVIE_FIELDS}
+
+
+def _record_label(record: Any, key: str) -> str:
+    """로그용 레코드 이름"""
+    return record.get(key, "unknown") if isinstance(record, dict) else "unknown"
+
+
 def _insert_theaters(session: Any, theaters_data: List[dict]) -> int:
     """극장 데이터 삽입 (성공한 개수 반환)"""
     success_count = 0
     
     for theater_dict in theaters_data:
         try:
-            # id가 없으면 자동 생성
-            if "id" not in theater_dict or not theater_dict["id"]:
-                theater_dict["id"] = str(uuid4())
-            
-            # 필수 필드 검증
-            required = ["id", "name", "brand", "location", "operating_hours"]
-            if not all(field in theater_dict for field in required):
-                logger.warning(f"극장 레코드 스킵: 필수 필드 누락 - {theater_dict.get('name', 'unknown')}")
-                continue
-            
-            theater = Theater(
-                id=theater_dict["id"],
-                name=theater_dict["name"],
-                brand=theater_dict["brand"],
-                location=theater_dict["location"],
-                operating_hours=theater_dict["operating_hours"]
-            )
-            session.add(theater)
+            row = validate_theater_record(theater_dict)
+        except ValueError as e:
+            logger.warning(f"극장 레코드 스킵: {e} - {_record_label(theater_dict, 'name')}")
+            continue
+        
+        try:
+            session.add(Theater(**row))
             success_count += 1
         except Exception as e:
-            logger.warning(f"극장 레코드 스킵: {theater_dict.get('name', 'unknown')} - {e}")
+            logger.warning(f"극장 레코드 스킵: {_record_label(theater_dict, 'name')} - {e}")
             continue
     
     return success_count
@@ -146,48 +196,78 @@ def _insert_movies(session: Any, movies_data: List[dict]) -> int:
     
     for movie_dict in movies_data:
         try:
-            # theater_id 참조 무결성 검증
-            if "theater_id" not in movie_dict or movie_dict["theater_id"] not in existing_theater_ids:
-                logger.warning(f"영화 레코드 스킵: 유효하지 않은 theater_id - {movie_dict.get('title', 'unknown')}")
-                continue
-            
-            # id가 없으면 자동 생성
-            if "id" not in movie_dict or not movie_dict["id"]:
-                movie_dict["id"] = str(uuid4())
-            
-            # 필수 필드 검증
-            required = ["id", "title", "distributor", "ticket_price", "runtime_minutes", "genre", "theater_id"]
-            if not all(field in movie_dict for field in required):
-                logger.warning(f"영화 레코드 스킵: 필수 필드 누락 - {movie_dict.get('title', 'unknown')}")
-                continue
-            
-            # 타입 검증
-            if not isinstance(movie_dict["ticket_price"], int) or movie_dict["ticket_price"] < 0:
-                logger.warning(f"영화 레코드 스킵: 잘못된 ticket_price - {movie_dict.get('title', 'unknown')}")
-                continue
-            
-            if not isinstance(movie_dict["runtime_minutes"], int) or movie_dict["runtime_minutes"] < 0:
-                logger.warning(f"영화 레코드 스킵: 잘못된 runtime_minutes - {movie_dict.get('title', 'unknown')}")
-                continue
-            
-            movie = Movie(
-                id=movie_dict["id"],
-                title=movie_dict["title"],
-                distributor=movie_dict["distributor"],
-                ticket_price=movie_dict["ticket_price"],
-                runtime_minutes=movie_dict["runtime_minutes"],
-                genre=movie_dict["genre"],
-                theater_id=movie_dict["theater_id"]
-            )
-            session.add(movie)
+            row = validate_movie_record(movie_dict, existing_theater_ids)
+        except ValueError as e:
+            logger.warning(f"영화 레코드 스킵: {e} - {_record_label(movie_dict, 'title')}")
+            continue
+        
+        try:
+            session.add(Movie(**row))
             success_count += 1
         except Exception as e:
-            logger.warning(f"영화 레코드 스킵: {movie_dict.get('title', 'unknown')} - {e}")
+            logger.warning(f"영화 레코드 스킵: {_record_label(movie_dict, 'title')} - {e}")
             continue
     
     return success_count
 
 
+def _collect_valid_rows(
+    records: List[dict],
+    validate: Callable[[Any], dict],
+    label: str,
+    name_key: str
+) -> List[dict]:
+    """검증 선처리: 유효한 행만 모으고 실패/중복 id 레코드는 경고 후 스킵"""
+    rows = []
+    seen_ids: Set[str] = set()
+    
+    for record in records:
+        try:
+            row = validate(record)
+        except ValueError as e:
+            logger.warning(f"{label} 레코드 스킵: {e} - {_record_label(record, name_key)}")
+            continue
+        
+        if row["id"] in seen_ids:
+            logger.warning(f"{label} 레코드 스킵: 중복된 id - {_record_label(record, name_key)}")
+            continue
+        
+        seen_ids.add(row["id"])
+        rows.append(row)
+    
+    return rows
+
+
+def _bulk_insert(session: Any, model: Any, rows: List[dict]) -> None:
+    """Core INSERT executemany로 청크 단위 삽입 (ORM unit-of-work 미사용)"""
+    chunk_size = get_seed_chunk_size()
+    for start in range(0, len(rows), chunk_size):
+        session.exec(insert(model.__table__), params=rows[start:start + chunk_size])
+
+
+def _bulk_insert_theaters(session: Any, theaters_data: List[dict]) -> int:
+    """극장 데이터 일괄 삽입 (성공한 개수 반환)"""
+    rows = _collect_valid_rows(theaters_data, validate_theater_record, "극장", "name")
+    _bulk_insert(session, Theater, rows)
+    return len(rows)
+
+
+def _bulk_insert_movies(session: Any, movies_data: List[dict]) -> int:
+    """영화 데이터 일괄 삽입 (성공한 개수 반환)"""
+    # 기존 극장 ID 목록 조회 (같은 트랜잭션에서 먼저 삽입된 극장 포함)
+    result = session.exec(select(Theater.id))
+    existing_theater_ids = set(result.all())
+    
+    rows = _collect_valid_rows(
+        movies_data,
+        lambda record: validate_movie_record(record, existing_theater_ids),
+        "영화",
+        "title"
+    )
+    _bulk_insert(session, Movie, rows)
+    return len(rows)
+
+
 def _check_db_empty(session: Any) -> tuple[bool, bool]:
     """DB가 비어있는지 확인 (theaters_empty, movies_empty)"""
     theaters_empty = session.exec(select(Theater.id).limit(1)).first() is None
@@ -197,6 +277,11 @@ def _check_db_empty(session: Any) -> tuple[bool, bool]:
 
 def seed_database_if_empty():
     """DB가 비어있을 때 1회 시드 수행"""
+    if get_seed_mode() == "bulk":
+        insert_theaters, insert_movies = _bulk_insert_theaters, _bulk_insert_movies
+    else:
+        insert_theaters, insert_movies = _insert_theaters, _insert_movies
+    
     with session_scope() as session:
         theaters_empty, movies_empty = _check_db_empty(session)
         
@@ -223,14 +308,16 @@ def seed_database_if_empty():
                 logger.info("theaters.json을 사용할 수 없습니다. 내장 샘플 데이터를 사용합니다.")
                 theaters_data = SAMPLE_THEATERS
             
-            total_theaters = _insert_theaters(session, theaters_data)
+            started = time.perf_counter()
+            total_theaters = insert_theaters(session, theaters_data)
+            elapsed = time.perf_counter() - started
             
             if total_theaters == 0:
                 logger.error("극장 데이터 삽입 실패: 모든 레코드가 실패했습니다.")
                 session.rollback()
                 return
             
-            logger.info(f"극장 {total_theaters}개 삽입 완료")
+            logger.info(f"극장 {total_theaters}개 삽입 완료 ({elapsed:.3f}s)")
         
         # 영화가 비어있으면 삽입 (부분 백필 지원)
         if movies_empty:
@@ -242,7 +329,9 @@ def seed_database_if_empty():
                 logger.info("movies.json을 사용할 수 없습니다. 내장 샘플 데이터를 사용합니다.")
                 movies_data = SAMPLE_MOVIES
             
-            total_movies = _insert_movies(session, movies_data)
+            started = time.perf_counter()
+            total_movies = insert_movies(session, movies_data)
+            elapsed = time.perf_counter() - started
             
             if total_movies == 0:
                 logger.warning("영화 데이터 삽입 실패: 모든 레코드가 실패했습니다.")
@@ -253,12 +342,13 @@ def seed_database_if_empty():
                     session.rollback()
                     return
             else:
-                logger.info(f"영화 {total_movies}개 삽입 완료")
+                logger.info(f"영화 {total_movies}개 삽입 완료 ({elapsed:.3f}s)")
         
         # 최소 1건 이상 성공 시 커밋
         if total_theaters > 0 or total_movies > 0:
+            started = time.perf_counter()
             session.commit()
-            logger.info(f"시드 완료: 극장 {total_theaters}개, 영화 {total_movies}개")
+            logger.info(f"시드 완료: 극장 {total_theaters}개, 영화 {total_movies}개 (커밋 {time.perf_counter() - started:.3f}s)")
         else:
             session.rollback()
             logger.error("시드 실패: 삽입된 레코드가 없습니다.")
@@ -1,34 +1,197 @@
 """데이터베이스 세션 및 엔진 관리"""
-from contextlib import contextmanager
-from typing import Generator
+import logging
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator, Optional
 
 from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from movie_catalog_backend.config import is_metrics_enabled
+from movie_catalog_backend.db.config import (
+    get_async_database_url,
+    get_database_url,
+    get_pool_settings,
+    get_read_database_url,
+    get_read_pool_settings,
+    get_slow_query_threshold_ms,
+    get_sqlite_pragmas,
+    to_async_url,
+)
+from movie_catalog_backend.db.migrations import run_migrations
+from movie_catalog_backend.metrics import DB_POOL_CHECKOUT_WAIT, DB_STATEMENT_DURATION, statement_operation
+from movie_catalog_backend.entity import models  # noqa: F401  (create_all 대상 테이블 등록)
+
+slow_query_logger = logging.getLogger("movie_catalog_backend.db.slow_query")
+
+
+def _is_sqlite(url: str) -> bool:
+    """SQLite URL 여부"""
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    """SQLite 인메모리 DB 여부 (풀 크기 설정 불가)"""
+    database = make_url(url).database
+    return not database or database == ":memory:" or "mode=memory" in url
 
-from movie_catalog_backend.db.config import get_database_url
+
+def _engine_options(url: str, pool_settings: dict) -> dict:
+    """DB 종류에 맞는 엔진 옵션 구성"""
+    options: dict = {"echo": False}
+    if _is_sqlite(url):
+        options["connect_args"] = {"check_same_thread": False}  # SQLite용 설정
+    if not (_is_sqlite(url) and _is_sqlite_memory(url)):
+        options.update(pool_settings)
+    return options
 
 
 # 엔진 생성
+# - engine: 동기 엔진 (init_db, 시드 등 요청 경로 밖의 작업)
+# - async_engine: 비동기 엔진 (API 요청 경로의 쓰기 서비스 함수)
+# - async_read_engine: 읽기 전용 비동기 엔진 (GET 서비스 함수, 별도 풀)
+#   DATABASE_READ_URL 또는 SQLite mode=ro URI가 없으면 async_engine과 같은 객체
 DATABASE_URL = get_database_url()
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},  # SQLite용 설정
-    echo=False
-)
+ASYNC_DATABASE_URL = get_async_database_url(DATABASE_URL)
+READ_DATABASE_URL = get_read_database_url(DATABASE_URL)
+SQLITE_PRAGMAS = get_sqlite_pragmas()
+engine = create_engine(DATABASE_URL, **_engine_options(DATABASE_URL, get_pool_settings()))
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_engine_options(ASYNC_DATABASE_URL, get_pool_settings()))
+if READ_DATABASE_URL:
+    ASYNC_READ_DATABASE_URL = to_async_url(READ_DATABASE_URL)
+    async_read_engine = create_async_engine(
+        ASYNC_READ_DATABASE_URL,
+        **_engine_options(ASYNC_READ_DATABASE_URL, get_read_pool_settings())
+    )
+else:
+    ASYNC_READ_DATABASE_URL = ASYNC_DATABASE_URL
+    async_read_engine = async_engine
 
 
-# SQLite에서 외래 키 제약 활성화
-@event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_conn, connection_record):
     """SQLite PRAGMA 설정"""
     cursor = dbapi_conn.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+def set_sqlite_read_pragma(dbapi_conn, connection_record):
+    """읽기 전용 SQLite PRAGMA 설정 (저널 모드는 기본 엔진이 정하므로 변경하지 않음)"""
+    cursor = dbapi_conn.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        if name != "journal_mode":
+            cursor.execute(f"PRAGMA {name}={value}")
     cursor.close()
 
 
+# SQLite에서 외래 키 제약 및 성능 PRAGMA 적용
+if _is_sqlite(DATABASE_URL):
+    event.listen(engine, "connect", set_sqlite_pragma)
+    event.listen(async_engine.sync_engine, "connect", set_sqlite_pragma)
+if async_read_engine is not async_engine and _is_sqlite(ASYNC_READ_DATABASE_URL):
+    event.listen(async_read_engine.sync_engine, "connect", set_sqlite_read_pragma)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """SQL 실행 시작 시각 기록 (문장별 실행 컨텍스트에 저장하므로 실패한 문장이 남기는 값 없음)"""
+    context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """SQL 실행 시간 기록 및 느린 쿼리 로그"""
+    elapsed = time.perf_counter() - context._query_started_at
+    if METRICS_ENABLED:
+        DB_STATEMENT_DURATION.labels(operation=statement_operation(statement)).observe(elapsed)
+    if SLOW_QUERY_THRESHOLD_MS and elapsed * 1000 >= SLOW_QUERY_THRESHOLD_MS:
+        _log_slow_query(conn, statement, parameters, executemany, elapsed)
+
+
+def _explain_query_plan(conn, statement: str, parameters) -> str:
+    """SQLite 실행 계획 조회 (같은 DBAPI 커넥션에서 실행, 실패 시 사유 반환)"""
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        # 결과 행: (id, parent, notused, detail)
+        return "\n".join(f"  {row[3]}" for row in cursor.fetchall())
+    except Exception as e:
+        return f"  (실행 계획 조회 실패: {e})"
+    finally:
+        cursor.close()
+
+
+def _log_slow_query(conn, statement: str, parameters, executemany: bool, elapsed: float) -> None:
+    """기준 시간을 넘은 SQL 문을 파라미터, 실행 계획과 함께 경고 로그로 기록"""
+    message = f"느린 쿼리 {elapsed * 1000:.1f}ms\nSQL: {statement}"
+    if executemany:
+        message += f"\n파라미터: {len(parameters)}건 (executemany)"
+    else:
+        message += f"\n파라미터: {parameters!r}"
+        if conn.dialect.name == "sqlite" and statement_operation(statement) != "OTHER":
+            message += f"\n실행 계획:\n{_explain_query_plan(conn, statement, parameters)}"
+    slow_query_logger.warning(message)
+
+
+# SQL 문 실행 시간 측정/느린 쿼리 로그 (동기/비동기 엔진 공통)
+METRICS_ENABLED = is_metrics_enabled()
+SLOW_QUERY_THRESHOLD_MS = get_slow_query_threshold_ms()
+if METRICS_ENABLED or SLOW_QUERY_THRESHOLD_MS:
+    for _target in {engine, async_engine.sync_engine, async_read_engine.sync_engine}:
+        event.listen(_target, "before_cursor_execute", _before_cursor_execute)
+        event.listen(_target, "after_cursor_execute", _after_cursor_execute)
+
+
+async def dispose_async_engines() -> None:
+    """비동기 엔진(쓰기/읽기) 커넥션 풀 정리"""
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+
+
+class PoolWaitTracker:
+    """최근 커넥션 풀 체크아웃 대기 시간 추정 (프로세스별, 과부하 판단용)
+
+    관측값의 지수 이동 평균을 유지하되, 관측이 없는 동안에는 반감기마다 절반으로
+    줄어든다. 과부하로 요청을 거절해 관측이 끊겨도 추정값이 높은 채로 남지 않는다.
+    """
+
+    def __init__(self, weight: float = 0.2, half_life: float = 1.0):
+        self.weight = weight
+        self.half_life = half_life
+        self._value = 0.0
+        self._updated = time.monotonic()
+
+    def observe(self, seconds: float) -> None:
+        """체크아웃 대기 시간 1건 반영"""
+        now = time.monotonic()
+        current = self.current(now)
+        self._value = current + self.weight * (seconds - current)
+        self._updated = now
+
+    def current(self, now: Optional[float] = None) -> float:
+        """현재 추정 대기 시간 (초)"""
+        elapsed = (time.monotonic() if now is None else now) - self._updated
+        return self._value * 0.5 ** (max(0.0, elapsed) / self.half_life)
+
+
+pool_wait_tracker = PoolWaitTracker()
+
+
+def _observe_pool_wait(engine_name: str, started: float) -> None:
+    """풀 체크아웃 대기 시간 기록 (메트릭 + 과부하 판단용 추정값)"""
+    elapsed = time.perf_counter() - started
+    DB_POOL_CHECKOUT_WAIT.labels(engine=engine_name).observe(elapsed)
+    pool_wait_tracker.observe(elapsed)
+
+
 def init_db():
-    """데이터베이스 테이블 생성"""
+    """데이터베이스 테이블 생성 및 스키마 마이그레이션 적용"""
     SQLModel.metadata.create_all(engine)
+    run_migrations(engine)
 
 
 @contextmanager
@@ -36,6 +199,11 @@ def session_scope() -> Generator[Session, None, None]:
     """데이터베이스 세션 컨텍스트 매니저"""
     session = Session(engine)
     try:
+        # 커넥션을 먼저 확보하여 풀 체크아웃 대기 시간 측정
+        started = time.perf_counter()
+        session.connection()
+        _observe_pool_wait("sync", started)
+        
         yield session
         session.commit()
     except Exception:
@@ -44,3 +212,42 @@ def session_scope() -> Generator[Session, None, None]:
     finally:
         session.close()
 
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 데이터베이스 세션 컨텍스트 매니저"""
+    session = AsyncSession(async_engine)
+    try:
+        # 커넥션을 먼저 확보하여 풀 체크아웃 대기 시간 측정
+        started = time.perf_counter()
+        await session.connection()
+        _observe_pool_wait("async", started)
+        
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+@asynccontextmanager
+async def async_read_session_scope() -> AsyncGenerator[AsyncSession, None]:
+    """읽기 전용 비동기 세션 컨텍스트 매니저 (읽기 엔진 사용, 커밋하지 않음)
+
+    GET 서비스 함수 전용이다. 읽기 엔진은 쓰기 엔진과 풀이 분리되어 있어
+    쓰기 잠금/풀 대기와 무관하게 조회할 수 있다. 별도 읽기 DB(복제본)를 쓰는 경우
+    직전 쓰기가 아직 반영되지 않았을 수 있다.
+    """
+    session = AsyncSession(async_read_engine)
+    try:
+        # 커넥션을 먼저 확보하여 풀 체크아웃 대기 시간 측정
+        started = time.perf_counter()
+        await session.connection()
+        _observe_pool_wait("read", started)
+        
+        yield session
+    finally:
+        await session.close()
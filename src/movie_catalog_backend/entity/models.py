@@ -19,10 +19,10 @@ class Movie(SQLModel, table=True):
     __tablename__ = "movie"
     
     id: str = Field(primary_key=True)
-    title: str = Field(nullable=False)
+    title: str = Field(nullable=False, index=True)
     distributor: str = Field(nullable=False)
     ticket_price: int = Field(ge=0, nullable=False)
     runtime_minutes: int = Field(ge=0, nullable=False)
-    genre: str = Field(nullable=False)
-    theater_id: str = Field(foreign_key="theater.id", nullable=False)
+    genre: str = Field(nullable=False, index=True)
+    theater_id: str = Field(foreign_key="theater.id", nullable=False, index=True)
 
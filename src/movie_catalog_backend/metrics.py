@@ -0,0 +1,126 @@
+"""Prometheus 메트릭 정의 및 수집
+
+- HTTP: 라우트 템플릿별 요청 수/지연 시간/응답 크기, 처리 중 요청 수, 거절한 요청 수
+- DB: SQL 문 실행 시간(문 종류별), 커넥션 풀 체크아웃 대기 시간(엔진별)
+- 캐시: 서비스 조회 캐시 통계 (수집 시점에 읽음)
+
+멀티 워커 실행 시 PROMETHEUS_MULTIPROC_DIR을 설정하면 워커들의 값이 합산되어
+노출된다 (운영 모드에서는 미설정 시 임시 디렉터리를 자동 지정).
+"""
+import os
+from typing import Iterator
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+from movie_catalog_backend.service.cache import get_cache_stats
+
+# 지연 시간 버킷 (초): 서브 밀리초 SQL부터 수 초 걸리는 내보내기까지
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 응답 크기 버킷 (바이트): 단건 응답부터 전체 목록까지
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP 요청 수",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (초)",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP 응답 본문 크기 (바이트, 압축 후)",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "처리 중인 HTTP 요청 수 (라우팅 전에 증가하므로 메서드별)",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+HTTP_REQUESTS_REJECTED = Counter(
+    "http_requests_rejected_total",
+    "속도 제한/과부하로 거절한 요청 수 (reason: rate_limit | in_flight | pool_wait)",
+    ["reason"],
+)
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "SQL 문 실행 시간 (초)",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "세션 시작 시 커넥션 풀 체크아웃 대기 시간 (초, engine: sync | async | read)",
+    ["engine"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+class CacheStatsCollector(Collector):
+    """서비스 조회 캐시 통계를 수집 시점에 메트릭으로 변환 (프로세스별 값)"""
+
+    def collect(self) -> Iterator:
+        size = GaugeMetricFamily("cache_entries", "캐시 항목 수", labels=["cache"])
+        hits = CounterMetricFamily("cache_hits", "캐시 적중 수", labels=["cache"])
+        misses = CounterMetricFamily("cache_misses", "캐시 미스 수", labels=["cache"])
+        evictions = CounterMetricFamily("cache_evictions", "LRU 제거 수", labels=["cache"])
+        for stats in get_cache_stats():
+            hits.add_metric([stats["name"]], stats["hits"])
+            misses.add_metric([stats["name"]], stats["misses"])
+            # 항목 수/제거 수는 memory 저장소에서만 제공
+            if stats["size"] is not None:
+                size.add_metric([stats["name"]], stats["size"])
+            if stats["evictions"] is not None:
+                evictions.add_metric([stats["name"]], stats["evictions"])
+        yield from (size, hits, misses, evictions)
+
+
+_cache_collector = CacheStatsCollector()
+
+
+def _is_multiprocess() -> bool:
+    """멀티 프로세스 수집 모드 여부"""
+    return bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+
+if not _is_multiprocess():
+    REGISTRY.register(_cache_collector)
+
+
+def statement_operation(statement: str) -> str:
+    """SQL 문 종류 (메트릭 라벨 수 제한을 위해 첫 키워드만 사용)"""
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword in ("SELECT", "INSERT", "UPDATE", "DELETE") else "OTHER"
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """노출 형식으로 메트릭 직렬화 (본문, Content-Type)"""
+    if _is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        registry.register(_cache_collector)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """워커 종료 시 livesum 게이지 등 해당 프로세스의 값 정리 (멀티 프로세스 모드)"""
+    if _is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,58 @@
+"""과부하 시 요청 거절(load shedding) 미들웨어
+
+요청을 대기열에 쌓으면 과부하 동안 모든 요청의 지연 시간이 함께 늘어난다.
+대신 다음 조건에서는 처리하지 않고 바로 503과 Retry-After로 응답하여, 받아들인
+요청의 꼬리 지연 시간을 일정하게 유지한다.
+
+- 처리 중인 요청 수(워커별)가 상한에 도달
+- 최근 DB 커넥션 풀 체크아웃 대기 시간 추정값(`db.session.pool_wait_tracker`)이 기준 초과
+"""
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from movie_catalog_backend.db.session import pool_wait_tracker
+from movie_catalog_backend.metrics import HTTP_REQUESTS_REJECTED
+from movie_catalog_backend.middleware.rate_limit import reject
+
+
+class AdmissionControlMiddleware:
+    """동시 처리 수/풀 대기 기반 요청 거절 ASGI 미들웨어 (0이면 해당 조건 사용 안 함)"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_in_flight: int = 0,
+        max_pool_wait: float = 0.0,
+        retry_after: int = 1,
+        exclude_paths: tuple = ("/metrics",)
+    ):
+        self.app = app
+        self.max_in_flight = max_in_flight
+        self.max_pool_wait = max_pool_wait
+        self.retry_after = retry_after
+        self.exclude_paths = exclude_paths
+        self._in_flight = 0
+
+    def _overload_reason(self) -> str:
+        """거절 사유 (과부하가 아니면 빈 문자열)"""
+        if self.max_in_flight and self._in_flight >= self.max_in_flight:
+            return "in_flight"
+        if self.max_pool_wait and pool_wait_tracker.current() > self.max_pool_wait:
+            return "pool_wait"
+        return ""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        reason = self._overload_reason()
+        if reason:
+            HTTP_REQUESTS_REJECTED.labels(reason=reason).inc()
+            await reject(503, "Service Unavailable", self.retry_after)(scope, receive, send)
+            return
+
+        self._in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._in_flight -= 1
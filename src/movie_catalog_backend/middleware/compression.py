@@ -0,0 +1,211 @@
+"""응답 압축 미들웨어 (Accept-Encoding 협상: zstd / br / gzip)
+
+gzip은 표준 라이브러리로 항상 지원하고, brotli/zstd는 해당 패키지
+(`pip install movie-catalog-backend[compression]`)가 설치된 경우에만 사용한다.
+
+- 본문이 한 번에 전달되는 응답은 최소 크기 미만이면 압축하지 않는다.
+- 스트리밍 응답(내보내기 등)은 크기를 미리 알 수 없으므로 청크마다 압축 후 flush한다.
+- 이미 Content-Encoding이 있거나 본문이 없는 상태(204/304 등)는 건드리지 않는다.
+- 인코딩이 협상된 요청에서는 압축 대상 응답과 304 응답의 강한 ETag를 약한 ETag로 바꾼다.
+  압축 여부(최소 크기)와 무관하게 바꾸므로 같은 요청의 200과 304가 항상 같은 ETag를 가진다
+  (조건부 GET은 약한 비교이므로 인코딩이 달라도 유지).
+"""
+import zlib
+from typing import Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+# 압축할 Content-Type (JSON/텍스트 계열만, 이미지 등 압축된 형식 제외)
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+# 클라이언트 q 값이 같을 때의 서버 선호 순서
+_PREFERENCE = ("zstd", "br", "gzip")
+
+
+class _Compressor:
+    """인코딩별 스트리밍 압축기 공통 인터페이스 (compress / flush / finish)"""
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+        elif encoding == "br":
+            self._obj = brotli.Compressor(quality=level)
+        else:
+            # wbits=31: gzip 헤더/트레일러 포함
+            self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        """입력 압축 (내부 버퍼에 남은 데이터는 flush/finish 시 출력)"""
+        if self.encoding == "br":
+            return self._obj.process(data)
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        """지금까지의 입력을 모두 출력 (스트림은 계속)"""
+        if self.encoding == "zstd":
+            return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        if self.encoding == "br":
+            return self._obj.flush()
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        """스트림 종료 (남은 데이터와 트레일러 출력)"""
+        if self.encoding == "br":
+            return self._obj.finish()
+        return self._obj.flush()
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    """강한 ETag를 약한 ETag로 변경 (인코딩에 따라 본문 바이트가 달라지므로)"""
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+def available_encodings() -> List[str]:
+    """설치된 패키지 기준 지원 인코딩 (서버 선호 순서)"""
+    installed = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    return [encoding for encoding in _PREFERENCE if installed[encoding]]
+
+
+def negotiate_encoding(accept_encoding: str, supported: List[str]) -> Optional[str]:
+    """Accept-Encoding 헤더와 지원 인코딩으로 사용할 인코딩 결정 (없으면 None)"""
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionMiddleware:
+    """Accept-Encoding 협상 기반 응답 압축 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, levels: Optional[Dict[str, int]] = None):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": 6, "br": 4, "zstd": 3, **(levels or {})}
+        self.supported = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.supported)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.levels[encoding], self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """응답 메시지를 가로채 압축 여부를 결정하고 본문을 압축하여 전달"""
+
+    def __init__(self, send: Send, encoding: str, level: int, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.level = level
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # 본문 첫 메시지를 보고 압축 여부를 정하므로 시작 메시지는 보류
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] < 200
+                or message["status"] in (204, 304)
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            )
+            if not self.passthrough or message["status"] == 304:
+                # 압축 여부와 무관하게 캐시가 인코딩별로 구분하도록 표시 (304도 200과 같은 ETag)
+                headers = MutableHeaders(raw=message["headers"])
+                headers.add_vary_header("Accept-Encoding")
+                _weaken_etag(headers)
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.passthrough:
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            if not more_body and len(body) < self.minimum_size:
+                # 작은 단일 본문: 압축하지 않음
+                self.passthrough = True
+                await self._flush_start()
+                await self._send(message)
+                return
+            self._begin_compression(streaming=more_body)
+
+        if more_body:
+            chunk = self.compressor.compress(body) + self.compressor.flush()
+            await self._flush_start()
+            if chunk:
+                await self._send({"type": "http.response.body", "body": chunk, "more_body": True})
+            return
+
+        chunk = self.compressor.compress(body) + self.compressor.finish()
+        if self.start_message is not None:
+            # 단일 본문: 압축 결과 크기로 Content-Length 설정
+            MutableHeaders(raw=self.start_message["headers"])["Content-Length"] = str(len(chunk))
+        await self._flush_start()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": False})
+
+    def _begin_compression(self, streaming: bool) -> None:
+        """압축 응답 헤더 설정 및 압축기 생성"""
+        self.compressor = _Compressor(self.encoding, self.level)
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        if streaming and "content-length" in headers:
+            # 전체 압축 크기를 알 수 없으므로 chunked 전송
+            del headers["Content-Length"]
+
+    async def _flush_start(self) -> None:
+        """보류 중인 시작 메시지 전송 (1회)"""
+        if self.start_message is not None:
+            await self._send(self.start_message)
+            self.start_message = None
@@ -0,0 +1,59 @@
+"""HTTP 요청 메트릭 수집 미들웨어
+
+라벨은 실제 경로 대신 라우트 템플릿(`/movies/{movie_id}`)을 사용하여 카디널리티를
+제한한다. 라우트에 매칭되지 않은 요청은 `unmatched`로 집계한다.
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from movie_catalog_backend.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_PROGRESS,
+    HTTP_RESPONSE_SIZE,
+)
+
+
+def _route_template(scope: Scope) -> str:
+    """라우팅 후 scope에 기록된 라우트의 경로 템플릿"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """요청 수/지연 시간/응답 크기/처리 중 요청 수 수집 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp, exclude_paths: tuple = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            route = _route_template(scope)
+            HTTP_REQUESTS.labels(method=method, route=route, status=str(status_code)).inc()
+            HTTP_REQUEST_DURATION.labels(method=method, route=route).observe(elapsed)
+            HTTP_RESPONSE_SIZE.labels(method=method, route=route).observe(response_size)
@@ -0,0 +1,94 @@
+"""요청 단위 프로파일링 미들웨어 (opt-in, cProfile)
+
+샘플링 비율(PROFILE_SAMPLE_RATE) 또는 토큰 헤더(`X-Profile: <PROFILE_TOKEN>`)로
+선택된 요청을 cProfile로 측정하고 `.prof` 파일(pstats 형식)로 저장한다.
+`python -m pstats <파일>` 또는 snakeviz 등으로 분석한다.
+
+cProfile은 스레드 단위로 동작하므로 같은 이벤트 루프에서 동시에 처리되는 다른
+요청의 코루틴 실행 시간도 함께 기록될 수 있다. 한 번에 하나의 요청만 프로파일링한다.
+"""
+import cProfile
+import hmac
+import logging
+import os
+import random
+import re
+import time
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile"
+
+
+class ProfilingMiddleware:
+    """샘플링/헤더 트리거 요청 프로파일링 ASGI 미들웨어"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 0.0,
+        token: str = "",
+        profile_dir: str = "profiles",
+        exclude_paths: tuple = ("/metrics",)
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.token = token
+        self.profile_dir = profile_dir
+        self.exclude_paths = exclude_paths
+        self._active = False
+
+    def _should_profile(self, scope: Scope) -> bool:
+        """프로파일링 대상 요청 여부 (헤더 토큰 일치 또는 샘플링)"""
+        if self.token:
+            value = Headers(scope=scope).get(PROFILE_HEADER)
+            if value is not None and hmac.compare_digest(value, self.token):
+                return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] in self.exclude_paths
+            or self._active
+            or not self._should_profile(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        status_code: Optional[int] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        self._active = True
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.disable()
+            self._active = False
+            self._save(profiler, scope, status_code, time.perf_counter() - started)
+
+    def _save(self, profiler: cProfile.Profile, scope: Scope, status_code: Optional[int], elapsed: float) -> None:
+        """프로파일 결과 저장 (파일명: 시각-메서드-라우트-pid.prof)"""
+        route = getattr(scope.get("route"), "path", None) or scope["path"]
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+        filename = f"{time.strftime('%Y%m%dT%H%M%S')}-{scope['method']}-{slug}-{os.getpid()}.prof"
+        path = os.path.join(self.profile_dir, filename)
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            profiler.dump_stats(path)
+        except OSError as e:
+            logger.warning(f"프로파일 저장 실패: {e}")
+            return
+        logger.info(f"프로파일 저장: {scope['method']} {route} {status_code} {elapsed * 1000:.1f}ms -> {path}")
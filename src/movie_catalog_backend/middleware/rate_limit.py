@@ -0,0 +1,212 @@
+"""클라이언트/라우트별 요청 속도 제한 미들웨어 (토큰 버킷)
+
+버킷은 (클라이언트, 메서드 + 라우트 템플릿)마다 하나다. 버킷은 초당 rate개씩
+최대 burst개까지 토큰이 차고, 요청마다 1개를 쓴다. 토큰이 없으면 다음 토큰이 찰
+때까지의 시간을 Retry-After로 알려 주며 429로 응답한다.
+
+- memory: 워커 프로세스 안에 버킷 보관 (워커마다 따로 제한)
+- redis: Lua 스크립트로 Redis에서 원자적으로 버킷 갱신 (모든 워커/노드가 공유)
+
+저장소 장애 시에는 요청을 허용한다 (제한보다 가용성 우선). redis 저장소 호출은
+스레드 풀에서 실행하여 느린 Redis가 이벤트 루프를 막지 않게 한다.
+"""
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+from fastapi.responses import JSONResponse
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from movie_catalog_backend.config import get_cache_key_prefix, get_cache_redis_timeout, get_rate_limit_redis_url
+from movie_catalog_backend.metrics import HTTP_REQUESTS_REJECTED
+from movie_catalog_backend.redis_client import RedisClient, RedisError
+
+logger = logging.getLogger(__name__)
+
+# memory 저장소가 보관하는 최대 버킷 수 (초과 시 가장 오래 쓰지 않은 버킷 제거)
+MAX_MEMORY_BUCKETS = 100_000
+
+# 저장소 장애 경고 로그 최소 간격 (초)
+_WARNING_INTERVAL = 30.0
+
+
+class RateLimitStore(ABC):
+    """토큰 버킷 저장소 인터페이스"""
+
+    name = "base"
+    # 호출이 I/O로 블로킹되는지 여부 (true면 스레드 풀에서 실행)
+    blocking = False
+
+    @abstractmethod
+    def take(self, key: str, rate: float, burst: float) -> float:
+        """토큰 1개 사용 시도 (허용되면 0, 거절되면 다음 토큰까지 남은 초)"""
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """프로세스 내 토큰 버킷 (LRU로 버킷 수 제한)"""
+
+    name = "memory"
+
+    def __init__(self, max_buckets: int = MAX_MEMORY_BUCKETS):
+        self.max_buckets = max_buckets
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def take(self, key: str, rate: float, burst: float) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated) * rate)
+
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_buckets:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """Redis 공유 토큰 버킷 (해시 1개당 버킷 1개, 서버 시간 기준)"""
+
+    name = "redis"
+    blocking = True
+
+    # 서버 시간(TIME)을 쓰므로 노드 간 시계 차이의 영향을 받지 않는다.
+    # 버킷이 가득 찰 시간이 지나면 키가 만료되어 메모리를 반환한다.
+    SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or burst
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+    def __init__(self, client: RedisClient, prefix: str):
+        self.client = client
+        self.prefix = prefix
+        self._sha = hashlib.sha1(self.SCRIPT.encode("utf-8")).hexdigest()
+
+    def take(self, key: str, rate: float, burst: float) -> float:
+        args = (1, f"{self.prefix}:{key}", rate, burst)
+        try:
+            reply = self.client.execute("EVALSHA", self._sha, *args)
+        except RedisError as e:
+            # 서버에 스크립트가 아직 없으면 본문과 함께 실행 (이후에는 SHA로 실행)
+            if not str(e).startswith("NOSCRIPT"):
+                raise
+            reply = self.client.execute("EVAL", self.SCRIPT, *args)
+        return float(reply)
+
+
+def create_rate_limit_store(kind: str) -> RateLimitStore:
+    """환경변수 설정으로 속도 제한 저장소 생성"""
+    if kind == "redis":
+        client = RedisClient(get_rate_limit_redis_url(), timeout=get_cache_redis_timeout())
+        return RedisRateLimitStore(client, f"{get_cache_key_prefix()}:ratelimit")
+    return MemoryRateLimitStore()
+
+
+def reject(status_code: int, detail: str, retry_after: float) -> JSONResponse:
+    """거절 응답 (Retry-After는 올림한 정수 초)"""
+    return JSONResponse(
+        {"detail": detail},
+        status_code=status_code,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+    )
+
+
+class RateLimitMiddleware:
+    """클라이언트/라우트별 토큰 버킷 속도 제한 ASGI 미들웨어
+
+    라우팅 전에 동작하므로 라우트 템플릿은 라우트 목록과 Starlette의 `route.matches`로 직접
+    대조해 구한다. 라우트 목록은 경로 템플릿(`path`)이 있는 라우트여야 하므로 앱에 포함된
+    APIRouter들의 라우트를 넘긴다 (FastAPI 버전에 따라 `app.router.routes`에는 포함된 라우터가
+    경로 없는 묶음으로 들어 있음).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: List[BaseRoute],
+        store: RateLimitStore,
+        default_limit: Tuple[float, float],
+        route_limits: Dict[str, Tuple[float, float]],
+        trust_forwarded_for: bool = False,
+        exclude_paths: tuple = ("/metrics",)
+    ):
+        self.app = app
+        self.routes = routes
+        self.store = store
+        self.default_limit = default_limit
+        self.route_limits = route_limits
+        self.trust_forwarded_for = trust_forwarded_for
+        self.exclude_paths = exclude_paths
+        self._last_warning = 0.0
+
+    def _route_template(self, scope: Scope) -> str:
+        """요청 경로에 매칭되는 라우트 템플릿 (메서드만 다른 경우도 같은 라우트로 취급)"""
+        partial = None
+        for route in self.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+            if match == Match.PARTIAL and partial is None:
+                partial = route.path
+        return partial or "unmatched"
+
+    def _client(self, scope: Scope) -> str:
+        """클라이언트 식별자 (기본: 접속 주소, 설정 시 X-Forwarded-For 첫 주소)"""
+        if self.trust_forwarded_for:
+            for name, value in scope["headers"]:
+                if name == b"x-forwarded-for":
+                    return value.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    async def _take(self, key: str, rate: float, burst: float) -> float:
+        try:
+            if self.store.blocking:
+                return await asyncio.to_thread(self.store.take, key, rate, burst)
+            return self.store.take(key, rate, burst)
+        except RedisError as e:
+            now = time.monotonic()
+            if now - self._last_warning >= _WARNING_INTERVAL:
+                self._last_warning = now
+                logger.warning(f"속도 제한 저장소 오류, 제한 없이 허용합니다: {e}")
+            return 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        route = f"{scope['method']} {self._route_template(scope)}"
+        rate, burst = self.route_limits.get(route, self.default_limit)
+        wait = await self._take(f"{self._client(scope)}|{route}", rate, burst)
+        if wait > 0:
+            HTTP_REQUESTS_REJECTED.labels(reason="rate_limit").inc()
+            await reject(429, "Too Many Requests", wait)(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,160 @@
+"""최소 Redis 클라이언트 (RESP2 프로토콜, 외부 의존성 없음)
+
+공유 캐시/버전 스탬프 등 단순 명령만 필요하므로 redis-py 대신 소켓 위에
+RESP2 요청/응답만 구현한다. Redis 프로토콜을 말하는 어떤 서버(KeyDB, Valkey,
+테스트용 로컬 대역 서버 등)와도 동작한다.
+
+호출은 동기/블로킹이며 짧은 타임아웃을 둔다 (비동기 코드에서는 스레드 풀에서 호출).
+연결 오류나 타임아웃은 `RedisError`로 전달되고, 재연결 대기 시간 동안의 호출은
+서버에 접속을 시도하지 않고 바로 실패한다 (장애 중 호출마다 타임아웃만큼 막히지 않도록).
+"""
+import os
+import socket
+import threading
+import time
+from typing import Any, List, Optional, Union
+from urllib.parse import unquote, urlparse
+
+# 응답 읽기 단위 (바이트)
+_READ_SIZE = 64 * 1024
+
+
+class RedisError(Exception):
+    """Redis 연결/프로토콜 오류 또는 서버 오류 응답"""
+
+
+class RedisClient:
+    """스레드 안전 단일 연결 RESP2 클라이언트
+
+    `redis://[:password@]host[:port][/db]` 형식의 URL을 받는다.
+    """
+
+    def __init__(self, url: str, timeout: float = 0.5, retry_interval: float = 1.0):
+        parsed = urlparse(url)
+        if parsed.scheme != "redis":
+            raise ValueError(f"지원하지 않는 Redis URL: {url}")
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+        self._retry_at = 0.0
+        self._sock: Optional[socket.socket] = None
+        self._buffer = b""
+        self._pid = 0
+        self._lock = threading.Lock()
+
+    def execute(self, *args: Union[str, bytes, int, float]) -> Any:
+        """명령 1개 실행 후 응답 반환 (서버 오류 응답은 RedisError 발생)"""
+        reply = self.pipeline([args])[0]
+        if isinstance(reply, RedisError):
+            raise reply
+        return reply
+
+    def pipeline(self, commands: List[tuple]) -> List[Any]:
+        """여러 명령을 한 번에 전송하고 응답을 순서대로 반환 (왕복 1회)
+
+        서버 오류 응답(-ERR ...)은 해당 위치에 RedisError 객체로 담긴다.
+        """
+        payload = b"".join(self._encode(command) for command in commands)
+        with self._lock:
+            if self._sock is None and time.monotonic() < self._retry_at:
+                raise RedisError(f"Redis 재연결 대기 중 ({self.host}:{self.port})")
+            try:
+                sock = self._connect()
+                sock.sendall(payload)
+                return [self._read_reply() for _ in commands]
+            except (OSError, RedisError) as e:
+                self._close()
+                self._retry_at = time.monotonic() + self.retry_interval
+                if isinstance(e, RedisError):
+                    raise
+                raise RedisError(f"Redis 통신 실패 ({self.host}:{self.port}): {e}") from e
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            self._close()
+
+    def _connect(self) -> socket.socket:
+        # 포크된 자식 프로세스는 부모의 소켓을 공유하지 않도록 새로 연결
+        if self._sock is not None and self._pid == os.getpid():
+            return self._sock
+
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock, self._buffer, self._pid = sock, b"", os.getpid()
+
+        setup = []
+        if self.password:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            sock.sendall(b"".join(self._encode(command) for command in setup))
+            for _ in setup:
+                reply = self._read_reply()
+                if isinstance(reply, RedisError):
+                    raise reply
+        return sock
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock, self._buffer = None, b""
+
+    @staticmethod
+    def _encode(command: tuple) -> bytes:
+        """명령을 RESP 배열(bulk string 목록)로 인코딩"""
+        parts = [b"*%d\r\n" % len(command)]
+        for arg in command:
+            if isinstance(arg, bytes):
+                data = arg
+            elif isinstance(arg, str):
+                data = arg.encode("utf-8")
+            else:
+                data = str(arg).encode("ascii")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    def _read_line(self) -> bytes:
+        while True:
+            index = self._buffer.find(b"\r\n")
+            if index >= 0:
+                line, self._buffer = self._buffer[:index], self._buffer[index + 2:]
+                return line
+            self._fill()
+
+    def _read_exact(self, size: int) -> bytes:
+        while len(self._buffer) < size + 2:
+            self._fill()
+        data, self._buffer = self._buffer[:size], self._buffer[size + 2:]
+        return data
+
+    def _fill(self) -> None:
+        chunk = self._sock.recv(_READ_SIZE)
+        if not chunk:
+            raise RedisError("Redis 연결이 끊어졌습니다")
+        self._buffer += chunk
+
+    def _read_reply(self) -> Any:
+        """RESP2 응답 1개 파싱 (+단순 문자열, -오류, :정수, $bulk, *배열)"""
+        line = self._read_line()
+        kind, rest = line[:1], line[1:]
+        if kind == b"+":
+            return rest.decode("utf-8")
+        if kind == b"-":
+            return RedisError(rest.decode("utf-8"))
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            size = int(rest)
+            return None if size < 0 else self._read_exact(size)
+        if kind == b"*":
+            count = int(rest)
+            return None if count < 0 else [self._read_reply() for _ in range(count)]
+        raise RedisError(f"알 수 없는 RESP 응답: {line[:50]!r}")
@@ -0,0 +1,49 @@
+"""조건부 GET (ETag / If-None-Match) 및 Cache-Control 처리"""
+from typing import Callable, Dict
+
+from fastapi import HTTPException, Request, Response, status
+
+from movie_catalog_backend.config import get_cache_control, is_process_local_cache_safe
+from movie_catalog_backend.service.versioning import compute_etag
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)"""
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(
+        candidate == "*" or candidate.removeprefix("W/") == etag
+        for candidate in candidates
+    )
+
+
+def conditional_get(*tables: str) -> Callable:
+    """조건부 GET 의존성 생성
+
+    관련 테이블 버전으로 ETag를 계산해 If-None-Match와 일치하면 핸들러 실행
+    전에 304를 반환하고, 아니면 응답에 ETag와 Cache-Control을 설정한다.
+    Response 객체를 직접 반환하는 핸들러는 의존성 반환값(헤더)을 사용한다.
+    데이터 버전이 워커마다 따로 관리되면(memory 저장소 + 워커 여러 개) ETag 없이
+    Cache-Control만 설정한다 (다른 워커의 쓰기 후에도 304가 나가지 않도록).
+    """
+    etag_enabled = is_process_local_cache_safe()
+
+    async def dependency(request: Request, response: Response) -> Dict[str, str]:
+        if not etag_enabled:
+            headers = {"Cache-Control": get_cache_control()}
+            response.headers.update(headers)
+            return headers
+
+        resource = request.url.path
+        if request.url.query:
+            resource = f"{resource}?{request.url.query}"
+        etag = await compute_etag(tables, resource)
+        headers = {"ETag": etag, "Cache-Control": get_cache_control()}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        response.headers.update(headers)
+        return headers
+
+    return dependency
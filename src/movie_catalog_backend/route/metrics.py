@@ -0,0 +1,13 @@
+"""Prometheus 메트릭 노출 라우터"""
+from fastapi import APIRouter, Response
+
+from movie_catalog_backend.metrics import render_metrics
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 텍스트 노출 형식의 메트릭"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -1,41 +1,138 @@
 """Movie API 라우터"""
-from typing import List, Optional
+from typing import List, Literal, Optional, Union
 
-from fastapi import APIRouter, Query, Response, status
+from fastapi import APIRouter, Body, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from movie_catalog_backend.scheme.movie import MovieCreate, MovieRead, MovieUpdate
+from movie_catalog_backend.route.http_cache import conditional_get
+from movie_catalog_backend.route.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, set_next_page_headers
+from movie_catalog_backend.scheme.batch import MAX_BATCH_SIZE, BatchDeleteRequest, BatchResult
+from movie_catalog_backend.scheme.expand import MovieWithTheater
+from movie_catalog_backend.scheme.importing import ImportReport
+from movie_catalog_backend.scheme.movie import MovieBatchUpdate, MovieCreate, MovieRead, MovieUpdate
+from movie_catalog_backend.serialization import EXPORT_FORMATS, PydanticJSONResponse, encode_export
 from movie_catalog_backend.service import movie_service
 
 router = APIRouter(prefix="/movies", tags=["movies"])
 
+SearchSort = Literal[
+    "title", "-title", "ticket_price", "-ticket_price", "runtime_minutes", "-runtime_minutes"
+]
 
-@router.get("", response_model=List[MovieRead])
-def list_movies(theater_id: Optional[str] = Query(None)):
-    """전체 영화 목록 조회 (theater_id 필터 지원)"""
-    return movie_service.get_all_movies(theater_id)
+
+@router.get(
+    "",
+    response_model=List[Union[MovieWithTheater, MovieRead]],
+    dependencies=[Depends(conditional_get("movie", "theater"))]
+)
+async def list_movies(
+    request: Request,
+    response: Response,
+    theater_id: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="이전 페이지의 마지막 영화 id (커서)"),
+    expand: Optional[Literal["theater"]] = Query(None, description="theater: 각 영화에 극장 정보 포함")
+):
+    """전체 영화 목록 조회 (theater_id 필터, limit/after 커서 페이지네이션, expand=theater 지원)"""
+    movies = await movie_service.get_all_movies(
+        theater_id,
+        limit=limit,
+        after=after,
+        expand_theater=expand == "theater"
+    )
+    set_next_page_headers(request, response, movies, limit)
+    return PydanticJSONResponse(movies, headers=response.headers)
 
 
 @router.post("", response_model=MovieRead, status_code=status.HTTP_201_CREATED)
-def create_movie(movie: MovieCreate):
+async def create_movie(movie: MovieCreate):
     """영화 생성 (유효한 극장 ID 필요)"""
-    return movie_service.create_movie(movie)
+    return await movie_service.create_movie(movie)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_movies(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    theater_id: Optional[str] = Query(None),
+    cache_headers: dict = Depends(conditional_get("movie"))
+):
+    """전체 영화 스트리밍 내보내기 (NDJSON/CSV)"""
+    media_type, extension = EXPORT_FORMATS[format]
+    fields = list(MovieRead.model_fields)
+    return StreamingResponse(
+        encode_export(movie_service.stream_movies(theater_id), format, fields),
+        media_type=media_type,
+        headers={**cache_headers, "Content-Disposition": f'attachment; filename="movies.{extension}"'}
+    )
+
+
+@router.get("/search", response_model=List[MovieRead], dependencies=[Depends(conditional_get("movie"))])
+async def search_movies(
+    response: Response,
+    q: Optional[str] = Query(None, min_length=1, description="제목/배급사 검색어 (부분 일치)"),
+    genre: Optional[str] = Query(None),
+    distributor: Optional[str] = Query(None, description="배급사 (정확히 일치)"),
+    theater_id: Optional[str] = Query(None),
+    min_price: Optional[int] = Query(None, ge=0),
+    max_price: Optional[int] = Query(None, ge=0),
+    min_runtime: Optional[int] = Query(None, ge=0),
+    max_runtime: Optional[int] = Query(None, ge=0),
+    sort: SearchSort = Query("title", description="정렬 기준 ('-' 접두사는 내림차순)"),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE)
+):
+    """영화 검색 (제목/배급사 전문 검색, 장르/배급사/극장/가격/상영시간 필터, 정렬)"""
+    movies = await movie_service.search_movies(
+        q,
+        genre=genre,
+        distributor=distributor,
+        theater_id=theater_id,
+        price_range=(min_price, max_price),
+        runtime_range=(min_runtime, max_runtime),
+        sort=sort,
+        limit=limit
+    )
+    return PydanticJSONResponse(movies, headers=response.headers)
+
+
+@router.post(":batch", response_model=BatchResult)
+async def create_movies(movies: List[MovieCreate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE)):
+    """영화 일괄 생성 (항목별 결과 반환)"""
+    return await movie_service.create_movies(movies)
+
+
+@router.put(":batch", response_model=BatchResult)
+async def update_movies(movies: List[MovieBatchUpdate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE)):
+    """영화 일괄 수정 (항목별 결과 반환)"""
+    return await movie_service.update_movies(movies)
+
+
+@router.post(":batchDelete", response_model=BatchResult)
+async def delete_movies(request: BatchDeleteRequest):
+    """영화 일괄 삭제 (항목별 결과 반환)"""
+    return await movie_service.delete_movies(request.ids)
+
+
+@router.post(":import", response_model=ImportReport)
+async def import_movies(request: Request):
+    """영화 스트리밍 가져오기 (요청 본문: NDJSON 또는 JSON 배열, 레코드별 거부 사유 반환)"""
+    return await movie_service.import_movies(request.stream())
 
 
-@router.get("/{movie_id}", response_model=MovieRead)
-def get_movie(movie_id: str):
+@router.get("/{movie_id}", response_model=MovieRead, dependencies=[Depends(conditional_get("movie"))])
+async def get_movie(movie_id: str):
     """특정 영화 조회"""
-    return movie_service.get_movie(movie_id)
+    return await movie_service.get_movie(movie_id)
 
 
 @router.put("/{movie_id}", response_model=MovieRead)
-def update_movie(movie_id: str, movie: MovieUpdate):
+async def update_movie(movie_id: str, movie: MovieUpdate):
     """영화 정보 수정"""
-    return movie_service.update_movie(movie_id, movie)
+    return await movie_service.update_movie(movie_id, movie)
 
 
 @router.delete("/{movie_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_movie(movie_id: str):
+async def delete_movie(movie_id: str):
     """영화 삭제"""
-    movie_service.delete_movie(movie_id)
+    await movie_service.delete_movie(movie_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
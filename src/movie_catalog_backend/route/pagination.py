@@ -0,0 +1,29 @@
+"""Keyset(cursor) 페이지네이션 헬퍼"""
+from typing import Sequence
+
+from fastapi import Request, Response
+
+# limit을 생략했을 때의 페이지 크기
+DEFAULT_PAGE_SIZE = 100
+
+# 한 페이지 최대 크기
+MAX_PAGE_SIZE = 1000
+
+
+def set_next_page_headers(
+    request: Request,
+    response: Response,
+    items: Sequence,
+    limit: int
+) -> None:
+    """다음 페이지가 있을 수 있으면 Link / X-Next-Cursor 헤더 설정
+
+    커서는 마지막 항목의 id(PK)이며, 다음 페이지는 `after=<cursor>`로 요청한다.
+    """
+    if len(items) < limit:
+        return
+
+    next_cursor = items[-1].id
+    next_url = request.url.include_query_params(after=next_cursor, limit=limit)
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
+    response.headers["X-Next-Cursor"] = next_cursor
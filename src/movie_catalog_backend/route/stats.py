@@ -0,0 +1,32 @@
+"""통계(집계) API 라우터"""
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+
+from movie_catalog_backend.route.http_cache import conditional_get
+from movie_catalog_backend.scheme.stats import GenreStats, RuntimeBucket, TheaterMovieStats
+from movie_catalog_backend.service import stats_service
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get(
+    "/theaters",
+    response_model=List[TheaterMovieStats],
+    dependencies=[Depends(conditional_get("theater", "movie"))]
+)
+async def theater_stats():
+    """극장별 영화 수/평균 티켓 가격"""
+    return await stats_service.get_theater_stats()
+
+
+@router.get("/genres", response_model=List[GenreStats], dependencies=[Depends(conditional_get("movie"))])
+async def genre_stats():
+    """장르별 영화 수/티켓 가격 평균·최소·최대/평균 상영 시간"""
+    return await stats_service.get_genre_stats()
+
+
+@router.get("/runtime", response_model=List[RuntimeBucket], dependencies=[Depends(conditional_get("movie"))])
+async def runtime_histogram(bucket_minutes: int = Query(30, ge=1, le=1440, description="구간 크기(분)")):
+    """상영 시간 분포 (bucket_minutes 단위 구간별 영화 수)"""
+    return await stats_service.get_runtime_histogram(bucket_minutes)
@@ -1,47 +1,116 @@
 """Theater API 라우터"""
-from typing import List
-
-from fastapi import APIRouter, Response, status
-
-from movie_catalog_backend.scheme.theater import TheaterCreate, TheaterRead, TheaterUpdate
+from typing import List, Literal, Optional, Union
+
+from fastapi import APIRouter, Body, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from movie_catalog_backend.route.http_cache import conditional_get
+from movie_catalog_backend.route.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, set_next_page_headers
+from movie_catalog_backend.scheme.batch import MAX_BATCH_SIZE, BatchDeleteRequest, BatchResult
+from movie_catalog_backend.scheme.expand import TheaterWithMovies
+from movie_catalog_backend.scheme.importing import ImportReport
+from movie_catalog_backend.scheme.movie import MovieRead
+from movie_catalog_backend.scheme.theater import TheaterBatchUpdate, TheaterCreate, TheaterRead, TheaterUpdate
+from movie_catalog_backend.serialization import (
+    EXPORT_FORMATS,
+    EncodedJSONResponse,
+    PydanticJSONResponse,
+    encode_export,
+)
 from movie_catalog_backend.service import theater_service
 
 router = APIRouter(prefix="/theaters", tags=["theaters"])
 
 
-@router.get("", response_model=List[TheaterRead])
-def list_theaters():
-    """전체 극장 목록 조회"""
-    return theater_service.get_all_theaters()
+@router.get(
+    "",
+    response_model=List[Union[TheaterWithMovies, TheaterRead]],
+    dependencies=[Depends(conditional_get("theater", "movie"))]
+)
+async def list_theaters(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="이전 페이지의 마지막 극장 id (커서)"),
+    expand: Optional[Literal["movies"]] = Query(None, description="movies: 각 극장에 영화 목록 포함")
+):
+    """전체 극장 목록 조회 (limit/after 커서 페이지네이션, expand=movies 지원)"""
+    theaters = await theater_service.get_all_theaters(limit=limit, after=after, expand_movies=expand == "movies")
+    set_next_page_headers(request, response, theaters, limit)
+    return PydanticJSONResponse(theaters, headers=response.headers)
 
 
 @router.post("", response_model=TheaterRead, status_code=status.HTTP_201_CREATED)
-def create_theater(theater: TheaterCreate):
+async def create_theater(theater: TheaterCreate):
     """극장 생성"""
-    return theater_service.create_theater(theater)
+    return await theater_service.create_theater(theater)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_theaters(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    cache_headers: dict = Depends(conditional_get("theater"))
+):
+    """전체 극장 스트리밍 내보내기 (NDJSON/CSV)"""
+    media_type, extension = EXPORT_FORMATS[format]
+    fields = list(TheaterRead.model_fields)
+    return StreamingResponse(
+        encode_export(theater_service.stream_theaters(), format, fields),
+        media_type=media_type,
+        headers={**cache_headers, "Content-Disposition": f'attachment; filename="theaters.{extension}"'}
+    )
+
+
+@router.post(":batch", response_model=BatchResult)
+async def create_theaters(theaters: List[TheaterCreate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE)):
+    """극장 일괄 생성 (항목별 결과 반환)"""
+    return await theater_service.create_theaters(theaters)
+
+
+@router.put(":batch", response_model=BatchResult)
+async def update_theaters(theaters: List[TheaterBatchUpdate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE)):
+    """극장 일괄 수정 (항목별 결과 반환)"""
+    return await theater_service.update_theaters(theaters)
+
+
+@router.post(":batchDelete", response_model=BatchResult)
+async def delete_theaters(request: BatchDeleteRequest):
+    """극장 일괄 삭제 (연결된 영화가 있는 극장은 409, 항목별 결과 반환)"""
+    return await theater_service.delete_theaters(request.ids)
+
+
+@router.post(":import", response_model=ImportReport)
+async def import_theaters(request: Request):
+    """극장 스트리밍 가져오기 (요청 본문: NDJSON 또는 JSON 배열, 레코드별 거부 사유 반환)"""
+    return await theater_service.import_theaters(request.stream())
 
 
-@router.get("/{theater_id}", response_model=TheaterRead)
-def get_theater(theater_id: str):
+@router.get("/{theater_id}", response_model=TheaterRead, dependencies=[Depends(conditional_get("theater"))])
+async def get_theater(theater_id: str):
     """특정 극장 조회"""
-    return theater_service.get_theater(theater_id)
+    return await theater_service.get_theater(theater_id)
 
 
 @router.put("/{theater_id}", response_model=TheaterRead)
-def update_theater(theater_id: str, theater: TheaterUpdate):
+async def update_theater(theater_id: str, theater: TheaterUpdate):
     """극장 정보 수정"""
-    return theater_service.update_theater(theater_id, theater)
+    return await theater_service.update_theater(theater_id, theater)
 
 
 @router.delete("/{theater_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_theater(theater_id: str):
+async def delete_theater(theater_id: str):
     """극장 삭제 (연결된 영화가 있으면 409 에러)"""
-    theater_service.delete_theater(theater_id)
+    await theater_service.delete_theater(theater_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@router.get("/{theater_id}/movies", response_model=List[dict])
-def get_theater_movies(theater_id: str):
-    """특정 극장의 영화 목록 조회"""
-    return theater_service.get_theater_movies(theater_id)
+@router.get(
+    "/{theater_id}/movies",
+    response_model=List[MovieRead],
+    dependencies=[Depends(conditional_get("theater", "movie"))]
+)
+async def get_theater_movies(theater_id: str, response: Response):
+    """특정 극장의 영화 목록 조회 (극장별 영화 목록 뷰의 미리 인코딩된 JSON 사용)"""
+    content = await theater_service.get_theater_movies_json(theater_id)
+    return EncodedJSONResponse(content, headers=response.headers)
 
@@ -0,0 +1,36 @@
+"""일괄 처리(batch) Pydantic 스키마"""
+from typing import List, Optional
+from pydantic import BaseModel, Field, computed_field
+
+# 한 번의 일괄 요청에 허용하는 최대 항목 수
+MAX_BATCH_SIZE = 5000
+
+
+class BatchDeleteRequest(BaseModel):
+    """일괄 삭제 요청"""
+    ids: List[str] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BatchItemResult(BaseModel):
+    """일괄 처리 항목별 결과 (status는 단건 API의 HTTP 상태 코드와 동일한 의미)"""
+    index: int
+    id: Optional[str] = None
+    status: int
+    detail: Optional[str] = None
+
+
+class BatchResult(BaseModel):
+    """일괄 처리 응답"""
+    results: List[BatchItemResult]
+    
+    @computed_field
+    @property
+    def succeeded(self) -> int:
+        """성공 항목 수"""
+        return sum(1 for item in self.results if item.status < 400)
+    
+    @computed_field
+    @property
+    def failed(self) -> int:
+        """실패 항목 수"""
+        return len(self.results) - self.succeeded
@@ -0,0 +1,18 @@
+"""연관 리소스 포함(expand) 응답 스키마
+
+movie ↔ theater 스키마가 서로를 참조하므로 순환 임포트를 피하기 위해 별도 모듈에 둔다.
+"""
+from typing import List
+
+from movie_catalog_backend.scheme.movie import MovieRead
+from movie_catalog_backend.scheme.theater import TheaterRead
+
+
+class MovieWithTheater(MovieRead):
+    """극장 정보를 포함한 영화 응답 (?expand=theater)"""
+    theater: TheaterRead
+
+
+class TheaterWithMovies(TheaterRead):
+    """영화 목록을 포함한 극장 응답 (?expand=movies)"""
+    movies: List[MovieRead]
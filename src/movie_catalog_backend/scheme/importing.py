@@ -0,0 +1,18 @@
+"""일괄 가져오기(import) Pydantic 스키마"""
+from typing import List, Literal
+from pydantic import BaseModel
+
+
+class ImportReject(BaseModel):
+    """거부된 레코드 (index는 입력 스트림 내 0부터 시작하는 레코드 순번)"""
+    index: int
+    reason: str
+
+
+class ImportReport(BaseModel):
+    """가져오기 결과 요약"""
+    kind: Literal["theaters", "movies"]
+    total: int = 0
+    inserted: int = 0
+    rejected: int = 0
+    rejects: List[ImportReject] = []
@@ -1,6 +1,8 @@
 """Movie Pydantic 스키마"""
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, Optional
+from pydantic import BaseModel, Field, model_validator
+
+from movie_catalog_backend.scheme.validators import reject_null_fields
 
 
 class MovieCreate(BaseModel):
@@ -21,6 +23,17 @@ class MovieUpdate(BaseModel):
     runtime_minutes: Optional[int] = Field(default=None, ge=0)
     genre: Optional[str] = None
     theater_id: Optional[str] = None
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _reject_null(cls, data: Any) -> Any:
+        # 필드 생략은 "변경 없음"이지만 명시적 null은 NOT NULL 컬럼에 쓸 수 없으므로 거부
+        return reject_null_fields(data)
+
+
+class MovieBatchUpdate(MovieUpdate):
+    """영화 일괄 수정 항목 (부분 업데이트)"""
+    id: str
 
 
 class MovieRead(BaseModel):
@@ -0,0 +1,28 @@
+"""통계(집계) Pydantic 스키마"""
+from typing import Optional
+from pydantic import BaseModel
+
+
+class TheaterMovieStats(BaseModel):
+    """극장별 영화 집계 (영화가 없는 극장은 movie_count 0, 평균 None)"""
+    theater_id: str
+    theater_name: str
+    movie_count: int
+    avg_ticket_price: Optional[float] = None
+
+
+class GenreStats(BaseModel):
+    """장르별 영화 집계"""
+    genre: str
+    movie_count: int
+    avg_ticket_price: float
+    min_ticket_price: int
+    max_ticket_price: int
+    avg_runtime_minutes: float
+
+
+class RuntimeBucket(BaseModel):
+    """상영 시간 분포 구간 (min_minutes 이상 max_minutes 미만)"""
+    min_minutes: int
+    max_minutes: int
+    movie_count: int
@@ -1,6 +1,8 @@
 """Theater Pydantic 스키마"""
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, Optional
+from pydantic import BaseModel, Field, model_validator
+
+from movie_catalog_backend.scheme.validators import reject_null_fields
 
 
 class TheaterCreate(BaseModel):
@@ -17,6 +19,17 @@ class TheaterUpdate(BaseModel):
     brand: Optional[str] = None
     location: Optional[str] = None
     operating_hours: Optional[str] = None
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _reject_null(cls, data: Any) -> Any:
+        # 필드 생략은 "변경 없음"이지만 명시적 null은 NOT NULL 컬럼에 쓸 수 없으므로 거부
+        return reject_null_fields(data)
+
+
+class TheaterBatchUpdate(TheaterUpdate):
+    """영화관 일괄 수정 항목 (부분 업데이트)"""
+    id: str
 
 
 class TheaterRead(BaseModel):
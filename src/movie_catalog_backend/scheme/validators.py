@@ -0,0 +1,11 @@
+"""스키마 공용 검증 함수"""
+from typing import Any
+
+
+def reject_null_fields(data: Any) -> Any:
+    """부분 업데이트 요청의 명시적 null 값 거부 (필드 생략만 "변경 없음"으로 취급)"""
+    if isinstance(data, dict):
+        nulls = sorted(key for key, value in data.items() if value is None)
+        if nulls:
+            raise ValueError(f"null을 허용하지 않는 필드: {', '.join(nulls)}")
+    return data
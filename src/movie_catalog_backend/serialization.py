@@ -0,0 +1,68 @@
+"""응답 인코더 (JSON / 스트리밍 NDJSON / CSV)
+
+- PydanticJSONResponse: 서비스가 반환한 스키마 객체를 pydantic-core 직렬화기로 바로 인코딩
+- EncodedJSONResponse: 서비스가 미리 인코딩해 둔 JSON 바이트를 그대로 전송
+- 스트리밍 인코더: 행(딕셔너리)의 묶음을 받아 바로 바이트 청크로 인코딩하므로, 전체 결과를
+  메모리에 올리지 않고 응답을 흘려보낼 수 있다.
+"""
+import csv
+import io
+from typing import Any, AsyncIterator, List, Sequence
+
+from fastapi.responses import JSONResponse, Response
+from pydantic_core import to_json
+
+# 내보내기 형식 → (media type, 파일 확장자)
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+}
+
+
+class PydanticJSONResponse(JSONResponse):
+    """pydantic-core(Rust) 직렬화기로 인코딩하는 JSON 응답
+
+    서비스 계층에서 이미 검증된 스키마 객체(목록)를 dict 변환 없이 바로 바이트로
+    인코딩한다. 핸들러가 이 응답을 직접 반환하면 FastAPI의 response_model 재검증도
+    생략되며, response_model은 OpenAPI 문서용으로만 쓰인다. 이때 의존성이 주입된
+    Response에 설정한 헤더(ETag, Link 등)는 `headers=response.headers`로 넘긴다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class EncodedJSONResponse(Response):
+    """이미 인코딩된 JSON 바이트 응답 (직렬화 없이 그대로 본문으로 사용)"""
+
+    media_type = "application/json"
+
+
+async def encode_ndjson(batches: AsyncIterator[List[dict]]) -> AsyncIterator[bytes]:
+    """행 묶음을 NDJSON(한 줄에 JSON 객체 하나) 청크로 인코딩"""
+    async for rows in batches:
+        yield b"".join(to_json(row) + b"\n" for row in rows)
+
+
+async def encode_csv(batches: AsyncIterator[List[dict]], fields: Sequence[str]) -> AsyncIterator[bytes]:
+    """행 묶음을 CSV 청크로 인코딩 (첫 청크에 헤더 포함)"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+
+    async for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+    # 행이 하나도 없으면 헤더만 출력
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def encode_export(batches: AsyncIterator[List[dict]], export_format: str, fields: Sequence[str]) -> AsyncIterator[bytes]:
+    """내보내기 형식에 맞는 인코더 선택"""
+    if export_format == "csv":
+        return encode_csv(batches, fields)
+    return encode_ndjson(batches)
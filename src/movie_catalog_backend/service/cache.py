@@ -0,0 +1,230 @@
+"""서비스 조회 결과 캐시 (저장소 교체 가능, LRU/TTL)
+
+서비스 함수가 조회 결과를 캐시에 넣고, 쓰기 함수가 커밋 후 영향을 받는
+키만 무효화한다. 캐시마다 이름(네임스페이스)이 있으며, 실제 저장은
+CACHE_BACKEND로 선택한 저장소가 담당한다.
+
+- memory: 프로세스 내 LRU (캐시별 항목 수 상한, 워커마다 별도)
+- file: 로컬 SQLite 파일 (같은 노드의 워커 공유)
+- redis: Redis 프로토콜 서버 (노드 간 공유)
+
+조회 함수는 DB를 읽기 전에 `token()`으로 캐시가 의존하는 테이블의 데이터 버전을 읽고,
+저장 시 함께 넘긴다. 쓰기 함수는 버전을 올린 뒤 무효화하므로, 저장 직후 버전이 달라졌으면
+조회 도중 쓰기가 끼어든 것으로 보고 방금 저장한 항목을 지운다 (이전 값이 다시 캐시되지 않음).
+
+공유 저장소에서 무효화는 모든 워커에 즉시 반영된다. 저장소 장애 시 조회는
+미스로 처리되어 DB에서 읽는다. 공유 저장소 연산은 스레드 풀에서 실행하여
+느린 저장소가 이벤트 루프(같은 워커의 다른 요청)를 막지 않게 한다.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, TypeVar
+
+from movie_catalog_backend.config import (
+    get_cache_backend,
+    get_cache_file_path,
+    get_cache_key_prefix,
+    get_cache_max_entries,
+    get_cache_redis_timeout,
+    get_cache_redis_url,
+    get_cache_ttl_seconds,
+    is_cache_enabled,
+    is_process_local_cache_safe,
+)
+from movie_catalog_backend.redis_client import RedisClient
+from movie_catalog_backend.service.cache_backends import (
+    CacheBackend,
+    CacheBackendError,
+    FileBackend,
+    MemoryBackend,
+    RedisBackend,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 저장소 장애 경고 로그 최소 간격 (초)
+_WARNING_INTERVAL = 30.0
+_last_warning = 0.0
+
+
+def warn_backend_error(error: Exception) -> None:
+    """저장소 장애 경고 (요청마다 반복되지 않도록 간격 제한)"""
+    global _last_warning
+    now = time.monotonic()
+    if now - _last_warning >= _WARNING_INTERVAL:
+        _last_warning = now
+        logger.warning(f"캐시 저장소 오류, DB 조회로 대체합니다: {error}")
+
+
+async def call_backend(backend: CacheBackend, function: Callable[..., T], *args: Any) -> T:
+    """저장소 연산 실행 (블로킹 저장소는 스레드 풀에서, memory 저장소는 바로 실행)"""
+    if backend.blocking:
+        return await asyncio.to_thread(function, *args)
+    return function(*args)
+
+
+def version_counter(table: str) -> str:
+    """테이블 데이터 버전 카운터 이름"""
+    return f"version:{table}"
+
+
+def _set_if_unchanged(
+    backend: CacheBackend,
+    namespace: str,
+    key: Hashable,
+    value: Any,
+    ttl_seconds: float,
+    counters: List[str],
+    token: List[int]
+) -> None:
+    """저장 후 버전을 다시 읽어, 조회 시작 이후 쓰기가 있었으면 저장한 항목 삭제"""
+    backend.set(namespace, key, value, ttl_seconds)
+    if backend.get_counters(counters) != token:
+        backend.delete(namespace, [key])
+
+
+def create_backend(kind: str) -> CacheBackend:
+    """환경변수 설정으로 캐시 저장소 생성"""
+    prefix = get_cache_key_prefix()
+    if kind == "file":
+        return FileBackend(get_cache_file_path(), prefix)
+    if kind == "redis":
+        return RedisBackend(RedisClient(get_cache_redis_url(), timeout=get_cache_redis_timeout()), prefix)
+    return MemoryBackend(get_cache_max_entries())
+
+
+class Cache:
+    """이름 붙은 캐시 (저장소의 네임스페이스 1개, 적중/미스 카운터는 프로세스별)
+
+    tables는 항목 내용이 의존하는 테이블로, 해당 테이블 버전으로 저장 경합을 감지한다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        backend: CacheBackend,
+        ttl_seconds: float,
+        tables: Sequence[str],
+        enabled: bool = True
+    ):
+        self.name = name
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._counters = [version_counter(table) for table in tables]
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        if not self.enabled:
+            return None
+
+        try:
+            value = await call_backend(self.backend, self.backend.get, self.name, key)
+        except CacheBackendError as e:
+            warn_backend_error(e)
+            value = None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def token(self) -> Optional[List[int]]:
+        """DB 조회 전에 읽는 의존 테이블 버전 (set에 전달, 비활성/장애 시 None)"""
+        if not self.enabled:
+            return None
+
+        try:
+            return await call_backend(self.backend, self.backend.get_counters, self._counters)
+        except CacheBackendError as e:
+            warn_backend_error(e)
+            return None
+
+    async def set(self, key: Hashable, value: Any, token: Optional[List[int]]) -> None:
+        """캐시 저장 (token은 DB 조회 전에 읽은 `token()` 값, 그 사이 쓰기가 있었으면 저장하지 않음)"""
+        if not self.enabled or token is None:
+            return
+
+        try:
+            await call_backend(
+                self.backend, _set_if_unchanged,
+                self.backend, self.name, key, value, self.ttl_seconds, self._counters, token
+            )
+        except CacheBackendError as e:
+            warn_backend_error(e)
+
+    async def delete(self, *keys: Hashable) -> None:
+        """지정한 키 무효화"""
+        if not keys:
+            return
+
+        try:
+            await call_backend(self.backend, self.backend.delete, self.name, keys)
+        except CacheBackendError as e:
+            logger.error(f"캐시 무효화 실패({self.name}), TTL 만료 전까지 이전 값이 조회될 수 있습니다: {e}")
+
+    async def clear(self) -> None:
+        """전체 무효화"""
+        try:
+            await call_backend(self.backend, self.backend.clear, self.name)
+        except CacheBackendError as e:
+            logger.error(f"캐시 무효화 실패({self.name}), TTL 만료 전까지 이전 값이 조회될 수 있습니다: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (size/evictions는 memory 저장소에서만 제공)"""
+        return {
+            "name": self.name,
+            "backend": self.backend.name,
+            "size": self.backend.size(self.name),
+            "max_entries": get_cache_max_entries(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.backend.evictions(self.name),
+        }
+
+
+cache_backend = create_backend(get_cache_backend())
+_caches: List[Cache] = []
+
+
+def create_cache(name: str, *tables: str) -> Cache:
+    """환경변수 설정을 적용한 캐시 생성 및 등록 (워커별 memory 저장소로 일관성을 지킬 수 없으면 비활성화)"""
+    cache = Cache(
+        name,
+        cache_backend,
+        ttl_seconds=get_cache_ttl_seconds(),
+        tables=tables,
+        enabled=is_cache_enabled() and is_process_local_cache_safe()
+    )
+    _caches.append(cache)
+    return cache
+
+
+def get_cache_stats() -> List[Dict[str, Any]]:
+    """등록된 모든 캐시의 통계"""
+    return [cache.stats() for cache in _caches]
+
+
+async def clear_all_caches() -> None:
+    """등록된 모든 캐시 무효화 (시드/일괄 적재 등 대량 변경 후)"""
+    for cache in _caches:
+        await cache.clear()
+
+
+# 서비스별 캐시
+# - theater_cache: theater_id → TheaterRead
+# - theater_list_cache: (limit, after) → List[TheaterRead]
+# - movie_cache: movie_id → MovieRead
+# - movie_list_cache: (theater_id, limit, after) → List[MovieRead]
+# - stats_cache: 통계 종류 → 집계 결과 (영화/극장 변경 시 전체 무효화)
+theater_cache = create_cache("theater", "theater")
+theater_list_cache = create_cache("theater_list", "theater")
+movie_cache = create_cache("movie", "movie")
+movie_list_cache = create_cache("movie_list", "movie")
+stats_cache = create_cache("stats", "movie", "theater")
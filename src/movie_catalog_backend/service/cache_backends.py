@@ -0,0 +1,378 @@
+"""서비스 캐시 저장소 구현
+
+- memory: 프로세스 내 LRU + TTL (기본값, 워커마다 별도)
+- file: 로컬 SQLite 파일 (같은 노드의 워커들이 공유)
+- redis: Redis 프로토콜 서버 (여러 노드/파드가 공유)
+
+모든 저장소는 네임스페이스(캐시 이름) 단위로 항목을 구분하고, 데이터 버전 등
+정수 카운터를 함께 제공한다. 공유 저장소는 네임스페이스마다 세대 번호를 두어
+저장하는 값에 함께 기록하며, 네임스페이스 전체 무효화는 세대 번호 증가로 처리한다.
+조회는 세대 번호와 항목을 한 번에(왕복 1회) 읽어 세대가 다르면 미스로 처리하므로,
+이전 세대 항목은 더 이상 조회되지 않고 덮어쓰이거나 TTL이 지나면 사라진다.
+
+공유 저장소 연산은 파일/네트워크 I/O로 블로킹되므로(`blocking`) 호출자가 이벤트
+루프 밖(스레드 풀)에서 실행한다.
+"""
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+from movie_catalog_backend.redis_client import RedisClient, RedisError
+
+logger = logging.getLogger(__name__)
+
+# 만료 항목 정리 주기 (file 저장소, set 횟수 기준)
+_PURGE_INTERVAL = 1000
+
+
+class CacheBackendError(Exception):
+    """공유 캐시 저장소 접근 실패"""
+
+
+class TTLCache:
+    """크기 제한 LRU 저장소 (항목별 TTL, 제거 카운터 포함)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """조회 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float) -> None:
+        """저장 (상한 초과 시 LRU 항목 제거)"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, keys: Iterable[Hashable]) -> None:
+        """지정한 키 삭제"""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CacheBackend(ABC):
+    """캐시 저장소 인터페이스"""
+
+    name = "base"
+    # 연산이 I/O로 블로킹되는지 여부 (true면 호출자가 스레드 풀에서 실행)
+    blocking = False
+
+    @abstractmethod
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        """항목 조회 (없거나 만료되면 None)"""
+
+    @abstractmethod
+    def set(self, namespace: str, key: Hashable, value: Any, ttl_seconds: float) -> None:
+        """항목 저장"""
+
+    @abstractmethod
+    def delete(self, namespace: str, keys: Iterable[Hashable]) -> None:
+        """지정한 항목 무효화"""
+
+    @abstractmethod
+    def clear(self, namespace: str) -> None:
+        """네임스페이스 전체 무효화"""
+
+    @abstractmethod
+    def incr(self, counter: str) -> int:
+        """카운터 증가 후 값 반환"""
+
+    @abstractmethod
+    def get_counters(self, counters: List[str]) -> List[int]:
+        """카운터 값 목록 (없으면 0)"""
+
+    @abstractmethod
+    def instance_id(self) -> str:
+        """카운터 값의 유효 범위 식별자 (카운터가 초기화되면 달라짐)"""
+
+    def size(self, namespace: str) -> Optional[int]:
+        """항목 수 (저장소가 제공하지 않으면 None)"""
+        return None
+
+    def evictions(self, namespace: str) -> Optional[int]:
+        """LRU 제거 수 (저장소가 제공하지 않으면 None)"""
+        return None
+
+
+class MemoryBackend(CacheBackend):
+    """프로세스 내 저장소 (네임스페이스별 LRU + TTL, 직렬화 없음)"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._stores: Dict[str, TTLCache] = {}
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        # 프로세스마다 다른 값: 재시작/다른 워커의 같은 카운터 값을 구분
+        self._instance_id = uuid4().hex[:8]
+
+    def _store(self, namespace: str) -> TTLCache:
+        store = self._stores.get(namespace)
+        if store is None:
+            with self._lock:
+                store = self._stores.setdefault(namespace, TTLCache(self.max_entries))
+        return store
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        return self._store(namespace).get(key)
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl_seconds: float) -> None:
+        self._store(namespace).set(key, value, ttl_seconds)
+
+    def delete(self, namespace: str, keys: Iterable[Hashable]) -> None:
+        self._store(namespace).delete(keys)
+
+    def clear(self, namespace: str) -> None:
+        self._store(namespace).clear()
+
+    def incr(self, counter: str) -> int:
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + 1
+            return self._counters[counter]
+
+    def get_counters(self, counters: List[str]) -> List[int]:
+        return [self._counters.get(counter, 0) for counter in counters]
+
+    def instance_id(self) -> str:
+        return self._instance_id
+
+    def size(self, namespace: str) -> Optional[int]:
+        return len(self._store(namespace))
+
+    def evictions(self, namespace: str) -> Optional[int]:
+        return self._store(namespace).evictions
+
+
+class SharedBackend(CacheBackend):
+    """프로세스 간 공유 저장소 공통 구현 (키 구성, 직렬화, 세대 기반 무효화)
+
+    값은 (세대 번호, 값) 튜플을 pickle로 직렬화해 저장하므로 신뢰할 수 있는 저장소에만 사용한다.
+    하위 클래스는 바이트 단위 원시 연산(_get_with_generation/_set/_delete/_incr/_get_ints/_add)을 구현한다.
+    """
+
+    blocking = True
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self._instance_id: Optional[str] = None
+
+    def _generation_key(self, namespace: str) -> str:
+        return f"{self.prefix}:gen:{namespace}"
+
+    def _entry_key(self, namespace: str, key: Hashable) -> str:
+        """저장소 키 (키 객체는 repr로 문자열화)"""
+        return f"{self.prefix}:{namespace}:{key!r}"
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        generation, raw = self._get_with_generation(self._generation_key(namespace), self._entry_key(namespace, key))
+        if raw is None:
+            return None
+        stored_generation, value = pickle.loads(raw)
+        return value if stored_generation == generation else None
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl_seconds: float) -> None:
+        generation = self._get_ints([self._generation_key(namespace)])[0]
+        raw = pickle.dumps((generation, value), pickle.HIGHEST_PROTOCOL)
+        self._set(self._entry_key(namespace, key), raw, ttl_seconds)
+
+    def delete(self, namespace: str, keys: Iterable[Hashable]) -> None:
+        entry_keys = [self._entry_key(namespace, key) for key in keys]
+        if entry_keys:
+            self._delete(entry_keys)
+
+    def clear(self, namespace: str) -> None:
+        self._incr(self._generation_key(namespace))
+
+    def incr(self, counter: str) -> int:
+        return self._incr(f"{self.prefix}:counter:{counter}")
+
+    def get_counters(self, counters: List[str]) -> List[int]:
+        return self._get_ints([f"{self.prefix}:counter:{counter}" for counter in counters])
+
+    def instance_id(self) -> str:
+        # 저장소에 처음 기록된 값을 모든 워커가 공유 (저장소가 비워지면 새 값)
+        if self._instance_id is None:
+            self._instance_id = self._add(f"{self.prefix}:instance", uuid4().hex[:8].encode("ascii")).decode("ascii")
+        return self._instance_id
+
+    @abstractmethod
+    def _get_with_generation(self, generation_key: str, key: str) -> Tuple[int, Optional[bytes]]:
+        """세대 번호와 항목 값을 한 번에 조회 (항목이 없거나 만료되면 값은 None)"""
+
+    @abstractmethod
+    def _set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """키가 있으면 덮어쓰며 저장 (TTL 후 만료)"""
+
+    @abstractmethod
+    def _delete(self, keys: List[str]) -> None:
+        """지정한 키 삭제"""
+
+    @abstractmethod
+    def _incr(self, key: str) -> int:
+        """정수 값 1 증가 후 반환 (없으면 0에서 시작)"""
+
+    @abstractmethod
+    def _get_ints(self, keys: List[str]) -> List[int]:
+        """정수 값 목록 (없으면 0)"""
+
+    @abstractmethod
+    def _add(self, key: str, value: bytes) -> bytes:
+        """키가 없을 때만 저장하고 최종 저장된 값 반환"""
+
+
+class FileBackend(SharedBackend):
+    """로컬 SQLite 파일 저장소 (같은 노드의 워커 간 공유)
+
+    프로세스마다 연결 1개를 열어 자동 커밋 모드로 사용한다. 만료 항목은
+    일정 횟수의 저장마다 정리된다.
+    """
+
+    name = "file"
+
+    def __init__(self, path: str, prefix: str):
+        super().__init__(prefix)
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = 0
+        self._sets = 0
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entry "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL) WITHOUT ROWID"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_entry_expires_at ON cache_entry (expires_at)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_counter "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL) WITHOUT ROWID"
+        )
+        self._conn, self._pid = conn, os.getpid()
+        return conn
+
+    def _execute(self, sql: str, parameters: Iterable = ()) -> List[tuple]:
+        with self._lock:
+            try:
+                return self._connection().execute(sql, tuple(parameters)).fetchall()
+            except sqlite3.Error as e:
+                raise CacheBackendError(f"캐시 파일 접근 실패 ({self.path}): {e}") from e
+
+    def _get_with_generation(self, generation_key: str, key: str) -> Tuple[int, Optional[bytes]]:
+        rows = self._execute(
+            "SELECT (SELECT value FROM cache_counter WHERE key = ?), "
+            "(SELECT value FROM cache_entry WHERE key = ? AND expires_at > ?)",
+            (generation_key, key, time.time())
+        )
+        generation, value = rows[0]
+        return int(generation or 0), value
+
+    def _set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._execute(
+            "INSERT OR REPLACE INTO cache_entry (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, time.time() + ttl_seconds)
+        )
+        self._sets += 1
+        if self._sets % _PURGE_INTERVAL == 0:
+            self._execute("DELETE FROM cache_entry WHERE expires_at <= ?", (time.time(),))
+
+    def _delete(self, keys: List[str]) -> None:
+        placeholders = ", ".join("?" for _ in keys)
+        self._execute(f"DELETE FROM cache_entry WHERE key IN ({placeholders})", keys)
+
+    def _incr(self, key: str) -> int:
+        rows = self._execute(
+            "INSERT INTO cache_counter (key, value) VALUES (?, 1) "
+            "ON CONFLICT (key) DO UPDATE SET value = value + 1 RETURNING value",
+            (key,)
+        )
+        return rows[0][0]
+
+    def _get_ints(self, keys: List[str]) -> List[int]:
+        placeholders = ", ".join("?" for _ in keys)
+        rows = dict(self._execute(f"SELECT key, value FROM cache_counter WHERE key IN ({placeholders})", keys))
+        return [int(rows.get(key, 0)) for key in keys]
+
+    def _add(self, key: str, value: bytes) -> bytes:
+        self._execute("INSERT OR IGNORE INTO cache_counter (key, value) VALUES (?, ?)", (key, value))
+        return self._execute("SELECT value FROM cache_counter WHERE key = ?", (key,))[0][0]
+
+
+class RedisBackend(SharedBackend):
+    """Redis 프로토콜 저장소 (여러 노드 간 공유, TTL은 서버가 관리)"""
+
+    name = "redis"
+
+    def __init__(self, client: RedisClient, prefix: str):
+        super().__init__(prefix)
+        self.client = client
+
+    def _call(self, *args: Any) -> Any:
+        try:
+            return self.client.execute(*args)
+        except RedisError as e:
+            raise CacheBackendError(str(e)) from e
+
+    def _get_with_generation(self, generation_key: str, key: str) -> Tuple[int, Optional[bytes]]:
+        generation, value = self._call("MGET", generation_key, key)
+        return int(generation or 0), value
+
+    def _set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._call("SET", key, value, "PX", max(1, int(ttl_seconds * 1000)))
+
+    def _delete(self, keys: List[str]) -> None:
+        self._call("DEL", *keys)
+
+    def _incr(self, key: str) -> int:
+        return self._call("INCR", key)
+
+    def _get_ints(self, keys: List[str]) -> List[int]:
+        return [int(value) if value is not None else 0 for value in self._call("MGET", *keys)]
+
+    def _add(self, key: str, value: bytes) -> bytes:
+        try:
+            replies = self.client.pipeline([("SET", key, value, "NX"), ("GET", key)])
+        except RedisError as e:
+            raise CacheBackendError(str(e)) from e
+        return replies[1] if isinstance(replies[1], bytes) else value
@@ -1,13 +1,61 @@
 """Movie 서비스 계층"""
-from typing import List, Optional
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from fastapi import HTTPException
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, text, update
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from movie_catalog_backend.db.session import session_scope
+from movie_catalog_backend.db.importer import ImportFormatError, import_records_async
+from movie_catalog_backend.db.session import async_read_session_scope, async_session_scope
 from movie_catalog_backend.entity.models import Movie, Theater
-from movie_catalog_backend.scheme.movie import MovieCreate, MovieRead, MovieUpdate
+from movie_catalog_backend.scheme.batch import BatchItemResult, BatchResult
+from movie_catalog_backend.scheme.expand import MovieWithTheater
+from movie_catalog_backend.scheme.importing import ImportReport
+from movie_catalog_backend.scheme.movie import MovieBatchUpdate, MovieCreate, MovieRead, MovieUpdate
+from movie_catalog_backend.scheme.theater import TheaterRead
+from movie_catalog_backend.service.cache import (
+    movie_cache,
+    movie_list_cache,
+    stats_cache,
+    theater_cache,
+)
+from movie_catalog_backend.service.theater_movies_view import theater_movies_view
+from movie_catalog_backend.service.versioning import bump_version
+
+# 내보내기 시 DB 커서에서 한 번에 가져오는 행 수
+EXPORT_BATCH_SIZE = 1000
+
+# 목록 조회/내보내기 대상 컬럼 (ORM 엔티티 대신 컬럼 튜플로 조회)
+MOVIE_COLUMNS = (
+    Movie.id,
+    Movie.title,
+    Movie.distributor,
+    Movie.ticket_price,
+    Movie.runtime_minutes,
+    Movie.genre,
+    Movie.theater_id,
+)
+MOVIE_FIELDS = tuple(column.key for column in MOVIE_COLUMNS)
+
+_MOVIE_LIST_ADAPTER = TypeAdapter(List[MovieRead])
+
+# 검색 정렬 키 (앞에 '-'가 붙으면 내림차순)
+SEARCH_SORT_FIELDS = ("title", "ticket_price", "runtime_minutes")
+
+# FTS5 trigram 색인은 3글자 이상 질의만 처리 가능 (더 짧으면 LIKE 사용)
+FTS_MIN_QUERY_LENGTH = 3
+
+# FTS 색인(movie_fts) 존재 여부 (엔진 초기화 후 최초 검색 시 1회 확인)
+_fts_available: Optional[bool] = None
+
+
+def movies_from_rows(rows: Iterable[tuple]) -> List[MovieRead]:
+    """MOVIE_COLUMNS 순서의 행 목록을 MovieRead 목록으로 변환 (pydantic-core에서 한 번에 검증)"""
+    return _MOVIE_LIST_ADAPTER.validate_python([dict(zip(MOVIE_FIELDS, row)) for row in rows])
 
 
 def _movie_to_dict(movie: Movie) -> dict:
@@ -23,75 +71,424 @@ def _movie_to_dict(movie: Movie) -> dict:
     }
 
 
-def get_all_movies(theater_id: Optional[str] = None) -> List[MovieRead]:
-    """전체 영화 목록 조회 (theater_id 필터 지원)"""
-    with session_scope() as session:
-        query = select(Movie)
+def integrity_error_detail(error: IntegrityError) -> str:
+    """무결성 제약 위반 응답 메시지 (극장 FK 위반과 그 외 제약 위반 구분)"""
+    if "foreign key" in str(error.orig).lower():
+        return "Invalid theater_id"
+    return "Integrity constraint violated"
+
+
+async def _existing_theater_ids(session: AsyncSession, theater_ids: Iterable[str]) -> set:
+    """주어진 극장 ID 중 DB에 존재하는 ID 집합 (단일 쿼리)"""
+    result = await session.exec(select(Theater.id).where(Theater.id.in_(set(theater_ids))))
+    return set(result.all())
+
+
+async def _invalidate_movies(movie_ids: Iterable[str]) -> None:
+    """영화 변경 후 관련 캐시 무효화 (해당 영화, 영화 목록, 통계) 및 버전 증가
+
+    극장별 영화 목록 뷰는 호출 전에 변경 행을 반영해 두고, 여기서 새 버전을 기록한다.
+    """
+    theater_movies_view.advance(await bump_version("movie"))
+    await movie_cache.delete(*movie_ids)
+    await movie_list_cache.clear()
+    await stats_cache.clear()
+
+
+async def _get_theaters_by_ids(theater_ids: Iterable[str]) -> Dict[str, TheaterRead]:
+    """극장 ID 목록을 극장 정보로 변환 (극장 캐시 우선, 미스만 단일 IN 쿼리로 조회 후 캐시 적재)"""
+    theaters: Dict[str, TheaterRead] = {}
+    missing = set()
+    for theater_id in set(theater_ids):
+        cached = await theater_cache.get(theater_id)
+        if cached is not None:
+            theaters[theater_id] = cached
+        else:
+            missing.add(theater_id)
+    
+    if missing:
+        token = await theater_cache.token()
+        async with async_read_session_scope() as session:
+            rows = (await session.exec(select(Theater).where(Theater.id.in_(missing)))).all()
+            for theater in rows:
+                result = TheaterRead.model_validate(theater)
+                await theater_cache.set(theater.id, result, token)
+                theaters[theater.id] = result
+    
+    return theaters
+
+
+async def get_all_movies(
+    theater_id: Optional[str] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    expand_theater: bool = False
+) -> Union[List[MovieRead], List[MovieWithTheater]]:
+    """전체 영화 목록 조회 (theater_id 필터, id 기준 keyset 페이지네이션, 극장 정보 포함 지원)"""
+    movies = await _get_movie_list(theater_id, limit, after)
+    if not expand_theater:
+        return movies
+    
+    # 등장하는 극장을 한 번에 조회하여 각 영화에 포함 (영화마다 극장 조회하지 않음)
+    theaters = await _get_theaters_by_ids(m.theater_id for m in movies)
+    return [
+        MovieWithTheater.model_construct(**dict(m), theater=theaters[m.theater_id])
+        for m in movies
+        if m.theater_id in theaters
+    ]
+
+
+async def _get_movie_list(
+    theater_id: Optional[str],
+    limit: Optional[int],
+    after: Optional[str]
+) -> List[MovieRead]:
+    """영화 목록 조회 (limit이 있는 페이지만 목록 캐시 적용)
+
+    캐시는 항목 수로만 제한되므로, 크기 제한이 없는 전체 목록은 캐시하지 않는다.
+    """
+    cache_key = (theater_id, limit, after)
+    cacheable = limit is not None
+    cached = await movie_list_cache.get(cache_key) if cacheable else None
+    if cached is not None:
+        return list(cached)
+    
+    token = await movie_list_cache.token() if cacheable else None
+    async with async_read_session_scope() as session:
+        query = select(*MOVIE_COLUMNS)
         if theater_id:
             query = query.where(Movie.theater_id == theater_id)
         
-        movies = session.exec(query).all()
-        return [MovieRead(**_movie_to_dict(m)) for m in movies]
+        # 페이지네이션: PK 순서로 커서 이후의 limit개만 조회 (OFFSET 미사용)
+        if limit is not None or after is not None:
+            if after is not None:
+                query = query.where(Movie.id > after)
+            query = query.order_by(Movie.id)
+            if limit is not None:
+                query = query.limit(limit)
+        
+        result = movies_from_rows((await session.exec(query)).all())
+    
+    if cacheable:
+        await movie_list_cache.set(cache_key, result, token)
+    return list(result)
 
 
-def get_movie(movie_id: str) -> MovieRead:
+async def get_movie(movie_id: str) -> MovieRead:
     """특정 영화 조회"""
-    with session_scope() as session:
-        movie = session.get(Movie, movie_id)
+    cached = await movie_cache.get(movie_id)
+    if cached is not None:
+        return cached
+    
+    token = await movie_cache.token()
+    async with async_read_session_scope() as session:
+        movie = await session.get(Movie, movie_id)
         if not movie:
             raise HTTPException(status_code=404, detail="Movie not found")
-        return MovieRead(**_movie_to_dict(movie))
+        result = MovieRead(**_movie_to_dict(movie))
+    
+    await movie_cache.set(movie_id, result, token)
+    return result
+
+
+def reset_fts_index_state() -> None:
+    """FTS 색인 존재 여부 확인 결과 초기화 (DB 초기화/엔진 정리 후 다음 검색에서 다시 확인)"""
+    global _fts_available
+    _fts_available = None
 
 
-def create_movie(movie_data: MovieCreate) -> MovieRead:
-    """영화 생성 (유효한 극장 ID 필요)"""
-    with session_scope() as session:
-        # theater_id 존재 여부 확인
-        theater = session.get(Theater, movie_data.theater_id)
-        if not theater:
-            raise HTTPException(status_code=422, detail="Invalid theater_id")
+async def _has_fts_index(session: AsyncSession) -> bool:
+    """movie_fts 색인 존재 여부 (SQLite 마이그레이션 v2 적용 시에만 존재)"""
+    global _fts_available
+    if _fts_available is None:
+        if session.bind.dialect.name != "sqlite":
+            _fts_available = False
+        else:
+            result = await session.exec(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'movie_fts'")
+            )
+            _fts_available = result.first() is not None
+    return _fts_available
+
+
+def _fts_phrase(q: str) -> str:
+    """사용자 입력을 FTS5 구문 질의로 변환 (연산자 해석 방지)"""
+    return '"' + q.replace('"', '""') + '"'
+
+
+async def search_movies(
+    q: Optional[str] = None,
+    genre: Optional[str] = None,
+    distributor: Optional[str] = None,
+    theater_id: Optional[str] = None,
+    price_range: Tuple[Optional[int], Optional[int]] = (None, None),
+    runtime_range: Tuple[Optional[int], Optional[int]] = (None, None),
+    sort: str = "title",
+    limit: int = 50
+) -> List[MovieRead]:
+    """영화 검색 (제목/배급사 전문 검색 + 장르/배급사/극장/가격/상영시간 필터, 정렬)"""
+    cache_key = ("search", q, genre, distributor, theater_id, price_range, runtime_range, sort, limit)
+    cached = await movie_list_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
+    
+    token = await movie_list_cache.token()
+    async with async_read_session_scope() as session:
+        query = select(*MOVIE_COLUMNS)
         
-        movie = Movie(
-            id=str(uuid4()),
-            **movie_data.model_dump()
-        )
-        session.add(movie)
-        session.commit()
-        session.refresh(movie)
-        return MovieRead(**_movie_to_dict(movie))
-
-
-def update_movie(movie_id: str, movie_data: MovieUpdate) -> MovieRead:
-    """영화 정보 수정"""
-    with session_scope() as session:
-        movie = session.get(Movie, movie_id)
-        if not movie:
-            raise HTTPException(status_code=404, detail="Movie not found")
+        if q:
+            if len(q) >= FTS_MIN_QUERY_LENGTH and await _has_fts_index(session):
+                query = query.where(
+                    text(
+                        "movie.id IN (SELECT movie_id FROM movie_fts_docid WHERE docid IN "
+                        "(SELECT rowid FROM movie_fts WHERE movie_fts MATCH :fts_query))"
+                    )
+                    .bindparams(fts_query=_fts_phrase(q))
+                )
+            else:
+                query = query.where(
+                    Movie.title.contains(q, autoescape=True) | Movie.distributor.contains(q, autoescape=True)
+                )
+        
+        if genre:
+            query = query.where(Movie.genre == genre)
+        if distributor:
+            query = query.where(Movie.distributor == distributor)
+        if theater_id:
+            query = query.where(Movie.theater_id == theater_id)
         
-        # theater_id 변경 시 존재 여부 확인
-        update_dict = movie_data.model_dump(exclude_unset=True)
-        if "theater_id" in update_dict:
-            theater = session.get(Theater, update_dict["theater_id"])
-            if not theater:
-                raise HTTPException(status_code=422, detail="Invalid theater_id")
+        min_price, max_price = price_range
+        if min_price is not None:
+            query = query.where(Movie.ticket_price >= min_price)
+        if max_price is not None:
+            query = query.where(Movie.ticket_price <= max_price)
         
-        # 부분 업데이트
-        for key, value in update_dict.items():
-            setattr(movie, key, value)
+        min_runtime, max_runtime = runtime_range
+        if min_runtime is not None:
+            query = query.where(Movie.runtime_minutes >= min_runtime)
+        if max_runtime is not None:
+            query = query.where(Movie.runtime_minutes <= max_runtime)
         
-        session.add(movie)
-        session.commit()
-        session.refresh(movie)
-        return MovieRead(**_movie_to_dict(movie))
+        # 동일 값 사이의 순서를 고정하기 위해 id를 보조 정렬 키로 사용
+        column = getattr(Movie, sort.lstrip("-"))
+        query = query.order_by(column.desc() if sort.startswith("-") else column, Movie.id).limit(limit)
+        
+        result = movies_from_rows((await session.exec(query)).all())
+    
+    await movie_list_cache.set(cache_key, result, token)
+    return list(result)
 
 
-def delete_movie(movie_id: str) -> None:
-    """영화 삭제"""
-    with session_scope() as session:
-        movie = session.get(Movie, movie_id)
-        if not movie:
+async def stream_movies(theater_id: Optional[str] = None) -> AsyncIterator[List[dict]]:
+    """전체 영화를 id 순서로 묶음 단위 스트리밍 (서버 측 커서, 메모리 사용량 일정)"""
+    query = select(*MOVIE_COLUMNS).order_by(Movie.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    if theater_id:
+        query = query.where(Movie.theater_id == theater_id)
+    
+    async with async_read_session_scope() as session:
+        result = await session.stream(query)
+        async for partition in result.partitions():
+            yield [dict(row._mapping) for row in partition]
+
+
+async def create_movie(movie_data: MovieCreate) -> MovieRead:
+    """영화 생성 (유효한 극장 ID 필요)
+
+    INSERT ... RETURNING으로 삽입한 행을 바로 받고 1회 커밋한다.
+    극장 존재 여부는 FK 제약으로 확인한다 (위반 시 422, 그 외 제약 위반도 422).
+    """
+    statement = (
+        insert(Movie)
+        .values(id=str(uuid4()), **movie_data.model_dump())
+        .returning(*MOVIE_COLUMNS)
+    )
+    async with async_session_scope() as session:
+        try:
+            row = (await session.exec(statement)).one()
+            await session.commit()
+        except IntegrityError as e:
+            raise HTTPException(status_code=422, detail=integrity_error_detail(e))
+        result = movies_from_rows([row])[0]
+    
+    theater_movies_view.upsert_movies([result])
+    await _invalidate_movies([result.id])
+    return result
+
+
+async def update_movie(movie_id: str, movie_data: MovieUpdate) -> MovieRead:
+    """영화 정보 수정
+
+    UPDATE ... RETURNING으로 수정 후 값을 바로 받고 1회 커밋한다 (사전 조회 없음).
+    """
+    update_dict = movie_data.model_dump(exclude_unset=True)
+    if not update_dict:
+        return await get_movie(movie_id)
+    
+    statement = (
+        update(Movie)
+        .where(Movie.id == movie_id)
+        .values(**update_dict)
+        .returning(*MOVIE_COLUMNS)
+    )
+    async with async_session_scope() as session:
+        try:
+            row = (await session.exec(statement)).first()
+            await session.commit()
+        except IntegrityError as e:
+            # 존재하지 않는 극장으로 변경(FK 위반) 또는 그 외 제약 위반
+            raise HTTPException(status_code=422, detail=integrity_error_detail(e))
+        if row is None:
             raise HTTPException(status_code=404, detail="Movie not found")
+        result = movies_from_rows([row])[0]
+    
+    theater_movies_view.upsert_movies([result])
+    await _invalidate_movies([movie_id])
+    return result
+
+
+async def delete_movie(movie_id: str) -> None:
+    """영화 삭제 (DELETE ... RETURNING, 삭제된 행이 없으면 404)"""
+    statement = delete(Movie).where(Movie.id == movie_id).returning(Movie.id)
+    async with async_session_scope() as session:
+        deleted = (await session.exec(statement)).scalar_one_or_none()
+        if deleted is None:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        await session.commit()
+    
+    theater_movies_view.remove_movies([movie_id])
+    await _invalidate_movies([movie_id])
+
+
+async def create_movies(movies_data: List[MovieCreate]) -> BatchResult:
+    """영화 일괄 생성 (극장 ID 일괄 검증 후 단일 트랜잭션 executemany 삽입)
+
+    검증 후 삽입 전에 극장이 삭제되어 제약 위반으로 실패하면 전체를 롤백하고
+    삽입하려던 항목을 422로 반환한다.
+    """
+    results: List[BatchItemResult] = []
+    rows: List[dict] = []
+    
+    async with async_session_scope() as session:
+        valid_theater_ids = await _existing_theater_ids(session, (m.theater_id for m in movies_data))
+        
+        for index, movie_data in enumerate(movies_data):
+            if movie_data.theater_id not in valid_theater_ids:
+                results.append(BatchItemResult(index=index, status=422, detail="Invalid theater_id"))
+                continue
+            
+            row = {"id": str(uuid4()), **movie_data.model_dump()}
+            rows.append(row)
+            results.append(BatchItemResult(index=index, id=row["id"], status=201))
+        
+        if rows:
+            try:
+                await session.exec(insert(Movie), params=rows)
+                await session.commit()
+            except IntegrityError as e:
+                # 단일 트랜잭션이므로 삽입하려던 항목 전체가 반영되지 않음
+                await session.rollback()
+                fail_batch_items(results, {row["id"] for row in rows}, integrity_error_detail(e))
+                rows = []
+    
+    if rows:
+        theater_movies_view.upsert_movies(_MOVIE_LIST_ADAPTER.validate_python(rows))
+        await _invalidate_movies(row["id"] for row in rows)
+    return BatchResult(results=results)
+
+
+def fail_batch_items(results: List[BatchItemResult], ids: set, detail: str, status: int = 422) -> None:
+    """롤백된 일괄 처리 항목 중 성공으로 기록된 결과를 실패(기본 422)로 변경"""
+    for item in results:
+        if item.status < 300 and item.id in ids:
+            item.status = status
+            item.detail = detail
+
+
+async def update_movies(movies_data: List[MovieBatchUpdate]) -> BatchResult:
+    """영화 일괄 수정 (대상/극장 ID 일괄 조회 후 단일 트랜잭션 PK 기반 일괄 UPDATE)
+
+    커밋 전에 수정된 행을 같은 트랜잭션에서 다시 읽어 극장별 영화 목록 뷰에 반영한다.
+    제약 위반으로 실패하면 전체를 롤백하고 수정하려던 항목을 422로 반환한다.
+    """
+    results: List[BatchItemResult] = []
+    rows: List[dict] = []
+    updated: List[MovieRead] = []
+    
+    async with async_session_scope() as session:
+        ids = {m.id for m in movies_data}
+        existing_ids = set((await session.exec(select(Movie.id).where(Movie.id.in_(ids)))).all())
         
-        session.delete(movie)
-        session.commit()
+        new_theater_ids = {m.theater_id for m in movies_data if m.theater_id is not None}
+        valid_theater_ids = await _existing_theater_ids(session, new_theater_ids) if new_theater_ids else set()
+        
+        for index, movie_data in enumerate(movies_data):
+            if movie_data.id not in existing_ids:
+                results.append(BatchItemResult(index=index, id=movie_data.id, status=404, detail="Movie not found"))
+                continue
+            
+            update_dict = movie_data.model_dump(exclude_unset=True, exclude={"id"})
+            if "theater_id" in update_dict and update_dict["theater_id"] not in valid_theater_ids:
+                results.append(BatchItemResult(index=index, id=movie_data.id, status=422, detail="Invalid theater_id"))
+                continue
+            
+            if update_dict:
+                rows.append({"id": movie_data.id, **update_dict})
+            results.append(BatchItemResult(index=index, id=movie_data.id, status=200))
+        
+        if rows:
+            try:
+                await session.exec(update(Movie), params=rows)
+                query = select(*MOVIE_COLUMNS).where(Movie.id.in_({row["id"] for row in rows}))
+                updated = movies_from_rows((await session.exec(query)).all())
+                await session.commit()
+            except IntegrityError as e:
+                # 단일 트랜잭션이므로 수정하려던 항목 전체가 반영되지 않음
+                await session.rollback()
+                fail_batch_items(results, {row["id"] for row in rows}, integrity_error_detail(e))
+                rows = []
+    
+    if rows:
+        theater_movies_view.upsert_movies(updated)
+        await _invalidate_movies(row["id"] for row in rows)
+    return BatchResult(results=results)
+
+
+async def delete_movies(movie_ids: List[str]) -> BatchResult:
+    """영화 일괄 삭제 (대상 일괄 조회 후 단일 DELETE)"""
+    results: List[BatchItemResult] = []
+    
+    async with async_session_scope() as session:
+        current = await session.exec(select(Movie.id).where(Movie.id.in_(set(movie_ids))))
+        existing_ids = set(current.all())
+        
+        for index, movie_id in enumerate(movie_ids):
+            if movie_id not in existing_ids:
+                results.append(BatchItemResult(index=index, id=movie_id, status=404, detail="Movie not found"))
+            else:
+                results.append(BatchItemResult(index=index, id=movie_id, status=204))
+        
+        if existing_ids:
+            await session.exec(delete(Movie).where(Movie.id.in_(existing_ids)))
+            await session.commit()
+    
+    if existing_ids:
+        theater_movies_view.remove_movies(existing_ids)
+        await _invalidate_movies(existing_ids)
+    return BatchResult(results=results)
+
 
+async def import_movies(chunks: AsyncIterator[bytes]) -> ImportReport:
+    """NDJSON/JSON 배열 스트림에서 영화 가져오기 (청크 단위 검증/삽입)"""
+    report = ImportReport(kind="movies")
+    try:
+        await import_records_async(report, chunks)
+    except ImportFormatError as e:
+        raise HTTPException(status_code=400, detail=f"{e} (이전 청크 {report.inserted}건은 반영됨)")
+    finally:
+        # 오류로 중단되어도 이미 커밋된 청크가 있으면 무효화
+        if report.inserted:
+            await bump_version("movie")
+            theater_movies_view.invalidate()
+            await movie_list_cache.clear()
+            await stats_cache.clear()
+    return report
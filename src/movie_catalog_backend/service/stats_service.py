@@ -0,0 +1,113 @@
+"""통계(집계) 서비스 계층
+
+각 통계는 단일 GROUP BY 쿼리로 계산하고 결과를 stats 캐시에 둔다.
+영화/극장 쓰기 함수가 커밋 후 버전을 올리고 stats 캐시를 비우므로 다음 조회 시 재계산된다.
+"""
+from typing import List
+
+from sqlalchemy import func
+from sqlmodel import select
+
+from movie_catalog_backend.db.session import async_read_session_scope
+from movie_catalog_backend.entity.models import Movie, Theater
+from movie_catalog_backend.scheme.stats import GenreStats, RuntimeBucket, TheaterMovieStats
+from movie_catalog_backend.service.cache import stats_cache
+
+
+async def get_theater_stats() -> List[TheaterMovieStats]:
+    """극장별 영화 수/평균 티켓 가격 (LEFT JOIN + GROUP BY 단일 쿼리)"""
+    cached = await stats_cache.get("theaters")
+    if cached is not None:
+        return list(cached)
+    
+    token = await stats_cache.token()
+    query = (
+        select(
+            Theater.id,
+            Theater.name,
+            func.count(Movie.id),
+            func.avg(Movie.ticket_price),
+        )
+        .join(Movie, Movie.theater_id == Theater.id, isouter=True)
+        .group_by(Theater.id, Theater.name)
+        .order_by(Theater.id)
+    )
+    
+    async with async_read_session_scope() as session:
+        rows = (await session.exec(query)).all()
+    
+    result = [
+        TheaterMovieStats(
+            theater_id=theater_id,
+            theater_name=name,
+            movie_count=count,
+            avg_ticket_price=avg_price
+        )
+        for theater_id, name, count, avg_price in rows
+    ]
+    await stats_cache.set("theaters", result, token)
+    return list(result)
+
+
+async def get_genre_stats() -> List[GenreStats]:
+    """장르별 영화 수/티켓 가격 평균·최소·최대/평균 상영 시간 (GROUP BY 단일 쿼리)"""
+    cached = await stats_cache.get("genres")
+    if cached is not None:
+        return list(cached)
+    
+    token = await stats_cache.token()
+    query = (
+        select(
+            Movie.genre,
+            func.count(Movie.id),
+            func.avg(Movie.ticket_price),
+            func.min(Movie.ticket_price),
+            func.max(Movie.ticket_price),
+            func.avg(Movie.runtime_minutes),
+        )
+        .group_by(Movie.genre)
+        .order_by(Movie.genre)
+    )
+    
+    async with async_read_session_scope() as session:
+        rows = (await session.exec(query)).all()
+    
+    result = [
+        GenreStats(
+            genre=genre,
+            movie_count=count,
+            avg_ticket_price=avg_price,
+            min_ticket_price=min_price,
+            max_ticket_price=max_price,
+            avg_runtime_minutes=avg_runtime
+        )
+        for genre, count, avg_price, min_price, max_price, avg_runtime in rows
+    ]
+    await stats_cache.set("genres", result, token)
+    return list(result)
+
+
+async def get_runtime_histogram(bucket_minutes: int) -> List[RuntimeBucket]:
+    """상영 시간 분포 (bucket_minutes 단위 구간별 영화 수, 빈 구간은 생략)"""
+    cache_key = ("runtime", bucket_minutes)
+    cached = await stats_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
+    
+    token = await stats_cache.token()
+    bucket = (Movie.runtime_minutes // bucket_minutes).label("bucket")
+    query = select(bucket, func.count(Movie.id)).group_by(bucket).order_by(bucket)
+    
+    async with async_read_session_scope() as session:
+        rows = (await session.exec(query)).all()
+    
+    result = [
+        RuntimeBucket(
+            min_minutes=index * bucket_minutes,
+            max_minutes=(index + 1) * bucket_minutes,
+            movie_count=count
+        )
+        for index, count in rows
+    ]
+    await stats_cache.set(cache_key, result, token)
+    return list(result)
@@ -0,0 +1,198 @@
+"""극장별 영화 목록 인메모리 뷰 (미리 인코딩된 JSON)
+
+`GET /theaters/{id}/movies` 응답을 요청마다 DB 조회와 직렬화로 만들지 않도록,
+극장 ID → 영화 목록 JSON 바이트를 프로세스 메모리에 유지한다.
+
+- 앱 시작 시(시드 이후) 전체 극장/영화를 한 번 읽어 영화별 JSON을 만들어 둔다.
+- 영화/극장 쓰기 함수가 커밋 후 변경된 행만 뷰에 반영한다 (증분 갱신).
+- 극장별 목록 바이트는 처음 요청될 때 이어 붙여 두고, 해당 극장이 바뀌면 버린다.
+
+뷰는 자신이 반영한 영화/극장 데이터 버전(versioning)을 함께 기록한다. 현재 버전과
+다르거나(다른 워커의 쓰기, 일괄 가져오기 등) 마지막 전체 구축 후 최대 유지 시간이
+지나면 뷰를 쓰지 않고 DB에서 조회하며, 백그라운드로 재구축한다.
+memory 캐시 저장소에서는 버전이 워커마다 따로 관리되어 다른 워커의 쓰기를 감지하지
+못하므로, 워커가 여러 개면 뷰를 사용하지 않는다 (`is_process_local_cache_safe`).
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, Optional
+
+from pydantic_core import to_json
+from sqlmodel import select
+
+from movie_catalog_backend.config import (
+    get_theater_movies_view_max_age,
+    get_theater_movies_view_rebuild_interval,
+    is_process_local_cache_safe,
+    is_theater_movies_view_enabled,
+)
+from movie_catalog_backend.db.session import async_read_session_scope
+from movie_catalog_backend.entity.models import Movie, Theater
+from movie_catalog_backend.scheme.movie import MovieRead
+from movie_catalog_backend.service.cache_backends import CacheBackendError
+from movie_catalog_backend.service.versioning import get_versions
+
+logger = logging.getLogger(__name__)
+
+# 뷰가 의존하는 테이블 (데이터 버전 비교 대상)
+VIEW_TABLES = ("movie", "theater")
+
+# 구축 시 DB 커서에서 한 번에 가져오는 행 수
+BUILD_BATCH_SIZE = 5000
+
+# 영화 JSON 필드 순서 (MovieRead 직렬화 결과와 같은 바이트가 되도록 스키마 순서 사용)
+_FIELDS = tuple(MovieRead.model_fields)
+_COLUMNS = tuple(getattr(Movie, field) for field in _FIELDS)
+
+
+class TheaterMoviesView:
+    """극장 ID → 영화 목록 JSON 바이트 인메모리 뷰"""
+
+    def __init__(self, enabled: bool = True, rebuild_interval: float = 5.0, max_age: float = 60.0):
+        self.enabled = enabled
+        self.rebuild_interval = rebuild_interval
+        self.max_age = max_age
+        self._movies: Dict[str, Dict[str, bytes]] = {}   # theater_id → {movie_id: 영화 JSON}
+        self._theater_of: Dict[str, str] = {}            # movie_id → theater_id
+        self._encoded: Dict[str, bytes] = {}             # theater_id → 목록 JSON (요청 시 생성)
+        self._versions: Optional[Dict[str, int]] = None  # 반영된 데이터 버전 (None이면 사용 불가)
+        self._last_build = 0.0                           # 마지막 전체 구축 시작 시각 (monotonic)
+        self._rebuild_task: Optional[asyncio.Task] = None
+
+    async def is_fresh(self) -> bool:
+        """뷰가 현재 데이터 버전을 반영하고 있고 최대 유지 시간이 지나지 않았는지 여부"""
+        if self._versions is None:
+            return False
+        if self.max_age and time.monotonic() - self._last_build > self.max_age:
+            return False
+        try:
+            return await get_versions(VIEW_TABLES) == self._versions
+        except CacheBackendError:
+            return False
+
+    def encoded(self, theater_id: str) -> Optional[bytes]:
+        """극장의 영화 목록 JSON 배열 (id 순서, 극장이 없으면 None)"""
+        movies = self._movies.get(theater_id)
+        if movies is None:
+            return None
+
+        encoded = self._encoded.get(theater_id)
+        if encoded is None:
+            encoded = b"[" + b",".join(movies[movie_id] for movie_id in sorted(movies)) + b"]"
+            self._encoded[theater_id] = encoded
+        return encoded
+
+    async def build(self) -> None:
+        """DB에서 전체 극장/영화를 읽어 뷰 재구축
+
+        버전을 먼저 읽고 나서 데이터를 읽으므로, 그 사이의 쓰기는 뷰를 오래된
+        상태로 표시할 뿐 누락되지 않는다 (다음 조회 시 다시 재구축).
+        """
+        if not self.enabled:
+            return
+
+        started = time.perf_counter()
+        self._last_build = time.monotonic()
+        try:
+            versions = await get_versions(VIEW_TABLES)
+        except CacheBackendError as e:
+            logger.warning(f"극장별 영화 목록 뷰 구축 생략 (데이터 버전 조회 실패): {e}")
+            return
+
+        movies: Dict[str, Dict[str, bytes]] = {}
+        theater_of: Dict[str, str] = {}
+        async with async_read_session_scope() as session:
+            for theater_id in (await session.exec(select(Theater.id))).all():
+                movies[theater_id] = {}
+
+            query = select(*_COLUMNS).execution_options(yield_per=BUILD_BATCH_SIZE)
+            result = await session.stream(query)
+            async for partition in result.partitions():
+                for row in partition:
+                    movie = dict(zip(_FIELDS, row))
+                    movies.setdefault(movie["theater_id"], {})[movie["id"]] = to_json(movie)
+                    theater_of[movie["id"]] = movie["theater_id"]
+
+        self._movies, self._theater_of, self._encoded = movies, theater_of, {}
+        self._versions = versions
+        logger.info(
+            f"극장별 영화 목록 뷰 구축 완료: 극장 {len(movies)}개, 영화 {len(theater_of)}개 "
+            f"({time.perf_counter() - started:.3f}s)"
+        )
+
+    def schedule_rebuild(self) -> None:
+        """백그라운드 재구축 예약 (이미 진행/대기 중이면 무시)"""
+        if not self.enabled or (self._rebuild_task is not None and not self._rebuild_task.done()):
+            return
+        self._rebuild_task = asyncio.get_running_loop().create_task(self._rebuild())
+
+    async def _rebuild(self) -> None:
+        # 직전 구축 후 최소 간격이 지나기 전이면 대기 (그동안 조회는 DB 사용)
+        delay = self._last_build + self.rebuild_interval - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            await self.build()
+        except Exception:
+            logger.exception("극장별 영화 목록 뷰 재구축 실패")
+
+    def invalidate(self) -> None:
+        """뷰 사용 중지 후 재구축 예약 (일괄 가져오기 등 변경 행을 알 수 없을 때)"""
+        self._versions = None
+        self.schedule_rebuild()
+
+    def advance(self, versions: Dict[str, Optional[int]]) -> None:
+        """로컬 쓰기를 반영한 뒤 새 데이터 버전 기록
+
+        버전이 정확히 1 증가한 경우만 뷰가 최신이다. 그 외(다른 워커의 쓰기가 끼어듦,
+        버전 저장소 장애)에는 뷰를 사용 중지하고 재구축한다.
+        """
+        if self._versions is None:
+            return
+
+        advanced = dict(self._versions)
+        for table, version in versions.items():
+            if version is None or version != advanced.get(table, 0) + 1:
+                self.invalidate()
+                return
+            advanced[table] = version
+        self._versions = advanced
+
+    def upsert_movies(self, movies: Iterable[MovieRead]) -> None:
+        """생성/수정된 영화 반영 (극장 이동 포함)"""
+        for movie in movies:
+            previous = self._theater_of.get(movie.id)
+            if previous is not None and previous != movie.theater_id:
+                self._movies.get(previous, {}).pop(movie.id, None)
+                self._encoded.pop(previous, None)
+
+            self._movies.setdefault(movie.theater_id, {})[movie.id] = to_json(movie)
+            self._theater_of[movie.id] = movie.theater_id
+            self._encoded.pop(movie.theater_id, None)
+
+    def remove_movies(self, movie_ids: Iterable[str]) -> None:
+        """삭제된 영화 반영"""
+        for movie_id in movie_ids:
+            theater_id = self._theater_of.pop(movie_id, None)
+            if theater_id is not None:
+                self._movies.get(theater_id, {}).pop(movie_id, None)
+                self._encoded.pop(theater_id, None)
+
+    def add_theaters(self, theater_ids: Iterable[str]) -> None:
+        """생성된 극장 반영 (빈 목록)"""
+        for theater_id in theater_ids:
+            self._movies.setdefault(theater_id, {})
+
+    def remove_theaters(self, theater_ids: Iterable[str]) -> None:
+        """삭제된 극장 반영 (연결된 영화가 없는 극장만 삭제 가능)"""
+        for theater_id in theater_ids:
+            self._movies.pop(theater_id, None)
+            self._encoded.pop(theater_id, None)
+
+
+theater_movies_view = TheaterMoviesView(
+    enabled=is_theater_movies_view_enabled() and is_process_local_cache_safe(),
+    rebuild_interval=get_theater_movies_view_rebuild_interval(),
+    max_age=get_theater_movies_view_max_age()
+)
@@ -1,13 +1,51 @@
 """Theater 서비스 계층"""
-from typing import List
+from collections import defaultdict
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Union
 from uuid import uuid4
 
 from fastapi import HTTPException
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from sqlalchemy import delete, insert, update
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 
-from movie_catalog_backend.db.session import session_scope
+from movie_catalog_backend.db.importer import ImportFormatError, import_records_async
+from movie_catalog_backend.db.session import async_read_session_scope, async_session_scope
 from movie_catalog_backend.entity.models import Movie, Theater
-from movie_catalog_backend.scheme.theater import TheaterCreate, TheaterRead, TheaterUpdate
+from movie_catalog_backend.scheme.batch import BatchItemResult, BatchResult
+from movie_catalog_backend.scheme.expand import TheaterWithMovies
+from movie_catalog_backend.scheme.importing import ImportReport
+from movie_catalog_backend.scheme.movie import MovieRead
+from movie_catalog_backend.scheme.theater import TheaterBatchUpdate, TheaterCreate, TheaterRead, TheaterUpdate
+from movie_catalog_backend.service.cache import (
+    stats_cache,
+    theater_cache,
+    theater_list_cache,
+)
+from movie_catalog_backend.service.movie_service import MOVIE_COLUMNS, fail_batch_items, movies_from_rows
+from movie_catalog_backend.service.theater_movies_view import theater_movies_view
+from movie_catalog_backend.service.versioning import bump_version
+
+# 내보내기 시 DB 커서에서 한 번에 가져오는 행 수
+EXPORT_BATCH_SIZE = 1000
+
+# 목록 조회/내보내기 대상 컬럼 (ORM 엔티티 대신 컬럼 튜플로 조회)
+THEATER_COLUMNS = (
+    Theater.id,
+    Theater.name,
+    Theater.brand,
+    Theater.location,
+    Theater.operating_hours,
+)
+THEATER_FIELDS = tuple(column.key for column in THEATER_COLUMNS)
+
+_THEATER_LIST_ADAPTER = TypeAdapter(List[TheaterRead])
+
+
+def theaters_from_rows(rows: Iterable[tuple]) -> List[TheaterRead]:
+    """THEATER_COLUMNS 순서의 행 목록을 TheaterRead 목록으로 변환 (pydantic-core에서 한 번에 검증)"""
+    return _THEATER_LIST_ADAPTER.validate_python([dict(zip(THEATER_FIELDS, row)) for row in rows])
 
 
 def _theater_to_dict(theater: Theater) -> dict:
@@ -21,92 +59,317 @@ def _theater_to_dict(theater: Theater) -> dict:
     }
 
 
-def get_all_theaters() -> List[TheaterRead]:
-    """전체 극장 목록 조회"""
-    with session_scope() as session:
-        theaters = session.exec(select(Theater)).all()
-        return [TheaterRead(**_theater_to_dict(t)) for t in theaters]
+async def _invalidate_theaters(theater_ids: Iterable[str]) -> None:
+    """극장 변경 후 관련 캐시 무효화 (해당 극장, 극장 목록, 통계) 및 버전 증가
 
+    극장별 영화 목록 뷰는 호출 전에 변경 행을 반영해 두고, 여기서 새 버전을 기록한다.
+    """
+    theater_movies_view.advance(await bump_version("theater"))
+    await theater_cache.delete(*theater_ids)
+    await theater_list_cache.clear()
+    await stats_cache.clear()
 
-def get_theater(theater_id: str) -> TheaterRead:
-    """특정 극장 조회"""
-    with session_scope() as session:
-        theater = session.get(Theater, theater_id)
-        if not theater:
-            raise HTTPException(status_code=404, detail="Theater not found")
-        return TheaterRead(**_theater_to_dict(theater))
 
+async def get_all_theaters(
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    expand_movies: bool = False
+) -> Union[List[TheaterRead], List[TheaterWithMovies]]:
+    """전체 극장 목록 조회 (id 기준 keyset 페이지네이션, 영화 목록 포함 지원)"""
+    theaters = await _get_theater_list(limit, after)
+    if not expand_movies:
+        return theaters
+    
+    # 페이지의 극장들에 속한 영화를 단일 쿼리로 조회 (극장마다 영화 조회하지 않음)
+    movies_by_theater = await _get_movies_by_theater(
+        [t.id for t in theaters],
+        whole_table=limit is None and after is None
+    )
+    return [
+        TheaterWithMovies.model_construct(**dict(t), movies=movies_by_theater.get(t.id, []))
+        for t in theaters
+    ]
 
-def create_theater(theater_data: TheaterCreate) -> TheaterRead:
-    """극장 생성"""
-    with session_scope() as session:
-        theater = Theater(
-            id=str(uuid4()),
-            **theater_data.model_dump()
-        )
-        session.add(theater)
-        session.commit()
-        session.refresh(theater)
-        return TheaterRead(**_theater_to_dict(theater))
 
+async def _get_movies_by_theater(theater_ids: List[str], whole_table: bool) -> Dict[str, List[MovieRead]]:
+    """극장 ID별 영화 목록 (whole_table이면 IN 조건 없이 전체 영화 조회)"""
+    query = select(*MOVIE_COLUMNS).order_by(Movie.theater_id, Movie.id)
+    if not whole_table:
+        if not theater_ids:
+            return {}
+        query = query.where(Movie.theater_id.in_(theater_ids))
+    
+    async with async_read_session_scope() as session:
+        movies = movies_from_rows((await session.exec(query)).all())
+    
+    movies_by_theater: Dict[str, List[MovieRead]] = defaultdict(list)
+    for movie in movies:
+        movies_by_theater[movie.theater_id].append(movie)
+    return movies_by_theater
 
-def update_theater(theater_id: str, theater_data: TheaterUpdate) -> TheaterRead:
-    """극장 정보 수정"""
-    with session_scope() as session:
-        theater = session.get(Theater, theater_id)
-        if not theater:
-            raise HTTPException(status_code=404, detail="Theater not found")
+
+async def _get_theater_list(limit: Optional[int], after: Optional[str]) -> List[TheaterRead]:
+    """극장 목록 조회 (limit이 있는 페이지만 목록 캐시 적용)
+
+    캐시는 항목 수로만 제한되므로, 크기 제한이 없는 전체 목록은 캐시하지 않는다.
+    """
+    cache_key = (limit, after)
+    cacheable = limit is not None
+    cached = await theater_list_cache.get(cache_key) if cacheable else None
+    if cached is not None:
+        return list(cached)
+    
+    token = await theater_list_cache.token() if cacheable else None
+    async with async_read_session_scope() as session:
+        query = select(*THEATER_COLUMNS)
         
-        # 부분 업데이트
-        update_dict = theater_data.model_dump(exclude_unset=True)
-        for key, value in update_dict.items():
-            setattr(theater, key, value)
+        # 페이지네이션: PK 순서로 커서 이후의 limit개만 조회 (OFFSET 미사용)
+        if limit is not None or after is not None:
+            if after is not None:
+                query = query.where(Theater.id > after)
+            query = query.order_by(Theater.id)
+            if limit is not None:
+                query = query.limit(limit)
         
-        session.add(theater)
-        session.commit()
-        session.refresh(theater)
-        return TheaterRead(**_theater_to_dict(theater))
+        result = theaters_from_rows((await session.exec(query)).all())
+    
+    if cacheable:
+        await theater_list_cache.set(cache_key, result, token)
+    return list(result)
 
 
-def delete_theater(theater_id: str) -> None:
-    """극장 삭제 (연결된 영화가 있으면 삭제 차단)"""
-    with session_scope() as session:
-        theater = session.get(Theater, theater_id)
+async def get_theater(theater_id: str) -> TheaterRead:
+    """특정 극장 조회"""
+    cached = await theater_cache.get(theater_id)
+    if cached is not None:
+        return cached
+    
+    token = await theater_cache.token()
+    async with async_read_session_scope() as session:
+        theater = await session.get(Theater, theater_id)
         if not theater:
             raise HTTPException(status_code=404, detail="Theater not found")
-        
-        # 연결된 영화가 있는지 확인
-        movies = session.exec(select(Movie).where(Movie.theater_id == theater_id)).first()
-        if movies:
+        result = TheaterRead(**_theater_to_dict(theater))
+    
+    await theater_cache.set(theater_id, result, token)
+    return result
+
+
+async def stream_theaters() -> AsyncIterator[List[dict]]:
+    """전체 극장을 id 순서로 묶음 단위 스트리밍 (서버 측 커서, 메모리 사용량 일정)"""
+    query = select(*THEATER_COLUMNS).order_by(Theater.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    
+    async with async_read_session_scope() as session:
+        result = await session.stream(query)
+        async for partition in result.partitions():
+            yield [dict(row._mapping) for row in partition]
+
+
+async def create_theater(theater_data: TheaterCreate) -> TheaterRead:
+    """극장 생성 (INSERT ... RETURNING, 1회 커밋)"""
+    statement = (
+        insert(Theater)
+        .values(id=str(uuid4()), **theater_data.model_dump())
+        .returning(*THEATER_COLUMNS)
+    )
+    async with async_session_scope() as session:
+        row = (await session.exec(statement)).one()
+        await session.commit()
+        result = theaters_from_rows([row])[0]
+    
+    theater_movies_view.add_theaters([result.id])
+    await _invalidate_theaters([result.id])
+    return result
+
+
+async def update_theater(theater_id: str, theater_data: TheaterUpdate) -> TheaterRead:
+    """극장 정보 수정 (UPDATE ... RETURNING, 사전 조회 없이 1회 커밋)"""
+    update_dict = theater_data.model_dump(exclude_unset=True)
+    if not update_dict:
+        return await get_theater(theater_id)
+    
+    statement = (
+        update(Theater)
+        .where(Theater.id == theater_id)
+        .values(**update_dict)
+        .returning(*THEATER_COLUMNS)
+    )
+    async with async_session_scope() as session:
+        try:
+            row = (await session.exec(statement)).first()
+            await session.commit()
+        except IntegrityError:
+            raise HTTPException(status_code=422, detail="Integrity constraint violated")
+        if row is None:
+            raise HTTPException(status_code=404, detail="Theater not found")
+        result = theaters_from_rows([row])[0]
+    
+    await _invalidate_theaters([theater_id])
+    return result
+
+
+async def delete_theater(theater_id: str) -> None:
+    """극장 삭제 (연결된 영화가 있으면 삭제 차단)
+
+    DELETE ... RETURNING 한 번으로 처리한다. 연결된 영화 여부는 FK 제약으로
+    확인하며(위반 시 409), 삭제된 행이 없으면 404.
+    """
+    statement = delete(Theater).where(Theater.id == theater_id).returning(Theater.id)
+    async with async_session_scope() as session:
+        try:
+            deleted = (await session.exec(statement)).first()
+            await session.commit()
+        except IntegrityError:
             raise HTTPException(
                 status_code=409,
                 detail="Cannot delete theater with associated movies"
             )
-        
-        session.delete(theater)
-        session.commit()
+        if deleted is None:
+            raise HTTPException(status_code=404, detail="Theater not found")
+    
+    theater_movies_view.remove_theaters([theater_id])
+    await _invalidate_theaters([theater_id])
 
 
-def get_theater_movies(theater_id: str) -> List[dict]:
-    """특정 극장의 영화 목록 조회"""
-    with session_scope() as session:
+async def get_theater_movies(theater_id: str) -> List[MovieRead]:
+    """특정 극장의 영화 목록 조회 (DB, id 순서)"""
+    async with async_read_session_scope() as session:
         # 극장 존재 여부 확인
-        theater = session.get(Theater, theater_id)
-        if not theater:
-            raise HTTPException(status_code=404, detail="Theater not found")
+        if await theater_cache.get(theater_id) is None:
+            theater = await session.get(Theater, theater_id)
+            if not theater:
+                raise HTTPException(status_code=404, detail="Theater not found")
         
         # 영화 목록 조회
-        movies = session.exec(select(Movie).where(Movie.theater_id == theater_id)).all()
-        return [
-            {
-                "id": m.id,
-                "title": m.title,
-                "distributor": m.distributor,
-                "ticket_price": m.ticket_price,
-                "runtime_minutes": m.runtime_minutes,
-                "genre": m.genre,
-                "theater_id": m.theater_id
-            }
-            for m in movies
-        ]
+        query = select(*MOVIE_COLUMNS).where(Movie.theater_id == theater_id).order_by(Movie.id)
+        return movies_from_rows((await session.exec(query)).all())
+
+
+async def get_theater_movies_json(theater_id: str) -> bytes:
+    """특정 극장의 영화 목록 JSON 바이트
+
+    극장별 영화 목록 뷰가 최신이면 미리 인코딩된 바이트를 그대로 반환하고,
+    그렇지 않으면 DB에서 조회해 인코딩한 뒤 뷰 재구축을 예약한다.
+    """
+    if await theater_movies_view.is_fresh():
+        encoded = theater_movies_view.encoded(theater_id)
+        if encoded is None:
+            raise HTTPException(status_code=404, detail="Theater not found")
+        return encoded
+    
+    theater_movies_view.schedule_rebuild()
+    return to_json(await get_theater_movies(theater_id))
+
+
+async def create_theaters(theaters_data: List[TheaterCreate]) -> BatchResult:
+    """극장 일괄 생성 (단일 트랜잭션 executemany 삽입)"""
+    rows = [{"id": str(uuid4()), **theater_data.model_dump()} for theater_data in theaters_data]
+    
+    async with async_session_scope() as session:
+        await session.exec(insert(Theater), params=rows)
+        await session.commit()
+    
+    theater_movies_view.add_theaters(row["id"] for row in rows)
+    await _invalidate_theaters(row["id"] for row in rows)
+    return BatchResult(results=[
+        BatchItemResult(index=index, id=row["id"], status=201)
+        for index, row in enumerate(rows)
+    ])
+
+
+async def update_theaters(theaters_data: List[TheaterBatchUpdate]) -> BatchResult:
+    """극장 일괄 수정 (대상 일괄 조회 후 단일 트랜잭션 PK 기반 일괄 UPDATE, 제약 위반 시 전체 롤백 후 422)"""
+    results: List[BatchItemResult] = []
+    rows: List[dict] = []
+    
+    async with async_session_scope() as session:
+        ids = {t.id for t in theaters_data}
+        existing_ids = set((await session.exec(select(Theater.id).where(Theater.id.in_(ids)))).all())
+        
+        for index, theater_data in enumerate(theaters_data):
+            if theater_data.id not in existing_ids:
+                results.append(BatchItemResult(index=index, id=theater_data.id, status=404, detail="Theater not found"))
+                continue
+            
+            update_dict = theater_data.model_dump(exclude_unset=True, exclude={"id"})
+            if update_dict:
+                rows.append({"id": theater_data.id, **update_dict})
+            results.append(BatchItemResult(index=index, id=theater_data.id, status=200))
+        
+        if rows:
+            try:
+                await session.exec(update(Theater), params=rows)
+                await session.commit()
+            except IntegrityError:
+                # 단일 트랜잭션이므로 수정하려던 항목 전체가 반영되지 않음
+                await session.rollback()
+                fail_batch_items(results, {row["id"] for row in rows}, "Integrity constraint violated")
+                rows = []
+    
+    if rows:
+        await _invalidate_theaters(row["id"] for row in rows)
+    return BatchResult(results=results)
+
+
+async def delete_theaters(theater_ids: List[str]) -> BatchResult:
+    """극장 일괄 삭제 (연결된 영화가 있는 극장은 409로 제외)
+
+    확인 후 삭제 전에 영화가 추가되어 FK 제약으로 실패하면 전체를 롤백하고
+    삭제하려던 항목을 409로 반환한다 (delete_theater와 동일).
+    """
+    results: List[BatchItemResult] = []
+    deletable: set = set()
+    
+    async with async_session_scope() as session:
+        ids = set(theater_ids)
+        existing_ids = set((await session.exec(select(Theater.id).where(Theater.id.in_(ids)))).all())
+        referenced = await session.exec(
+            select(Movie.theater_id).where(Movie.theater_id.in_(existing_ids)).distinct()
+        )
+        referenced_ids = set(referenced.all())
+        
+        for index, theater_id in enumerate(theater_ids):
+            if theater_id not in existing_ids:
+                results.append(BatchItemResult(index=index, id=theater_id, status=404, detail="Theater not found"))
+            elif theater_id in referenced_ids:
+                results.append(BatchItemResult(
+                    index=index,
+                    id=theater_id,
+                    status=409,
+                    detail="Cannot delete theater with associated movies"
+                ))
+            else:
+                deletable.add(theater_id)
+                results.append(BatchItemResult(index=index, id=theater_id, status=204))
+        
+        if deletable:
+            try:
+                await session.exec(delete(Theater).where(Theater.id.in_(deletable)))
+                await session.commit()
+            except IntegrityError:
+                # 단일 트랜잭션이므로 삭제하려던 항목 전체가 반영되지 않음
+                await session.rollback()
+                fail_batch_items(results, deletable, "Cannot delete theater with associated movies", status=409)
+                deletable = set()
+    
+    if deletable:
+        theater_movies_view.remove_theaters(deletable)
+        await _invalidate_theaters(deletable)
+    return BatchResult(results=results)
+
 
+async def import_theaters(chunks: AsyncIterator[bytes]) -> ImportReport:
+    """NDJSON/JSON 배열 스트림에서 극장 가져오기 (청크 단위 검증/삽입)"""
+    report = ImportReport(kind="theaters")
+    try:
+        await import_records_async(report, chunks)
+    except ImportFormatError as e:
+        raise HTTPException(status_code=400, detail=f"{e} (이전 청크 {report.inserted}건은 반영됨)")
+    finally:
+        # 오류로 중단되어도 이미 커밋된 청크가 있으면 무효화
+        if report.inserted:
+            await bump_version("theater")
+            theater_movies_view.invalidate()
+            await theater_list_cache.clear()
+            await stats_cache.clear()
+    return report
@@ -0,0 +1,81 @@
+"""테이블별 데이터 버전 카운터
+
+쓰기 함수가 커밋 후 해당 테이블의 버전을 올리고, 조회 응답의 ETag는 관련
+테이블 버전으로부터 만들어진다. 버전이 같으면 응답 내용도 같으므로 본문을
+다시 만들지 않고 304로 응답할 수 있다.
+
+버전은 캐시 저장소의 카운터에 보관되므로, 공유 저장소(file/redis)를 쓰면
+모든 워커가 같은 버전과 ETag를 본다.
+"""
+import hashlib
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+from movie_catalog_backend.service.cache import (
+    cache_backend,
+    call_backend,
+    clear_all_caches,
+    version_counter,
+    warn_backend_error,
+)
+from movie_catalog_backend.service.cache_backends import CacheBackendError
+
+logger = logging.getLogger(__name__)
+
+# 데이터 버전을 관리하는 테이블
+VERSIONED_TABLES = ("theater", "movie")
+
+
+async def bump_version(*tables: str) -> Dict[str, Optional[int]]:
+    """테이블 버전 증가 (쓰기 커밋 후 호출, 테이블별 새 버전 반환, 실패 시 None)"""
+    versions: Dict[str, Optional[int]] = {}
+    for table in tables:
+        try:
+            versions[table] = await call_backend(cache_backend, cache_backend.incr, version_counter(table))
+        except CacheBackendError as e:
+            logger.error(f"데이터 버전 증가 실패({table}): {e}")
+            versions[table] = None
+    return versions
+
+
+async def invalidate_all() -> None:
+    """서버 쓰기 함수를 거치지 않은 DB 변경(시드, CLI 가져오기/생성, DB 교체) 후 모든 테이블 버전 증가 및 캐시 전체 무효화
+
+    공유 저장소의 버전은 서버를 다시 시작해도 남으므로, 버전을 올리지 않으면 이전 내용의
+    ETag가 다른 내용에 다시 쓰이거나 이전 캐시 항목이 조회될 수 있다.
+    """
+    await bump_version(*VERSIONED_TABLES)
+    await clear_all_caches()
+
+
+async def get_version(table: str) -> int:
+    """현재 테이블 버전"""
+    return (await get_versions([table]))[table]
+
+
+async def get_versions(tables: Iterable[str]) -> Dict[str, int]:
+    """여러 테이블의 현재 버전 (저장소 조회 1회, 실패 시 CacheBackendError)"""
+    tables = list(tables)
+    counters = await call_backend(cache_backend, cache_backend.get_counters, [version_counter(table) for table in tables])
+    return dict(zip(tables, counters))
+
+
+def _etag_parts(counters: List[str]) -> Tuple[List[int], str]:
+    """ETag 구성 요소 (카운터 값, 저장소 인스턴스 ID)를 한 번의 저장소 호출로 조회"""
+    return cache_backend.get_counters(counters), cache_backend.instance_id()
+
+
+async def compute_etag(tables: Iterable[str], resource: str) -> str:
+    """관련 테이블 버전과 리소스 식별자(경로+쿼리)로 강한 ETag 생성
+
+    저장소 장애로 버전을 읽지 못하면 매번 다른 ETag를 만들어 304가 나가지 않게 한다.
+    """
+    digest = hashlib.blake2b(resource.encode("utf-8"), digest_size=8).hexdigest()
+    try:
+        counters, instance_id = await call_backend(cache_backend, _etag_parts, [version_counter(t) for t in tables])
+    except CacheBackendError as e:
+        warn_backend_error(e)
+        return f'"{uuid4().hex}-{digest}"'
+    versions = ".".join(str(version) for version in counters)
+    return f'"{instance_id}-{versions}-{digest}"'
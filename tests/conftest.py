@@ -0,0 +1,28 @@
+"""테스트 공통 설정
+
+패키지는 임포트 시점에 DATABASE_URL로 엔진을 만들기 때문에, 패키지를 임포트하기
+전에 임시 디렉터리의 SQLite 파일을 사용하도록 환경을 지정한다. 테스트 간에 조회 결과가
+남지 않도록 서비스 조회 캐시는 끈다.
+"""
+import os
+import tempfile
+
+_TEST_DIR = tempfile.mkdtemp(prefix="movie-catalog-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TEST_DIR, 'test.db')}"
+os.environ["CACHE_ENABLED"] = "false"
+
+import pytest  # noqa: E402
+from sqlalchemy import delete  # noqa: E402
+
+from movie_catalog_backend.db.session import init_db, session_scope  # noqa: E402
+from movie_catalog_backend.entity.models import Movie, Theater  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    """스키마가 적용된 빈 DB (테스트 후 모든 행 삭제)"""
+    init_db()
+    yield
+    with session_scope() as session:
+        session.exec(delete(Movie))
+        session.exec(delete(Theater))
@@ -0,0 +1,211 @@
+"""캐시 저장소 및 서비스 캐시 테스트"""
+import asyncio
+import time
+
+import pytest
+
+from movie_catalog_backend.config import get_cache_file_path
+from movie_catalog_backend.service.cache import Cache, version_counter
+from movie_catalog_backend.service.cache_backends import (
+    CacheBackend,
+    CacheBackendError,
+    FileBackend,
+    MemoryBackend,
+    SharedBackend,
+    TTLCache,
+)
+
+
+class TestTTLCache:
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(max_entries=2)
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        assert cache.get("a") == 1  # a가 최근 사용으로 이동
+        cache.set("c", 3, 60)
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert cache.evictions == 1
+        assert len(cache) == 2
+
+    def test_expired_entry_is_a_miss(self, monkeypatch):
+        cache = TTLCache(max_entries=10)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        cache.set("a", 1, 5)
+        monkeypatch.setattr(time, "monotonic", lambda: now + 5)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_delete_and_clear(self):
+        cache = TTLCache(max_entries=10)
+        for key in "abc":
+            cache.set(key, key, 60)
+        cache.delete(["a", "missing"])
+        assert cache.get("a") is None and cache.get("b") == "b"
+        cache.clear()
+        assert len(cache) == 0
+
+
+def test_backend_interfaces_are_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()
+    with pytest.raises(TypeError):
+        SharedBackend("prefix")
+
+
+@pytest.fixture(params=["memory", "file"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryBackend(max_entries=100)
+    return FileBackend(str(tmp_path / "cache.db"), "test")
+
+
+class TestBackends:
+    def test_namespaces_are_separate(self, backend):
+        backend.set("movie", "m1", {"title": "파묘"}, 60)
+        assert backend.get("movie", "m1") == {"title": "파묘"}
+        assert backend.get("theater", "m1") is None
+
+    def test_tuple_keys(self, backend):
+        backend.set("movie_list", (None, 100, "m1"), ["page"], 60)
+        assert backend.get("movie_list", (None, 100, "m1")) == ["page"]
+        assert backend.get("movie_list", (None, 100, None)) is None
+
+    def test_delete_only_given_keys(self, backend):
+        backend.set("movie", "m1", 1, 60)
+        backend.set("movie", "m2", 2, 60)
+        backend.delete("movie", ["m1"])
+        backend.delete("movie", [])
+        assert backend.get("movie", "m1") is None
+        assert backend.get("movie", "m2") == 2
+
+    def test_clear_only_given_namespace(self, backend):
+        backend.set("movie", "m1", 1, 60)
+        backend.set("theater", "t1", 1, 60)
+        backend.clear("movie")
+        assert backend.get("movie", "m1") is None
+        assert backend.get("theater", "t1") == 1
+
+        # 무효화 후 다시 저장한 값은 조회됨
+        backend.set("movie", "m1", 2, 60)
+        assert backend.get("movie", "m1") == 2
+
+    def test_counters(self, backend):
+        assert backend.get_counters(["a", "b"]) == [0, 0]
+        assert backend.incr("a") == 1
+        assert backend.incr("a") == 2
+        assert backend.get_counters(["a", "b"]) == [2, 0]
+        assert backend.instance_id() == backend.instance_id()
+
+
+class TestFileBackend:
+    def test_workers_share_entries_counters_and_instance_id(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        first, second = FileBackend(path, "test"), FileBackend(path, "test")
+
+        first.set("movie", "m1", "value", 60)
+        first.incr("version:movie")
+        assert second.get("movie", "m1") == "value"
+        assert second.get_counters(["version:movie"]) == [1]
+        assert first.instance_id() == second.instance_id()
+
+        second.clear("movie")
+        assert first.get("movie", "m1") is None
+
+    def test_prefix_separates_stores(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        FileBackend(path, "a").set("movie", "m1", 1, 60)
+        assert FileBackend(path, "b").get("movie", "m1") is None
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        backend = FileBackend(str(tmp_path / "cache.db"), "test")
+        backend.set("movie", "m1", 1, -1)
+        assert backend.get("movie", "m1") is None
+
+    def test_unusable_path_raises_backend_error(self, tmp_path):
+        (tmp_path / "dir").mkdir()
+        with pytest.raises(CacheBackendError):
+            FileBackend(str(tmp_path / "dir"), "test").get("movie", "m1")
+
+
+class TestCache:
+    def make_cache(self, backend) -> Cache:
+        return Cache("movie", backend, ttl_seconds=60, tables=("movie",))
+
+    def test_read_through(self, backend):
+        cache = self.make_cache(backend)
+
+        async def scenario():
+            assert await cache.get("m1") is None
+            token = await cache.token()
+            await cache.set("m1", "value", token)
+            assert await cache.get("m1") == "value"
+
+        asyncio.run(scenario())
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_write_during_read_is_not_cached(self, backend):
+        cache = self.make_cache(backend)
+
+        async def scenario():
+            token = await cache.token()  # DB 조회 시작 전
+            # 조회 중 쓰기 커밋: 버전 증가 후 무효화
+            backend.incr(version_counter("movie"))
+            await cache.delete("m1")
+            await cache.set("m1", "stale", token)
+            return await cache.get("m1")
+
+        assert asyncio.run(scenario()) is None
+
+    def test_write_between_set_and_check_removes_entry(self, backend, monkeypatch):
+        cache = self.make_cache(backend)
+        set_entry = backend.set
+
+        def set_then_write(*args):
+            # 저장 직후, 버전 재확인 전에 다른 워커가 쓰기를 커밋한 경우
+            set_entry(*args)
+            backend.incr(version_counter("movie"))
+
+        async def scenario():
+            token = await cache.token()
+            monkeypatch.setattr(backend, "set", set_then_write)
+            await cache.set("m1", "stale", token)
+            return await cache.get("m1")
+
+        assert asyncio.run(scenario()) is None
+
+    def test_disabled_cache_never_stores(self, backend):
+        cache = Cache("movie", backend, ttl_seconds=60, tables=("movie",), enabled=False)
+
+        async def scenario():
+            await cache.set("m1", "value", await cache.token())
+            return await cache.get("m1")
+
+        assert asyncio.run(scenario()) is None
+        assert backend.get("movie", "m1") is None
+
+    def test_backend_error_is_a_miss(self, tmp_path):
+        (tmp_path / "dir").mkdir()
+        cache = self.make_cache(FileBackend(str(tmp_path / "dir"), "test"))
+
+        async def scenario():
+            token = await cache.token()
+            await cache.set("m1", "value", token)
+            return token, await cache.get("m1")
+
+        assert asyncio.run(scenario()) == (None, None)
+
+
+def test_default_file_path_depends_on_database(monkeypatch):
+    monkeypatch.delenv("CACHE_FILE_PATH", raising=False)
+    monkeypatch.setenv("DATABASE_URL", "sqlite:///a.db")
+    first = get_cache_file_path()
+    assert get_cache_file_path() == first
+    monkeypatch.setenv("DATABASE_URL", "sqlite:///b.db")
+    assert get_cache_file_path() != first
+
+    monkeypatch.setenv("CACHE_FILE_PATH", "/tmp/explicit.db")
+    assert get_cache_file_path() == "/tmp/explicit.db"
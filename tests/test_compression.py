@@ -0,0 +1,119 @@
+"""응답 압축 미들웨어의 인코딩 협상 및 ETag 처리 테스트"""
+import asyncio
+import gzip
+from typing import List
+
+import pytest
+from starlette.datastructures import Headers
+
+from movie_catalog_backend.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+SUPPORTED = ["zstd", "br", "gzip"]
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip", "gzip"),
+    ("gzip, br", "br"),  # q 값이 같으면 서버 선호 순서
+    ("gzip;q=1.0, br;q=0.5", "gzip"),
+    ("GZIP; q=0.8, br;q=0.2", "gzip"),
+    ("br;q=0, gzip", "gzip"),
+    ("*", "zstd"),
+    ("*;q=0.5, zstd;q=0.1", "br"),
+    ("*, br;q=0, zstd;q=0", "gzip"),
+    ("*;q=0", None),
+    ("identity;q=0", None),
+    ("identity", None),
+    ("gzip;q=abc", None),
+    ("", None),
+])
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding, SUPPORTED) == expected
+
+
+def test_negotiate_encoding_only_picks_supported():
+    assert negotiate_encoding("br, zstd", ["gzip"]) is None
+    assert negotiate_encoding("br, *;q=0.1", ["gzip"]) == "gzip"
+
+
+def run(
+    status: int,
+    bodies: List[bytes],
+    accept_encoding: str = "gzip",
+    etag: str = '"v1"',
+    content_type: str = "application/json"
+):
+    """고정 응답을 내는 앱을 미들웨어로 감싸 실행하고 (시작 메시지 헤더, 본문 메시지 목록) 반환"""
+    async def app(scope, receive, send):
+        headers = [(b"content-type", content_type.encode()), (b"etag", etag.encode())]
+        if len(bodies) == 1:
+            headers.append((b"content-length", str(len(bodies[0])).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        for i, body in enumerate(bodies):
+            await send({"type": "http.response.body", "body": body, "more_body": i < len(bodies) - 1})
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    asyncio.run(CompressionMiddleware(app, minimum_size=100, levels={})(scope, None, send))
+    assert messages[0]["type"] == "http.response.start"
+    return Headers(raw=messages[0]["headers"]), messages[1:]
+
+
+def test_large_body_is_compressed_with_weak_etag():
+    body = b'{"title": "' + b"x" * 500 + b'"}'
+    headers, messages = run(200, [body])
+
+    assert headers["content-encoding"] == "gzip"
+    assert headers["etag"] == 'W/"v1"'
+    assert "Accept-Encoding" in headers["vary"]
+    assert int(headers["content-length"]) == len(messages[0]["body"])
+    assert gzip.decompress(messages[0]["body"]) == body
+
+
+def test_small_body_is_not_compressed_but_etag_is_weakened():
+    headers, messages = run(200, [b"{}"])
+
+    assert "content-encoding" not in headers
+    assert headers["etag"] == 'W/"v1"'
+    assert messages[0]["body"] == b"{}"
+
+
+def test_not_modified_gets_the_same_weak_etag():
+    headers, messages = run(304, [b""])
+
+    assert headers["etag"] == 'W/"v1"'
+    assert "Accept-Encoding" in headers["vary"]
+    assert "content-encoding" not in headers
+
+
+def test_without_negotiated_encoding_etag_stays_strong():
+    for status in (200, 304):
+        headers, _ = run(status, [b"x" * 500], accept_encoding="identity")
+        assert headers["etag"] == '"v1"'
+        assert "content-encoding" not in headers
+
+
+def test_weak_etag_is_not_weakened_twice():
+    headers, _ = run(304, [b""], etag='W/"v1"')
+    assert headers["etag"] == 'W/"v1"'
+
+
+def test_incompressible_type_passes_through():
+    headers, messages = run(200, [b"\x89PNG" * 200], content_type="image/png")
+
+    assert "content-encoding" not in headers
+    assert headers["etag"] == '"v1"'
+    assert messages[0]["body"] == b"\x89PNG" * 200
+
+
+def test_streaming_body_is_compressed_per_chunk():
+    chunks = [b'{"id": %d}\n' % i * 20 for i in range(5)]
+    headers, messages = run(200, chunks, content_type="application/x-ndjson")
+
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    assert messages[-1]["more_body"] is False
+    assert gzip.decompress(b"".join(m["body"] for m in messages)) == b"".join(chunks)
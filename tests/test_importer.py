@@ -0,0 +1,110 @@
+"""스트리밍 가져오기 파서 및 청크 단위 삽입 테스트"""
+import json
+
+import pytest
+from sqlalchemy import select
+
+from movie_catalog_backend.db import importer
+from movie_catalog_backend.db.importer import ImportFormatError, RecordParser, import_records
+from movie_catalog_backend.db.session import session_scope
+from movie_catalog_backend.entity.models import Theater
+from movie_catalog_backend.scheme.importing import ImportReport
+
+
+def parse(*pieces: bytes):
+    """조각들을 차례로 넣고 (순번, 값) 목록 반환"""
+    parser = RecordParser()
+    records = []
+    for piece in pieces:
+        records.extend(parser.feed(piece))
+    records.extend(parser.close())
+    return records
+
+
+def split_every(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def theater(theater_id: str, name: str = "극장") -> dict:
+    return {"id": theater_id, "name": name, "brand": "CGV", "location": "서울", "operating_hours": "09:00-24:00"}
+
+
+class TestRecordParser:
+    def test_ndjson_record_split_across_chunks(self):
+        records = parse(b'{"a": 1}\n{"a"', b': 2}\n{"a": 3}\n')
+        assert records == [(0, {"a": 1}), (1, {"a": 2}), (2, {"a": 3})]
+
+    def test_json_array_record_split_across_chunks(self):
+        data = json.dumps([{"a": i, "s": "x" * i} for i in range(5)]).encode()
+        records = parse(*split_every(data, 7))
+        assert records == [(i, {"a": i, "s": "x" * i}) for i in range(5)]
+
+    def test_array_scalar_at_chunk_end_waits_for_rest(self):
+        assert parse(b"[12", b"34]") == [(0, 1234)]
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 5])
+    def test_multibyte_utf8_split_across_chunks(self, size):
+        data = '{"title": "파묘"}\n{"title": "서울의 봄"}\n'.encode()
+        records = parse(*split_every(data, size))
+        assert records == [(0, {"title": "파묘"}), (1, {"title": "서울의 봄"})]
+
+    def test_utf8_bom_is_ignored(self):
+        assert parse(b"\xef\xbb", b'\xbf{"a": 1}\n') == [(0, {"a": 1})]
+
+    def test_trailing_ndjson_record_without_newline(self):
+        assert parse(b'{"a": 1}\n{"a": 2}') == [(0, {"a": 1}), (1, {"a": 2})]
+
+    def test_blank_lines_do_not_consume_index(self):
+        assert parse(b'\n{"a": 1}\n\n\r\n{"a": 2}\n') == [(0, {"a": 1}), (1, {"a": 2})]
+
+    def test_malformed_ndjson_line_is_rejected_alone(self):
+        records = parse(b'{"a": 1}\n{"a": \n{"a": 3}\n')
+        assert records[0] == (0, {"a": 1})
+        assert isinstance(records[1][1], ValueError)
+        assert records[1][0] == 1
+        assert records[2] == (2, {"a": 3})
+
+    @pytest.mark.parametrize("data", [b'[{"a": 1}', b'[{"a": 1} {"a": 2}]', b'[, {"a": 1}]', b'[{"a": 1}] x'])
+    def test_malformed_json_array_raises(self, data):
+        with pytest.raises(ImportFormatError):
+            parse(data)
+
+    def test_empty_input(self):
+        assert parse(b"", b"  \n") == []
+
+
+class TestImportRecords:
+    def import_theaters(self, records, chunk_size: int = 1000) -> ImportReport:
+        report = ImportReport(kind="theaters")
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records).encode()
+        import_records(report, split_every(data, 10), chunk_size)
+        return report
+
+    def test_rejects_invalid_and_duplicate_records(self, db):
+        report = self.import_theaters([theater("t1"), {"id": "t2"}, theater("t1")])
+
+        assert (report.total, report.inserted, report.rejected) == (3, 1, 2)
+        assert [reject.index for reject in report.rejects] == [1, 2]
+        assert report.rejects[1].reason == "중복된 id"
+
+    def test_failed_chunk_is_rejected_and_import_continues(self, db, monkeypatch):
+        self.import_theaters([theater("t1")])
+
+        # 검증 후 삽입 전에 다른 요청이 같은 id를 넣은 경우처럼, 기존 id 조회를 비워 삽입을 실패시킨다
+        lookups = importer._chunk_lookups
+
+        def stale_lookups(kind, chunk):
+            existing_query, theater_query = lookups(kind, chunk)
+            return existing_query.where(Theater.id != "t1"), theater_query
+
+        monkeypatch.setattr(importer, "_chunk_lookups", stale_lookups)
+        report = self.import_theaters([theater("t2"), theater("t1"), theater("t3"), theater("t4")], chunk_size=2)
+
+        assert (report.total, report.inserted, report.rejected) == (4, 2, 2)
+        assert [(reject.index, reject.reason) for reject in report.rejects] == [
+            (0, "DB 오류: IntegrityError"),
+            (1, "DB 오류: IntegrityError"),
+        ]
+        with session_scope() as session:
+            ids = set(session.exec(select(Theater.id)).scalars().all())
+        assert ids == {"t1", "t3", "t4"}
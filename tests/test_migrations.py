@@ -0,0 +1,129 @@
+"""스키마 마이그레이션 및 FTS 동기화 트리거 테스트"""
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlmodel import SQLModel
+
+from movie_catalog_backend.db import migrations
+from movie_catalog_backend.db.migrations import MIGRATIONS, _fts5_trigram_supported, get_current_version, run_migrations
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def fts_engine(engine):
+    with engine.connect() as conn:
+        if not _fts5_trigram_supported(conn):
+            pytest.skip("FTS5 trigram 미지원 SQLite")
+    return engine
+
+
+def add_movie(conn, movie_id: str, title: str, distributor: str = "쇼박스") -> None:
+    conn.execute(text(
+        "INSERT INTO movie (id, title, distributor, ticket_price, runtime_minutes, genre, theater_id) "
+        "VALUES (:id, :title, :distributor, 10000, 100, '드라마', 't1')"
+    ), {"id": movie_id, "title": title, "distributor": distributor})
+
+
+def search(conn, term: str) -> list:
+    """movie_service.search_movies와 같은 경로(docid → movie id)로 FTS 검색"""
+    return sorted(conn.execute(text(
+        "SELECT movie_id FROM movie_fts_docid WHERE docid IN "
+        "(SELECT rowid FROM movie_fts WHERE movie_fts MATCH :q)"
+    ), {"q": f'"{term}"'}).scalars().all())
+
+
+def test_versions_are_increasing():
+    versions = [version for version, _, _ in MIGRATIONS]
+    assert versions == sorted(set(versions))
+
+
+def test_fresh_db_applies_all_steps_once(engine):
+    assert run_migrations(engine) == LATEST_VERSION
+    with engine.connect() as conn:
+        assert get_current_version(conn) == LATEST_VERSION
+        applied = conn.execute(text("SELECT version FROM schema_version ORDER BY version")).scalars().all()
+    assert applied == [version for version, _, _ in MIGRATIONS]
+
+    indexes = {index["name"] for index in inspect(engine).get_indexes("movie")}
+    assert {"ix_movie_theater_id", "ix_movie_genre", "ix_movie_title"} <= indexes
+
+    # 이미 최신이면 아무 단계도 다시 실행하지 않음
+    assert run_migrations(engine) == LATEST_VERSION
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM schema_version")).scalar() == len(MIGRATIONS)
+
+
+def test_failed_step_is_not_recorded(engine, monkeypatch):
+    def broken(conn):
+        conn.execute(text("CREATE TABLE half_applied (id INTEGER)"))
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(migrations, "MIGRATIONS", [*MIGRATIONS, (LATEST_VERSION + 1, "broken", broken)])
+    with pytest.raises(RuntimeError):
+        run_migrations(engine)
+
+    with engine.connect() as conn:
+        assert get_current_version(conn) == LATEST_VERSION
+    assert "half_applied" not in inspect(engine).get_table_names()
+
+
+def test_fts_indexes_rows_that_existed_before_the_migration(fts_engine):
+    with fts_engine.begin() as conn:
+        add_movie(conn, "m1", "서울의 봄")
+        add_movie(conn, "m2", "파묘", distributor="서울의 배급사")
+    run_migrations(fts_engine)
+
+    with fts_engine.connect() as conn:
+        assert search(conn, "의 봄") == ["m1"]
+        assert search(conn, "서울의") == ["m1", "m2"]
+
+
+def test_fts_triggers_follow_insert_update_and_delete(fts_engine):
+    run_migrations(fts_engine)
+
+    with fts_engine.begin() as conn:
+        add_movie(conn, "m1", "오펜하이머")
+        add_movie(conn, "m2", "듄: 파트2")
+    with fts_engine.connect() as conn:
+        assert search(conn, "오펜하") == ["m1"]
+
+    with fts_engine.begin() as conn:
+        conn.execute(text("UPDATE movie SET title = '인터스텔라' WHERE id = 'm1'"))
+    with fts_engine.connect() as conn:
+        assert search(conn, "오펜하") == []
+        assert search(conn, "인터스") == ["m1"]
+
+    with fts_engine.begin() as conn:
+        conn.execute(text("UPDATE movie SET id = 'm9' WHERE id = 'm1'"))
+    with fts_engine.connect() as conn:
+        assert search(conn, "인터스") == ["m9"]
+
+    with fts_engine.begin() as conn:
+        conn.execute(text("DELETE FROM movie WHERE id = 'm9'"))
+    with fts_engine.connect() as conn:
+        assert search(conn, "인터스") == []
+        assert search(conn, "파트2") == ["m2"]
+        assert conn.execute(text("SELECT COUNT(*) FROM movie_fts_docid")).scalar() == 1
+
+
+def test_fts_survives_vacuum_renumbering_rowids(fts_engine):
+    run_migrations(fts_engine)
+    with fts_engine.begin() as conn:
+        for i in range(20):
+            add_movie(conn, f"m{i:02d}", f"영화 제목 {i:02d}")
+        conn.execute(text("DELETE FROM movie WHERE id < 'm10'"))
+
+    with fts_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM"))
+
+    with fts_engine.connect() as conn:
+        assert search(conn, "제목 15") == ["m15"]
+        assert search(conn, "영화 제목") == [f"m{i}" for i in range(10, 20)]
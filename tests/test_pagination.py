@@ -0,0 +1,87 @@
+"""keyset(cursor) 페이지네이션 테스트"""
+import asyncio
+
+from fastapi import Response
+from starlette.requests import Request
+
+from movie_catalog_backend.db.session import session_scope
+from movie_catalog_backend.entity.models import Movie, Theater
+from movie_catalog_backend.route.pagination import set_next_page_headers
+from movie_catalog_backend.service.movie_service import get_all_movies
+from movie_catalog_backend.service.theater_service import get_all_theaters
+
+
+def make_request(query: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "path": "/movies",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"testserver")],
+    })
+
+
+def add_catalog():
+    """극장 t0~t4, 극장 t0/t1에 번갈아 배정한 영화 m0~m6 추가 (id 순서와 삽입 순서를 다르게)"""
+    with session_scope() as session:
+        for i in (3, 0, 4, 1, 2):
+            session.add(Theater(id=f"t{i}", name=f"극장{i}", brand="CGV", location="서울", operating_hours="09-24"))
+        session.flush()
+        for i in (6, 2, 0, 5, 1, 3, 4):
+            session.add(Movie(
+                id=f"m{i}", title=f"영화{i}", distributor="배급사", ticket_price=10000,
+                runtime_minutes=100, genre="드라마", theater_id=f"t{i % 2}"
+            ))
+
+
+def collect_pages(fetch, limit: int):
+    """커서를 따라 모든 페이지를 조회하고 페이지별 id 목록 반환"""
+    pages, after = [], None
+    while True:
+        page = asyncio.run(fetch(limit=limit, after=after))
+        pages.append([item.id for item in page])
+        if len(page) < limit:
+            return pages
+        after = page[-1].id
+
+
+def test_theater_pages_follow_the_cursor_in_id_order(db):
+    add_catalog()
+    assert collect_pages(get_all_theaters, limit=2) == [["t0", "t1"], ["t2", "t3"], ["t4"]]
+
+
+def test_movie_pages_apply_the_filter_before_the_cursor(db):
+    add_catalog()
+
+    async def fetch(limit, after):
+        return await get_all_movies("t1", limit=limit, after=after)
+
+    assert collect_pages(fetch, limit=2) == [["m1", "m3"], ["m5"]]
+
+
+def test_cursor_past_the_last_item_returns_an_empty_page(db):
+    add_catalog()
+    assert asyncio.run(get_all_movies(limit=10, after="m6")) == []
+
+
+def test_next_page_headers_keep_other_query_parameters():
+    request = make_request("theater_id=t1&limit=2&after=m1")
+    response = Response()
+    items = [Movie(id="m3"), Movie(id="m5")]
+
+    set_next_page_headers(request, response, items, 2)
+
+    assert response.headers["X-Next-Cursor"] == "m5"
+    link = response.headers["Link"]
+    assert link.startswith("<http://testserver/movies?") and link.endswith('>; rel="next"')
+    assert "theater_id=t1" in link and "after=m5" in link and "limit=2" in link
+    assert "after=m1" not in link
+
+
+def test_no_next_page_headers_for_a_short_page():
+    response = Response()
+    set_next_page_headers(make_request("limit=2"), response, [Movie(id="m1")], 2)
+    assert "Link" not in response.headers
+    assert "X-Next-Cursor" not in response.headers
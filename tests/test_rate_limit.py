@@ -0,0 +1,145 @@
+"""토큰 버킷 속도 제한 테스트"""
+import asyncio
+import time
+
+import pytest
+from fastapi import APIRouter
+
+from movie_catalog_backend.config import get_rate_limit_routes
+from movie_catalog_backend.middleware.rate_limit import MemoryRateLimitStore, RateLimitMiddleware, RateLimitStore
+
+
+class Clock:
+    """time.monotonic 대체 (테스트에서 시간을 직접 진행)"""
+
+    def __init__(self, monkeypatch):
+        self.now = 1000.0
+        monkeypatch.setattr(time, "monotonic", lambda: self.now)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    return Clock(monkeypatch)
+
+
+def test_store_interface_is_abstract():
+    with pytest.raises(TypeError):
+        RateLimitStore()
+
+
+class TestMemoryStore:
+    def test_burst_then_reject_with_wait(self, clock):
+        store = MemoryRateLimitStore()
+        assert [store.take("k", 2.0, 3.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert store.take("k", 2.0, 3.0) == pytest.approx(0.5)
+
+    def test_refill_up_to_burst(self, clock):
+        store = MemoryRateLimitStore()
+        for _ in range(3):
+            store.take("k", 2.0, 3.0)
+
+        clock.now += 0.5
+        assert store.take("k", 2.0, 3.0) == 0.0
+        assert store.take("k", 2.0, 3.0) > 0
+
+        # 오래 쉬어도 burst 이상은 쌓이지 않음
+        clock.now += 100
+        assert [store.take("k", 2.0, 3.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert store.take("k", 2.0, 3.0) > 0
+
+    def test_rejected_request_does_not_use_token(self, clock):
+        store = MemoryRateLimitStore()
+        store.take("k", 1.0, 1.0)
+        for _ in range(5):
+            assert store.take("k", 1.0, 1.0) == pytest.approx(1.0)
+        clock.now += 1
+        assert store.take("k", 1.0, 1.0) == 0.0
+
+    def test_keys_are_independent(self, clock):
+        store = MemoryRateLimitStore()
+        store.take("a", 1.0, 1.0)
+        assert store.take("a", 1.0, 1.0) > 0
+        assert store.take("b", 1.0, 1.0) == 0.0
+
+    def test_least_recently_used_bucket_is_dropped(self, clock):
+        store = MemoryRateLimitStore(max_buckets=2)
+        for key in ("a", "b", "a", "c"):
+            store.take(key, 1.0, 1.0)
+
+        # b가 제거되어 가득 찬 새 버킷으로 시작, a는 유지
+        assert store.take("b", 1.0, 1.0) == 0.0
+        assert store.take("c", 1.0, 1.0) > 0
+
+
+def test_route_limits_parsing(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_ROUTES", "get /movies=5/10, GET /movies/{movie_id}=1/1,bad,GET /x=0/1,GET /y=1/0.5,=1/1")
+    assert get_rate_limit_routes() == {"GET /movies": (5.0, 10.0), "GET /movies/{movie_id}": (1.0, 1.0)}
+
+
+def test_default_route_limits_cover_export_only(monkeypatch):
+    monkeypatch.delenv("RATE_LIMIT_ROUTES", raising=False)
+    assert set(get_rate_limit_routes()) == {"GET /movies/export", "GET /theaters/export"}
+
+
+def make_middleware(route_limits, default_limit=(1.0, 2.0), **kwargs) -> RateLimitMiddleware:
+    router = APIRouter()
+
+    @router.get("/movies/export")
+    async def export_movies():
+        ...
+
+    @router.get("/movies/{movie_id}")
+    async def get_movie(movie_id: str):
+        ...
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    return RateLimitMiddleware(
+        app, router.routes, MemoryRateLimitStore(), default_limit=default_limit, route_limits=route_limits, **kwargs
+    )
+
+
+def call(middleware: RateLimitMiddleware, path: str, client: str = "1.1.1.1", headers=()):
+    """요청 1개 실행 후 (상태 코드, 응답 헤더) 반환"""
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": path, "headers": list(headers), "client": (client, 1234)}
+    asyncio.run(middleware(scope, None, send))
+    return messages[0]["status"], dict(messages[0]["headers"])
+
+
+class TestMiddleware:
+    def test_bucket_per_route_template(self, clock):
+        middleware = make_middleware({})
+        # 경로 파라미터가 달라도 같은 라우트 템플릿의 버킷을 공유
+        assert [call(middleware, f"/movies/m{i}")[0] for i in range(3)] == [200, 200, 429]
+        assert call(middleware, "/movies/export")[0] == 200
+
+    def test_route_override_and_retry_after(self, clock):
+        middleware = make_middleware({"GET /movies/export": (0.1, 1.0)})
+        assert call(middleware, "/movies/export")[0] == 200
+        status, headers = call(middleware, "/movies/export")
+        assert status == 429
+        assert headers[b"retry-after"] == b"10"
+
+    def test_bucket_per_client(self, clock):
+        middleware = make_middleware({}, default_limit=(1.0, 1.0))
+        assert call(middleware, "/movies/m1", client="1.1.1.1")[0] == 200
+        assert call(middleware, "/movies/m1", client="1.1.1.1")[0] == 429
+        assert call(middleware, "/movies/m1", client="2.2.2.2")[0] == 200
+
+    def test_forwarded_for_only_when_trusted(self, clock):
+        forwarded = [(b"x-forwarded-for", b"3.3.3.3, 10.0.0.1")]
+        for trusted, expected in ((False, 429), (True, 200)):
+            middleware = make_middleware({}, default_limit=(1.0, 1.0), trust_forwarded_for=trusted)
+            call(middleware, "/movies/m1", client="10.0.0.1")
+            assert call(middleware, "/movies/m1", client="10.0.0.1", headers=forwarded)[0] == expected
+
+    def test_excluded_path_is_not_limited(self, clock):
+        middleware = make_middleware({}, default_limit=(1.0, 1.0))
+        assert [call(middleware, "/metrics")[0] for _ in range(3)] == [200, 200, 200]
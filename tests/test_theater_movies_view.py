@@ -0,0 +1,143 @@
+"""극장별 영화 목록 인메모리 뷰 테스트"""
+import asyncio
+import json
+import time
+
+from pydantic_core import to_json
+
+from movie_catalog_backend.db.session import session_scope
+from movie_catalog_backend.entity.models import Movie, Theater
+from movie_catalog_backend.scheme.movie import MovieRead
+from movie_catalog_backend.service.theater_movies_view import TheaterMoviesView
+from movie_catalog_backend.service.theater_service import get_theater_movies
+from movie_catalog_backend.service.versioning import bump_version
+
+
+def add_catalog():
+    """극장 t0~t2 (t2는 영화 없음), 극장 t0/t1에 번갈아 배정한 영화 m0~m4 추가"""
+    with session_scope() as session:
+        for i in range(3):
+            session.add(Theater(id=f"t{i}", name=f"극장{i}", brand="CGV", location="서울", operating_hours="09-24"))
+        session.flush()
+        for i in (3, 0, 4, 1, 2):
+            session.add(Movie(**movie(f"m{i}", f"t{i % 2}").model_dump()))
+
+
+def movie(movie_id: str, theater_id: str, title: str = "영화") -> MovieRead:
+    return MovieRead(
+        id=movie_id, title=title, distributor="배급사", ticket_price=10000,
+        runtime_minutes=100, genre="드라마", theater_id=theater_id
+    )
+
+
+def make_view(**kwargs) -> TheaterMoviesView:
+    # 테스트 중 백그라운드 재구축이 실행되지 않도록 재구축 간격을 길게 둠
+    return TheaterMoviesView(rebuild_interval=3600, **kwargs)
+
+
+def ids(encoded: bytes):
+    return [item["id"] for item in json.loads(encoded)]
+
+
+def test_build_matches_db_response(db):
+    add_catalog()
+    view = make_view()
+
+    async def scenario():
+        await view.build()
+        for theater_id in ("t0", "t1", "t2"):
+            assert view.encoded(theater_id) == to_json(await get_theater_movies(theater_id))
+        return await view.is_fresh()
+
+    assert asyncio.run(scenario())
+    assert view.encoded("t2") == b"[]"
+    assert view.encoded("missing") is None
+
+
+def test_disabled_view_is_never_fresh(db):
+    view = make_view(enabled=False)
+
+    async def scenario():
+        await view.build()
+        return await view.is_fresh()
+
+    assert not asyncio.run(scenario())
+
+
+def test_advance_after_own_write_keeps_view_fresh(db):
+    view = make_view()
+
+    async def scenario():
+        await view.build()
+        view.advance(await bump_version("movie"))
+        fresh_after_own_write = await view.is_fresh()
+        view.advance(await bump_version("movie", "theater"))
+        return fresh_after_own_write, await view.is_fresh()
+
+    assert asyncio.run(scenario()) == (True, True)
+
+
+def test_advance_detects_interleaved_write(db):
+    view = make_view()
+
+    async def scenario():
+        await view.build()
+        await bump_version("movie")  # 다른 워커의 쓰기 (뷰에 반영되지 않음)
+        stale = await view.is_fresh()
+        view.advance(await bump_version("movie"))
+        return stale, await view.is_fresh()
+
+    assert asyncio.run(scenario()) == (False, False)
+
+
+def test_advance_with_failed_bump_disables_view(db):
+    view = make_view()
+
+    async def scenario():
+        await view.build()
+        view.advance({"movie": None})
+        return await view.is_fresh()
+
+    assert not asyncio.run(scenario())
+
+
+def test_advance_before_build_is_ignored(db):
+    view = make_view()
+
+    async def scenario():
+        view.advance(await bump_version("movie"))
+        return await view.is_fresh()
+
+    assert not asyncio.run(scenario())
+
+
+def test_max_age(db, monkeypatch):
+    view = make_view(max_age=60)
+    asyncio.run(view.build())
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+
+    assert not asyncio.run(view.is_fresh())
+
+
+def test_incremental_updates(db):
+    add_catalog()
+    view = make_view()
+    asyncio.run(view.build())
+    assert ids(view.encoded("t0")) == ["m0", "m2", "m4"]
+
+    # 극장 이동: 이전 극장 목록에서 빠지고 새 극장 목록에 id 순서로 들어감
+    view.upsert_movies([movie("m2", "t1", title="이동")])
+    assert ids(view.encoded("t0")) == ["m0", "m4"]
+    assert ids(view.encoded("t1")) == ["m1", "m2", "m3"]
+    assert "이동".encode() in view.encoded("t1")
+
+    view.upsert_movies([movie("m5", "t2")])
+    view.remove_movies(["m0", "missing"])
+    assert ids(view.encoded("t0")) == ["m4"]
+    assert ids(view.encoded("t2")) == ["m5"]
+
+    view.add_theaters(["t3"])
+    view.remove_theaters(["t0"])
+    assert view.encoded("t3") == b"[]"
+    assert view.encoded("t0") is None